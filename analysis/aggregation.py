@@ -0,0 +1,72 @@
+# analysis/aggregation.py
+"""
+학점 구분 규칙 + 한 번 순회 집계
+
+- 구분은 CreditRule(이름, 판정 함수) 목록(데이터)으로 선언한다. 새 구분을 추가해도 과목 순회는 늘지 않는다.
+- 판정은 과목의 (type, major_field) 조합마다 한 번만 수행하고 결과(해당 구분 목록)를 기억해 둔다.
+  → 과목마다 type.lower() / 문자열 검사를 반복하지 않고, 과목 하나를 해당 구분 전부에 한 번에 더한다.
+"""
+from functools import lru_cache
+from typing import Callable, Iterable, NamedTuple
+
+MEMO_LIMIT = 4096  # 기억해 둘 (type, major_field) 조합 수 상한
+
+
+class CreditRule(NamedTuple):
+    """학점 구분 하나: test(type, major_field) 가 참이면 name 구분에 포함"""
+    name: str
+    test: Callable[[str, str], bool]
+
+
+class CreditRuleSet:
+    """구분 규칙 묶음. categories() 는 조합별로 기억, totals() 는 과목 목록을 한 번 순회"""
+
+    def __init__(self, rules: Iterable[CreditRule]):
+        self.rules = tuple(rules)
+        self.names = tuple(r.name for r in self.rules)
+        self._memo: dict[tuple[str, str], tuple[str, ...]] = {}
+
+    def categories(self, ctype: str, major_field: str) -> tuple[str, ...]:
+        """(type, major_field) 가 속하는 구분 이름들"""
+        key = (ctype, major_field)
+        names = self._memo.get(key)
+        if names is None:
+            if len(self._memo) >= MEMO_LIMIT:
+                self._memo.clear()
+            names = self._memo[key] = tuple(r.name for r in self.rules if r.test(ctype, major_field))
+        return names
+
+    def totals(self, courses: Iterable[dict], credit: Callable[[dict], int] = lambda c: c.get("credit", 0)) -> dict:
+        """과목 목록 → {구분: 학점 합}"""
+        totals = dict.fromkeys(self.names, 0)
+        for c in courses:
+            if not c:
+                continue
+            value = credit(c)
+            for name in self.categories(c.get("type") or "", c.get("major_field") or ""):
+                totals[name] += value
+        return totals
+
+
+# 졸업요건 판정용 학점 구분 (analyze_graduation / 일괄 감사 / 스냅샷 공용)
+GRADUATION_RULES = CreditRuleSet([
+    CreditRule("total",           lambda t, f: True),
+    CreditRule("major",           lambda t, f: "전공" in t),
+    CreditRule("general",         lambda t, f: "교양" in t),
+    CreditRule("drbol",           lambda t, f: "드볼" in t),
+    CreditRule("sw",              lambda t, f: "sw" in t.lower() or "데이터활용" in t),
+    CreditRule("msc",             lambda t, f: "msc" in t.lower()),
+    CreditRule("special_general", lambda t, f: "특성화교양" in f),
+])
+
+GENERAL_TYPES = {"교양", "드볼", "특성화교양"}
+GENERAL_FIELDS = {"교양필수", "교양선택", "특성화교양"}
+
+
+@lru_cache(maxsize=64)
+def general_credit_rules(drbol_areas: tuple[str, ...] = ()) -> CreditRuleSet:
+    """교양 학점(GeneralCreditView): 타입(교양/드볼/특성화교양) 또는 영역(교양필수/교양선택/드볼 영역명) 기준"""
+    fields = GENERAL_FIELDS | set(drbol_areas)
+    return CreditRuleSet([
+        CreditRule("general_credit", lambda t, f: t.strip() in GENERAL_TYPES or f.strip() in fields),
+    ])
@@ -0,0 +1,180 @@
+# analysis/bulk.py
+"""
+전공 단위 일괄 졸업요건 감사 (지도교수 리포트 / 학기말 점검용)
+
+- 학생 수와 무관하게 몇 번의 쿼리로 적재:
+  전공 학생 + 최신 성적표 id(서브쿼리) 1회 / 졸업요건 1회 / 성적표 상태 1회 / 과목 (CHUNK 개 성적표당 적재분 합계 2회 + JSON 1회)
+- 적재된 성적표는 DB 에서 (성적표, type, major_field) / (성적표, 과목) 단위로 합산해 읽고 (credit_totals),
+  과목은 열(column) 배열로 모아 NumPy bincount 로 학생별 학점을 한 번에 합산한다.
+  구분 문자열 판정은 고유값마다 한 번만 수행.
+- 전공필수 이수 여부는 학생별 고유 과목을 요건 인덱스의 매처에 넣어 판정 (개별 분석과 같은 기준).
+- 판정/메시지는 개별 분석과 같은 graduation.graduation_result 를 사용 → analyze_graduation 과 같은 결과.
+"""
+import numpy as np
+
+from transcripts.models import Transcript, TranscriptCourse
+from users.models import User
+from .aggregation import GRADUATION_RULES
+from .context import latest_transcript_value
+from .graduation import graduation_result
+from .models import GraduationRequirement
+from .normalize import course_from_identity, course_identity, course_identity_from_dict
+from .requirement_index import get_requirement_index
+from .utils import get_courses_from_parsed_data
+
+CHUNK = 900  # IN (...) 파라미터 수 상한 (SQLite 호환)
+
+
+class _Columns:
+    """유효 과목(F·재수강 제외)을 (학생, type, major_field) 묶음 단위 열로 모은 것 + 학생별 과목 식별 문자열"""
+
+    def __init__(self):
+        self.owner: list[int] = []     # 학생 행 번호
+        self.credit: list[int] = []    # 묶음의 학점 합
+        self.count: list[int] = []     # 묶음의 과목 수
+        self.type: list[str] = []
+        self.major_field: list[str] = []
+        self.keys: list[tuple[int, str]] = []  # (학생 행 번호, 과목 식별 문자열 — normalize.course_identity)
+
+    def add(self, owner: int, credit, ctype: str, major_field: str, count: int = 1) -> None:
+        self.owner.append(owner)
+        self.credit.append(credit)
+        self.count.append(count)
+        self.type.append(ctype)
+        self.major_field.append(major_field)
+
+    def add_key(self, owner: int, key: str) -> None:
+        self.keys.append((owner, key))
+
+
+def _factorize(values: list) -> tuple[list, np.ndarray]:
+    """값 열 → (고유값 목록, 행별 고유값 번호)"""
+    codes: dict = {}
+    idx = np.fromiter((codes.setdefault(v, len(codes)) for v in values), dtype=np.int64, count=len(values))
+    return list(codes), idx
+
+
+def load_students(major: str) -> list[dict]:
+    """전공 학생 + 최신 성적표 id (한 번의 쿼리, 최신 성적표 규칙은 AnalysisContext 와 같음)"""
+    return list(
+        User.objects.filter(major=major)
+        .annotate(transcript_id=latest_transcript_value("id"))
+        .order_by("id")
+        .values("id", "student_id", "full_name", "transcript_id")
+    )
+
+
+def _load_columns(rows: dict[int, int]) -> tuple[_Columns, set[int]]:
+    """
+    rows: 성적표 id → 학생 행 번호
+    반환: (유효 과목 열, parsed_data 가 있는 성적표 id)
+    TranscriptCourse 로 적재된 성적표는 테이블에서, 아니면 parsed_data(JSON) 에서 읽는다.
+    """
+    cols = _Columns()
+    ids = list(rows)
+    synced = set(
+        Transcript.objects.filter(id__in=ids, courses_synced=True).values_list("id", flat=True)
+    ) if ids else set()
+    with_data = set(synced)
+
+    synced_ids = sorted(synced)
+    for i in range(0, len(synced_ids), CHUNK):
+        valid = TranscriptCourse.objects.valid().filter(transcript_id__in=synced_ids[i:i + CHUNK])
+        for r in valid.credit_totals("transcript_id", "type", "major_field"):
+            cols.add(rows[r["transcript_id"]], r["total_credit"], r["type"], r["major_field"], r["course_count"])
+        for r in valid.credit_totals("transcript_id", "code", "normalized_name"):
+            cols.add_key(rows[r["transcript_id"]], course_identity(r["code"], r["normalized_name"]))
+
+    rest = [tid for tid in ids if tid not in synced]
+    for i in range(0, len(rest), CHUNK):
+        for tid, parsed in Transcript.objects.filter(id__in=rest[i:i + CHUNK]).values_list("id", "parsed_data"):
+            if not parsed:
+                continue
+            with_data.add(tid)
+            for c in get_courses_from_parsed_data(parsed):
+                if not c or c.get("grade") == "F" or c.get("retake", False):
+                    continue
+                cols.add(
+                    rows[tid], int(c.get("credit", 0) or 0),
+                    c.get("type") or "", (c.get("major_field") or "").strip(),
+                )
+                cols.add_key(rows[tid], course_identity_from_dict(c))
+    return cols, with_data
+
+
+def audit_major(major: str) -> dict:
+    """
+    전공 학생 전체 일괄 감사.
+    반환: {"major", "requirement_id", "results": [학생별 {user_id, student_id, full_name, transcript_id, ...결과 | error}]}
+    또는 졸업요건이 없으면 {"error", "status"}
+    """
+    requirement = GraduationRequirement.objects.filter(major=major).first()
+    if not requirement:
+        return {"error": "졸업 요건 데이터가 없습니다.", "status": 500}
+    results = audit_students(requirement, load_students(major))
+    return {"major": major, "requirement_id": requirement.id, "results": results}
+
+
+def audit_students(requirement: GraduationRequirement, students: list[dict]) -> list[dict]:
+    """load_students 형태의 학생 목록(또는 그 일부) 감사. 결과는 students 와 같은 순서"""
+    index = get_requirement_index(requirement)
+    n = len(students)
+    rows = {s["transcript_id"]: i for i, s in enumerate(students) if s["transcript_id"]}
+    cols, with_data = _load_columns(rows)
+
+    owner = np.asarray(cols.owner, dtype=np.int64)
+    credit = np.asarray(cols.credit, dtype=np.int64)
+    count = np.asarray(cols.count, dtype=np.int64)
+
+    def credit_sum(mask) -> np.ndarray:
+        return np.bincount(owner, weights=credit * mask, minlength=n).astype(np.int64)
+
+    # 1) 학점 구분별 합계: 고유 (type, major_field) 조합마다 GRADUATION_RULES 판정 → 행 마스크 → 학생별 합
+    uniques, idx = _factorize(list(zip(cols.type, cols.major_field)))
+    matched = [GRADUATION_RULES.categories(*u) for u in uniques]
+    credits = {}
+    for name in GRADUATION_RULES.names:
+        flags = np.fromiter((name in m for m in matched), dtype=bool, count=len(uniques))
+        credits[name] = credit_sum(flags[idx])
+
+    # 2) 드볼 영역별 수강 과목 수 (학생 × 영역)
+    areas = list(dict.fromkeys(index.drbol_areas))
+    area_pos = {a: j for j, a in enumerate(areas)}
+    uniques, idx = _factorize(cols.major_field)
+    area_of = np.asarray([area_pos.get(f, -1) for f in uniques], dtype=np.int64)[idx]
+    sel = area_of >= 0
+    area_counts = np.bincount(
+        owner[sel] * len(areas) + area_of[sel], weights=count[sel], minlength=n * len(areas)
+    ).astype(np.int64).reshape(n, len(areas))
+
+    # 3) 학생별 고유 과목 (전공필수 이수 여부는 학생마다 매처로 판정)
+    taken: list[dict[str, None]] = [{} for _ in range(n)]
+    for o, key in cols.keys:
+        taken[o].setdefault(key)
+
+    # 4) 학생별 결과 조립
+    results = []
+    for i, s in enumerate(students):
+        row = {
+            "user_id": s["id"], "student_id": s["student_id"], "full_name": s["full_name"],
+            "transcript_id": s["transcript_id"],
+        }
+        if s["transcript_id"] not in with_data:
+            results.append({**row, "error": "성적표 데이터가 없습니다."})
+            continue
+
+        completed = index.matcher.match([course_from_identity(k) for k in taken[i]])
+        missing_by_semester: dict[str, list[dict]] = {}
+        for item in index.major_must:
+            if item not in completed:
+                missing_by_semester.setdefault(item.semester or "기타", []).append(item.as_dict())
+        covered = area_counts[i] >= 1
+        data = graduation_result(
+            requirement,
+            {name: int(values[i]) for name, values in credits.items()},
+            int(covered.sum()),
+            [a for a in index.drbol_areas if not covered[area_pos[a]]],
+            missing_by_semester,
+        )
+        results.append({**row, **data})
+    return results
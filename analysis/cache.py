@@ -0,0 +1,47 @@
+# analysis/cache.py
+"""
+졸업요건 분석 결과 적중 통계
+
+- 분석 결과는 GraduationSnapshot 에 (성적표, 졸업요건) 버전 단위로 저장되고,
+  개별 분석 뷰와 대시보드가 모두 snapshots.read 로 읽는다 (별도 결과 캐시 없음).
+- snapshots.read 가 읽을 때마다 결과를 record_snapshot 으로 기록 → get_stats
+- 횟수는 캐시 백엔드에 카운터로 누적 (Redis 사용 시 프로세스 간 공유)
+"""
+from django.core.cache import cache
+
+STATS_PREFIX = "analysis:stats"
+# 스냅샷 읽기 결과: 그대로 사용 / 요건만 바뀌어 저장된 집계로 재판정 / 전체 재계산
+SNAPSHOT_OUTCOMES = ("fresh", "rederived", "rebuilt")
+
+
+def _incr(name: str) -> None:
+    key = f"{STATS_PREFIX}:{name}"
+    # add는 키가 없을 때만 성공 → 최초 1회 초기화, 이후엔 원자적 증가
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:  # 그 사이 만료/삭제된 경우
+            cache.set(key, 1, timeout=None)
+
+
+def record_snapshot(outcome: str) -> None:
+    """스냅샷 읽기 결과 기록 (SNAPSHOT_OUTCOMES 중 하나)"""
+    _incr(f"snapshot:{outcome}")
+
+
+def get_stats() -> dict:
+    """
+    스냅샷 읽기 적중/미적중.
+    hits: 저장된 결과를 그대로 쓴 횟수 (fresh), misses: 다시 판정/계산한 횟수 (rederived + rebuilt)
+    """
+    found = cache.get_many([f"{STATS_PREFIX}:snapshot:{o}" for o in SNAPSHOT_OUTCOMES])
+    snapshot = {o: found.get(f"{STATS_PREFIX}:snapshot:{o}", 0) for o in SNAPSHOT_OUTCOMES}
+    hits = snapshot["fresh"]
+    misses = snapshot["rederived"] + snapshot["rebuilt"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": (hits / total) if total else 0,
+        "snapshot": snapshot,
+    }
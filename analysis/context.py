@@ -0,0 +1,109 @@
+# analysis/context.py
+"""
+요청 단위 분석 입력 (User / 최신 Transcript / GraduationRequirement)
+
+- 모델마다 처음 필요할 때 한 번만 조회하고 이후엔 재사용한다 (요청당 모델별 최대 1쿼리).
+- 최신 성적표는 User.latest_transcript 포인터(처리 완료된 가장 최근 성적표)로 User 와 함께 한 쿼리에 읽는다.
+  포인터가 없으면(처리 전 / 이전 데이터) created_at 기준 최신 성적표로 대체 — latest_transcript_value 도 같은 규칙.
+- parsed_data 는 기본적으로 같은 쿼리에서 함께 읽는다 (analysis 뷰는 대부분 JSON 을 쓴다).
+  with_data=False 면 미뤄서(defer) 읽는다 — 적재된 성적표를 TranscriptCourse 로만 조회하는 semesters 뷰용
+  (적재 전 성적표라 JSON 이 필요해지면 그 필드만 한 번 더 읽음).
+- for_request(request, user_id) 로 얻으면 같은 요청 안의 analysis / semesters 코드가 같은 객체를 공유한다.
+- 다른 경로에서 이미 읽은 객체(예: 스냅샷과 함께 읽은 졸업요건)는 seed() 로 채워 재조회를 막는다.
+"""
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.functional import cached_property
+
+from transcripts.models import Transcript
+from users.models import User
+from .models import GraduationRequirement
+
+REQUEST_ATTR = "_analysis_contexts"
+
+
+class AnalysisContext:
+    def __init__(self, user_id: int, with_data: bool = True):
+        self.user_id = user_id
+        self.with_data = with_data
+        self._transcript = None
+        self._transcript_loaded = False
+
+    @cached_property
+    def user(self) -> User | None:
+        qs = User.objects.select_related("latest_transcript")
+        if not self.with_data:
+            qs = qs.defer("latest_transcript__parsed_data")
+        return qs.filter(id=self.user_id).first()
+
+    @cached_property
+    def requirement(self) -> GraduationRequirement | None:
+        """전공으로만 매칭 (입학년도 미사용)"""
+        if self.user is None:
+            return None
+        return GraduationRequirement.objects.filter(major=self.user.major).first()
+
+    @property
+    def transcript(self) -> Transcript | None:
+        """최신 성적표 (with_data=False 면 parsed_data 는 처음 접근할 때 읽음)"""
+        if not self._transcript_loaded:
+            user = self.user
+            if user is None:
+                self._transcript = None
+            elif user.latest_transcript_id:
+                self._transcript = user.latest_transcript
+            else:
+                qs = Transcript.objects.filter(user_id=self.user_id).order_by("-created_at")
+                self._transcript = (qs if self.with_data else qs.defer("parsed_data")).first()
+            self._transcript_loaded = True
+        return self._transcript
+
+    def seed(self, **objects) -> None:
+        """이미 읽은 user / requirement / transcript 채우기"""
+        for name in ("user", "requirement"):
+            if name in objects:
+                self.__dict__[name] = objects[name]
+        if "transcript" in objects:
+            self._transcript = objects["transcript"]
+            self._transcript_loaded = True
+
+    def inputs(self) -> dict:
+        """load_analysis_inputs 형식: {"user", "transcript", "requirement", "status"} 또는 {"error", "status"}"""
+        if not self.user:
+            return {"error": "사용자를 찾을 수 없습니다.", "status": 404}
+        transcript = self.transcript
+        if not transcript or not transcript.parsed_data:
+            return {"error": "성적표 데이터가 없습니다.", "status": 404}
+        if not self.requirement:
+            return {"error": "졸업 요건 데이터가 없습니다.", "status": 500}
+        return {"user": self.user, "transcript": transcript, "requirement": self.requirement, "status": 200}
+
+
+def latest_transcript_value(field: str = "id", user: str = ""):
+    """
+    쿼리 식: 사용자의 최신 성적표 field 값 (AnalysisContext.transcript 와 같은 규칙)
+    user: 사용자까지의 경로 (User 쿼리셋이면 "", GraduationSnapshot 이면 "user")
+    """
+    prefix = f"{user}__" if user else ""
+    pointer = F(f"{prefix}latest_transcript_id" if field == "id" else f"{prefix}latest_transcript__{field}")
+    fallback = (
+        Transcript.objects
+        .filter(user_id=OuterRef(f"{prefix}id" if user else "pk"))
+        .order_by("-created_at")
+        .values(field)[:1]
+    )
+    return Coalesce(pointer, Subquery(fallback), output_field=Transcript._meta.get_field(field))
+
+
+def for_request(request, user_id: int, with_data: bool = True) -> AnalysisContext:
+    """
+    요청에 묶인 AnalysisContext (같은 요청 + 같은 user_id 면 같은 객체)
+    with_data 는 처음 만들 때만 적용된다 (AnalysisContext 참고).
+    """
+    # DRF Request 는 속성을 원래 HttpRequest 로 넘기지 않으므로 원본에 보관
+    target = getattr(request, "_request", request)
+    contexts = target.__dict__.setdefault(REQUEST_ATTR, {})
+    ctx = contexts.get(user_id)
+    if ctx is None:
+        ctx = contexts[user_id] = AnalysisContext(user_id, with_data)
+    return ctx
@@ -0,0 +1,62 @@
+import csv
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from analysis.bulk import audit_major
+
+# CSV 에 내보낼 단일 값 열 (missing_* 는 요약 열로 변환)
+CSV_FIELDS = [
+    "user_id", "student_id", "full_name", "transcript_id", "graduation_status",
+    "total_completed", "total_required",
+    "major_completed", "major_required",
+    "general_completed", "general_required",
+    "drbol_completed", "drbol_required",
+    "sw_completed", "sw_required",
+    "msc_completed", "msc_required",
+    "special_general_completed", "special_general_required",
+    "missing_major_count", "missing_drbol_areas", "message", "error",
+]
+
+
+def _csv_row(r: dict) -> dict:
+    row = {k: r.get(k, "") for k in CSV_FIELDS}
+    if "error" not in r:
+        row["missing_major_count"] = sum(len(v) for v in r["missing_major_courses"].values())
+        row["missing_drbol_areas"] = ";".join(r["missing_drbol_areas"])
+    return row
+
+
+class Command(BaseCommand):
+    help = "전공 학생 전체의 졸업요건을 일괄 감사해 CSV / JSON 으로 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("major", help="학과명 (GraduationRequirement.major)")
+        parser.add_argument("--format", choices=["csv", "json"], default="csv")
+        parser.add_argument("--output", "-o", help="저장할 파일 경로 (생략 시 표준 출력)")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        result = audit_major(options["major"])
+        if "error" in result:
+            raise CommandError(result["error"])
+        elapsed = time.perf_counter() - start
+
+        out = open(options["output"], "w", encoding="utf-8", newline="") if options["output"] else self.stdout
+        try:
+            if options["format"] == "json":
+                out.write(json.dumps(result, ensure_ascii=False, indent=2) + "\n")
+            else:
+                writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                writer.writerows(_csv_row(r) for r in result["results"])
+        finally:
+            if options["output"]:
+                out.close()
+
+        results = result["results"]
+        done = sum(1 for r in results if r.get("graduation_status") == "complete")
+        self.stderr.write(self.style.SUCCESS(
+            f"{options['major']}: {len(results)}명 감사 완료 (충족 {done}명) — {elapsed:.2f}s"
+        ))
@@ -0,0 +1,223 @@
+import json
+import random
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, URLResolver
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from analysis import urls as analysis_urls
+from analysis.models import GraduationRequirement
+from semesters import urls as semesters_urls
+from transcripts.courses import sync_transcript_courses
+from transcripts.models import Transcript
+from transcripts.tasks import mark_latest_transcript
+from users.models import User
+
+MAJOR = "벤치마크학과"
+AREAS = ["사상과역사", "사회와문화", "융합과창업", "자연과과학기술", "세계와지구촌", "예술과체육", "인간과철학"]
+SEMESTERS = [f"{y}-{t}" for y in range(1, 5) for t in (1, 2)]
+TYPES = ["전공", "전공필수", "전공선택", "교양", "교양필수", "드볼", "MSC", "SW", "데이터활용", "특성화교양"]
+FORMATS = ("list", "dict")  # list: 레거시 [{...}] / dict: {"courses": [...]}
+BENCH_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "bench"}}
+
+# 앱 → (URL 접두사, urlpatterns)
+TARGETS = {
+    "analysis": ("/api/analysis/", analysis_urls.urlpatterns),
+    "semesters": ("/api/semesters/", semesters_urls.urlpatterns),
+}
+
+# 뷰별 쿼리스트링
+QUERY = {
+    "CohortAuditView": {"major": MAJOR},
+    "SemesterFilteredView": {"filter": "전공,교양필수"},
+}
+
+
+def _requirement() -> GraduationRequirement:
+    must = [
+        {"code": f"BEN{i:03d}", "name": f"전공필수{i}", "semester": SEMESTERS[i % len(SEMESTERS)]}
+        for i in range(12)
+    ]
+    must.append({"code": "", "name": "캡스톤디자인Ⅱ", "semester": "4-2"})
+    return GraduationRequirement.objects.create(
+        major=MAJOR, year=2024,
+        major_must_courses=must,
+        general_must_courses=[{"code": "GEN001", "name": "글쓰기"}, {"code": "", "name": "영어회화1"}],
+        drbol_areas=",".join(AREAS),
+    )
+
+
+def _courses(n: int, rng: random.Random) -> list[dict]:
+    rows = []
+    for _ in range(n):
+        r = rng.random()
+        code = f"BEN{rng.randint(0, 20):03d}" if r < 0.25 else ("" if r < 0.35 else f"X{rng.randint(0, 9999):04d}")
+        rows.append({
+            "code": code,
+            "name": rng.choice(["캡스톤디자인2", "캡스톤 디자인 Ⅱ", "자료구조", "영어회화 1", "글쓰기", "미적분학"]),
+            "credit": rng.choice([1, 2, 3, 3, 3]),
+            "grade": rng.choice(["A+", "A0", "B+", "B0", "C+", "P", "F"]),
+            "type": rng.choice(TYPES),
+            "major_field": rng.choice(AREAS + ["교양필수", "교양선택", "특성화교양", ""]),
+            "semester": rng.choice(SEMESTERS),
+            "retake": rng.random() < 0.05,
+        })
+    return rows
+
+
+def _create_user(seq: int, n: int, fmt: str, rng: random.Random, sync: bool, pointer: bool) -> User:
+    user = User.objects.create(
+        student_id=f"B{seq:06d}", username=f"bench-{seq}",
+        full_name="벤치", major=MAJOR, is_staff=True,  # 운영용(관리자) 엔드포인트 포함
+    )
+    courses = _courses(n, rng)
+    transcript = Transcript.objects.create(
+        user=user, file="bench.png", status=Transcript.STATUS.done,
+        parsed_data=courses if fmt == "list" else {"courses": courses},
+    )
+    if sync:
+        sync_transcript_courses(transcript)
+    if pointer:  # 운영과 같이 처리 완료 시 최신 성적표 포인터 갱신
+        mark_latest_transcript(transcript)
+    return user
+
+
+def _endpoints(apps: list[str]) -> list[tuple[str, str, URLPattern]]:
+    """(앱, 전체 경로 템플릿, 패턴) — include 는 사용하지 않으므로 한 단계만 펼친다"""
+    rows = []
+    for app in apps:
+        prefix, patterns = TARGETS[app]
+        for p in patterns:
+            if isinstance(p, URLResolver):
+                continue
+            rows.append((app, prefix + str(p.pattern), p))
+    return rows
+
+
+def _call(factory, pattern: URLPattern, route: str, user: User, kwargs: dict):
+    view_name = pattern.callback.view_class.__name__
+    request = factory.get(route.format(**kwargs), QUERY.get(view_name, {}))
+    force_authenticate(request, user=user)
+    response = pattern.callback(request, **kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return response
+
+
+def _measure(fn, repeat: int) -> dict:
+    """첫 호출(콜드) + repeat 회 반복 시간 / 쿼리 수 + tracemalloc 최대 할당량"""
+    with CaptureQueriesContext(connection) as cold_q:
+        start = time.perf_counter()
+        response = fn()
+        cold_ms = (time.perf_counter() - start) * 1000
+
+    samples = []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as warm_q:
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "cold_ms": round(cold_ms, 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "cold_queries": len(cold_q),
+        "queries": len(warm_q),
+        "peak_alloc_kb": round(peak / 1024, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "합성 사용자/졸업요건/성적표로 analysis · semesters 엔드포인트의 지연 시간, 쿼리 수, 메모리 할당을 측정합니다. "
+        "데이터는 트랜잭션 안에서 만들고 끝나면 롤백합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="40,100,200,400", help="성적표당 과목 수 (콤마 구분)")
+        parser.add_argument("--formats", default=",".join(FORMATS), help="parsed_data 형식: list(레거시), dict")
+        parser.add_argument("--apps", default=",".join(TARGETS), help="측정할 앱: analysis, semesters")
+        parser.add_argument("--repeat", type=int, default=5, help="엔드포인트별 반복 횟수 (콜드 호출 제외)")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--no-sync", action="store_true", help="TranscriptCourse 적재 없이 parsed_data 경로만 측정")
+        parser.add_argument(
+            "--no-pointer", action="store_true",
+            help="User.latest_transcript 없이 측정 (created_at 기준 최신 성적표 조회 대체 경로)",
+        )
+        parser.add_argument("--json", action="store_true", help="결과를 JSON 한 줄씩 출력")
+        parser.add_argument("--output", "-o", help="JSON 결과를 저장할 파일 경로")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(s) for s in options["sizes"].split(",") if s.strip()]
+        except ValueError:
+            raise CommandError("--sizes 는 정수 목록이어야 합니다.")
+        formats = [f.strip() for f in options["formats"].split(",") if f.strip()]
+        apps = [a.strip() for a in options["apps"].split(",") if a.strip()]
+        if not sizes or any(f not in FORMATS for f in formats) or any(a not in TARGETS for a in apps):
+            raise CommandError("--sizes / --formats / --apps 값을 확인하세요.")
+
+        rng = random.Random(options["seed"])
+        repeat = max(1, options["repeat"])
+        endpoints = _endpoints(apps)
+        factory = APIRequestFactory()
+        results = []
+
+        # 캐시는 실제 캐시와 분리, 데이터는 롤백
+        with override_settings(CACHES=BENCH_CACHES), transaction.atomic():
+            _requirement()
+            datasets = [(fmt, n) for fmt in formats for n in sizes]
+            for seq, (fmt, n) in enumerate(datasets, 1):
+                user = _create_user(
+                    seq, n, fmt, rng,
+                    sync=not options["no_sync"],
+                    pointer=not options["no_pointer"],
+                )
+                kwargs = {"user_id": user.pk, "semester": SEMESTERS[0]}
+                for app, route, pattern in endpoints:
+                    path_kwargs = {k: v for k, v in kwargs.items() if f"<{k}>" in route or f":{k}>" in route}
+                    template = route.replace("<int:user_id>", "{user_id}").replace("<str:semester>", "{semester}")
+                    row = {
+                        "app": app,
+                        "route": route,
+                        "view": pattern.callback.view_class.__name__,
+                        "courses": n,
+                        "format": fmt,
+                        "synced": not options["no_sync"],
+                        "pointer": not options["no_pointer"],
+                        **_measure(lambda: _call(factory, pattern, template, user, path_kwargs), repeat),
+                    }
+                    results.append(row)
+                    self._report(row, options["json"])
+            transaction.set_rollback(True)
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                for row in results:
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self.stderr.write(self.style.SUCCESS(f"{len(results)}건 저장: {options['output']}"))
+
+    def _report(self, row: dict, as_json: bool) -> None:
+        if as_json:
+            self.stdout.write(json.dumps(row, ensure_ascii=False))
+            return
+        self.stdout.write(
+            f"[{row['format']:4} {row['courses']:>4}] {row['view']:<32} {row['status']} | "
+            f"median {row['median_ms']:8.2f}ms (cold {row['cold_ms']:8.2f}ms) | "
+            f"queries {row['queries']} (cold {row['cold_queries']}) | peak {row['peak_alloc_kb']}KB"
+        )
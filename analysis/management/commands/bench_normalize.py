@@ -0,0 +1,94 @@
+import json
+import random
+import re
+import time
+import unicodedata
+
+from django.core.management.base import BaseCommand, CommandError
+
+from analysis import normalize
+
+BASE_NAMES = [
+    "캡스톤디자인2", "캡스톤 디자인 Ⅱ", "자료구조", "영어회화 1", "글쓰기", "미적분학", "일반물리학및실험(1)",
+    "컴퓨터 프로그래밍-Ⅰ", "선형대수학 [공학]", "데이터·사이언스 개론", "AI/머신러닝 입문", "확률 및 통계_1",
+    "운영체제", "알고리즘　설계", "Ｃ프로그래밍", "창업과 기업가정신 {융합}", "세계사의 이해ㆍ토론",
+]
+
+# 이전 구현 (비교 기준) — 결과가 같은지 확인하고 속도를 비교한다
+_ROMAN = {"Ⅰ": "1", "Ⅱ": "2", "Ⅲ": "3", "Ⅳ": "4", "Ⅴ": "5", "Ⅵ": "6", "Ⅶ": "7", "Ⅷ": "8", "Ⅸ": "9"}
+
+
+def _legacy_norm(s) -> str:
+    if not s:
+        return ""
+    s = unicodedata.normalize("NFKC", str(s)).strip().lower()
+    for k, v in _ROMAN.items():
+        s = s.replace(k, v)
+    s = re.sub(r"[·ㆍ\.\-_/]", "", s)
+    s = re.sub(r"[\(\)\[\]\{\}\s]+", "", s)
+    return s
+
+
+def _vocabulary(size: int, rng: random.Random) -> list[str]:
+    """기본 과목명 + 변형(공백/기호/전각/분반 번호)으로 size 개의 서로 다른 이름"""
+    names = list(BASE_NAMES)
+    decorations = [" ", "  ", "-", "·", "(", ")", "_", "/", "\t", "　", "Ⅲ", "Ａ"]
+    while len(names) < size:
+        base = rng.choice(BASE_NAMES)
+        pos = rng.randint(0, len(base))
+        names.append(f"{base[:pos]}{rng.choice(decorations)}{base[pos:]} {len(names)}")
+    return names[:size]
+
+
+def _ns_per_name(fn, names: list[str], rounds: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        for name in names:
+            fn(name)
+    return (time.perf_counter_ns() - start) / (rounds * len(names))
+
+
+class Command(BaseCommand):
+    help = (
+        "과목명 정규화(analysis.normalize)의 이름당 처리 시간을 이전 구현(정규식 + 로마 숫자 치환)과 비교합니다. "
+        "두 구현의 결과가 다르면 실패합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--names", type=int, default=2000, help="서로 다른 과목명 수")
+        parser.add_argument("--calls", type=int, default=200000, help="측정에 쓸 호출 수 (이름 목록을 반복)")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+
+    def handle(self, *args, **options):
+        if options["names"] < 1 or options["calls"] < 1:
+            raise CommandError("--names / --calls 는 1 이상이어야 합니다.")
+        names = _vocabulary(options["names"], random.Random(options["seed"]))
+        rounds = max(1, options["calls"] // len(names))
+
+        mismatches = [n for n in names if _legacy_norm(n) != normalize.normalize_course_name(n)]
+        if mismatches:
+            raise CommandError(f"정규화 결과 불일치 {len(mismatches)}건 (예: {mismatches[0]!r})")
+
+        uncached = normalize._normalize.__wrapped__
+        normalize._normalize.cache_clear()
+        result = {
+            "names": len(names),
+            "calls": rounds * len(names),
+            "legacy_ns": round(_ns_per_name(_legacy_norm, names, rounds)),
+            "uncached_ns": round(_ns_per_name(uncached, names, rounds)),
+            "cached_ns": round(_ns_per_name(normalize.normalize_course_name, names, rounds)),
+            "cache": normalize.cache_info()._asdict(),
+        }
+        result["speedup_uncached"] = round(result["legacy_ns"] / max(1, result["uncached_ns"]), 2)
+        result["speedup_cached"] = round(result["legacy_ns"] / max(1, result["cached_ns"]), 2)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(result, ensure_ascii=False))
+            return
+        self.stdout.write(f"과목명 {result['names']}개 × {rounds}회 = {result['calls']}회 호출 (결과 일치)")
+        self.stdout.write(f"  이전 구현      {result['legacy_ns']:>7} ns/이름")
+        self.stdout.write(f"  translate 표   {result['uncached_ns']:>7} ns/이름 (x{result['speedup_uncached']})")
+        self.stdout.write(f"  + 메모이제이션 {result['cached_ns']:>7} ns/이름 (x{result['speedup_cached']})")
+        cache = result["cache"]
+        self.stdout.write(f"  캐시: hits {cache['hits']} / misses {cache['misses']} / size {cache['currsize']}/{cache['maxsize']}")
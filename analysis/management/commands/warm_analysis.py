@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from analysis.models import GraduationRequirement
+from analysis.warm import is_active, warm_requirement
+
+
+class Command(BaseCommand):
+    help = "졸업요건별로 전공 학생들의 졸업 판정 스냅샷을 저장된 과목 집계로 다시 판정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--major", action="append", help="대상 학과 (여러 번 지정 가능, 생략 시 전체)")
+        parser.add_argument("--chunk-size", type=int, help="한 번에 재판정할 스냅샷 수 (기본: ANALYSIS_WARM_CHUNK_SIZE)")
+        parser.add_argument("--workers", type=int, default=1, help="병렬 처리 스레드 수")
+
+    def handle(self, *args, **options):
+        qs = GraduationRequirement.objects.order_by("major", "pk")
+        if options["major"]:
+            qs = qs.filter(major__in=options["major"])
+        requirements = [r for r in qs if is_active(r)]
+        if not requirements:
+            raise CommandError("대상 졸업요건이 없습니다.")
+
+        for requirement in requirements:
+            def report(done, total, major=requirement.major):
+                self.stdout.write(f"[{major}] {done}/{total}개")
+
+            result = warm_requirement(
+                requirement,
+                chunk_size=options["chunk_size"],
+                workers=max(1, options["workers"]),
+                progress=report,
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f"[{result['major']}] 스냅샷 {result['updated']}/{result['snapshots']}개 갱신 ({result['elapsed']}s)"
+            ))
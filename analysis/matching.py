@@ -0,0 +1,178 @@
+# analysis/matching.py
+"""
+성적표 과목 ↔ 졸업요건 필수 과목 매칭 (OCR 오인식 대응)
+
+단계 (앞 단계에서 매칭된 과목/요건은 다음 단계에서 제외):
+1) code  : 과목 코드 일치
+2) name  : 정규화 이름 일치
+3) alias : 요건 항목의 aliases(정규화) 일치 — 예: "컴구" → 컴퓨터구조
+4) fuzzy : 2-gram 역색인으로 후보를 좁힌 뒤 편집 거리(최대 COURSE_MATCH_MAX_EDITS) 확인,
+           유사도(1 - 거리 / 긴 이름 길이)가 COURSE_MATCH_MIN_CONFIDENCE 이상인 것만, 높은 순으로 1:1 배정
+- 이수 판정(졸업 상태 / 스냅샷 / 일괄 감사 / 학기별 미이수)은 1~3 단계만 사용한다.
+  fuzzy 는 다른 과목끼리도 잇는다(컴퓨터구조 ↔ 컴퓨터구조론 0.833) → match(..., fuzzy=True) 로 받아 확인용(inferred_matches)으로만 보여준다.
+- 1~3 단계는 사전 조회라 과목 수에 선형, 4 단계도 2-gram 을 공유하는 이름만 비교하므로 전체 쌍을 비교하지 않는다.
+- 이름 속 숫자 / 끝의 로마 숫자(i, ii …)가 다르면 fuzzy 로 잇지 않는다 (영어회화1 ≠ 영어회화2).
+- 매처는 요건 항목만으로 만들어지므로 RequirementIndex 와 함께 한 번 만들어 재사용한다.
+- 같은 (code, 정규화 이름) 과목은 한 번만 보고, 동점은 과목 식별 문자열 순으로 정한다
+  → 어떤 항목이 이수로 판정되는지는 과목 집합에만 달려 있어, 과목 목록 / 스냅샷 집계 / 일괄 감사가 같은 결과를 낸다.
+"""
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.conf import settings
+
+from .normalize import course_identity, normalize_course_name
+
+DEFAULT_MIN_CONFIDENCE = 0.8
+DEFAULT_MAX_EDITS = 2
+FUZZY_MIN_LENGTH = 4  # 이보다 짧은 이름은 오타 한 글자로 다른 과목이 되기 쉬워 fuzzy 제외
+NGRAM = 2
+
+_DIGITS = re.compile(r"\d+")
+_TRAILING_ROMAN = re.compile(r"(?<![a-z])[ivx]+$")
+
+
+@dataclass(frozen=True)
+class CourseMatch:
+    course: dict
+    method: str        # code / name / alias / fuzzy
+    confidence: float  # code / name / alias 는 1.0
+
+    def as_dict(self) -> dict:
+        return {
+            "matched_code": (self.course.get("code") or "").strip(),
+            "matched_name": self.course.get("name", "") or "",
+            "match": self.method,
+            "confidence": self.confidence,
+        }
+
+
+def _grams(s: str) -> set[str]:
+    if len(s) < NGRAM:
+        return {s}
+    return {s[i:i + NGRAM] for i in range(len(s) - NGRAM + 1)}
+
+
+def _ordinal(s: str) -> tuple:
+    """과목 번호(숫자 / 끝의 로마 숫자) — 다르면 다른 과목"""
+    roman = _TRAILING_ROMAN.search(s)
+    return tuple(_DIGITS.findall(s)), roman.group() if roman else ""
+
+
+def bounded_distance(a: str, b: str, limit: int) -> int | None:
+    """편집 거리 (limit 초과면 None)"""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(a) + 1))
+    for j, cb in enumerate(b, 1):
+        current = [j]
+        for i, ca in enumerate(a, 1):
+            current.append(min(previous[i] + 1, current[i - 1] + 1, previous[i - 1] + (ca != cb)))
+        if min(current) > limit:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class CourseMatcher:
+    """필수 과목 항목(RequiredItem) 목록에 대한 매칭 인덱스"""
+
+    def __init__(self, items: Iterable):
+        self.items = tuple(items)
+        self._item_count = len(set(self.items))
+        self._by_code: dict[str, list] = defaultdict(list)
+        self._by_name: dict[str, list] = defaultdict(list)
+        self._by_alias: dict[str, list] = defaultdict(list)
+        self._terms: list[tuple[str, int, object]] = []       # (정규화 이름/별칭, 2-gram 수, 항목) — fuzzy 대상
+        self._postings: dict[str, list[int]] = defaultdict(list)  # 2-gram → _terms 위치
+
+        for it in self.items:
+            if it.code:
+                self._by_code[it.code].append(it)
+            if it.norm_name:
+                self._by_name[it.norm_name].append(it)
+            for alias in it.aliases:
+                self._by_alias[alias].append(it)
+            for term in {it.norm_name, *it.aliases}:
+                if len(term) >= FUZZY_MIN_LENGTH:
+                    grams = _grams(term)
+                    for g in grams:
+                        self._postings[g].append(len(self._terms))
+                    self._terms.append((term, len(grams), it))
+
+    def match(self, courses: list[dict], fuzzy: bool = False) -> dict:
+        """과목 목록 → {항목: CourseMatch} (매칭되지 않은 항목은 없음, fuzzy=True 면 4 단계 후보 포함)"""
+        matches: dict = {}
+        distinct: dict[str, tuple[dict, str]] = {}  # 과목 식별 문자열 → (처음 나온 과목, 정규화 이름)
+        for c in courses:
+            if not c:
+                continue
+            code = (c.get("code") or "").strip()
+            name = normalize_course_name(c.get("name"))
+            distinct.setdefault(course_identity(code, name), (c, name))
+        identities = list(distinct)
+        courses = [c for c, _ in distinct.values()]
+        names = [name for _, name in distinct.values()]
+        used: set[int] = set()
+
+        # 1) ~ 3) 정확 일치: 단계마다 전체 과목을 본다 → 뒤 과목의 코드 일치가 앞 과목의 이름 일치보다 우선
+        #    (단계 안에서는 과목 순서대로 처음 일치한 과목을 사용, 같은 키의 항목이 여럿이면 모두 이수)
+        codes = [(c.get("code") or "").strip() for c in courses]
+        for method, table, keys in (
+            ("code", self._by_code, codes),
+            ("name", self._by_name, names),
+            ("alias", self._by_alias, names),
+        ):
+            for pos, key in enumerate(keys):
+                hits = table.get(key) if key and pos not in used else None
+                if hits:
+                    for it in hits:
+                        matches.setdefault(it, CourseMatch(courses[pos], method, 1.0))
+                    used.add(pos)
+
+        if fuzzy and len(matches) < self._item_count and self._terms:
+            self._match_fuzzy(courses, names, identities, used, matches)
+        return matches
+
+    def _match_fuzzy(
+        self, courses: list[dict], names: list[str], identities: list[str], used: set[int], matches: dict,
+    ) -> None:
+        min_confidence = getattr(settings, "COURSE_MATCH_MIN_CONFIDENCE", DEFAULT_MIN_CONFIDENCE)
+        max_edits = getattr(settings, "COURSE_MATCH_MAX_EDITS", DEFAULT_MAX_EDITS)
+
+        candidates = []  # (유사도, 과목 위치, 항목)
+        for pos, name in enumerate(names):
+            if pos in used or len(name) < FUZZY_MIN_LENGTH:
+                continue
+            grams = _grams(name)
+            shared: dict[int, int] = defaultdict(int)
+            for g in grams:
+                for t in self._postings.get(g, ()):
+                    shared[t] += 1
+
+            ordinal = _ordinal(name)
+            for t, count in shared.items():
+                term, term_grams, it = self._terms[t]
+                if it in matches:
+                    continue
+                longest = max(len(term), len(name))
+                # 허용 거리: 최대 편집 수와 최소 유사도 중 더 엄격한 쪽
+                limit = min(max_edits, int(longest * (1 - min_confidence) + 1e-9))
+                # q-gram 필터: 편집 1회는 2-gram 을 최대 2개 깨므로, 거리 limit 이내면 공유 2-gram 이 그만큼은 남는다
+                if limit < 1 or count < max(term_grams, len(grams)) - NGRAM * limit or _ordinal(term) != ordinal:
+                    continue
+                distance = bounded_distance(name, term, limit)
+                if distance is not None:
+                    candidates.append((round(1 - distance / longest, 3), pos, it))
+
+        # 유사도 높은 순으로 과목 1개 ↔ 항목 1개 (동점은 과목 식별 문자열 순 → 과목 순서와 무관)
+        candidates.sort(key=lambda row: (-row[0], identities[row[1]]))
+        for confidence, pos, it in candidates:
+            if pos in used or it in matches:
+                continue
+            matches[it] = CourseMatch(courses[pos], "fuzzy", confidence)
+            used.add(pos)
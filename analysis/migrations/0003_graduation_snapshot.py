@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0002_graduationrequirement_updated_at'),
+        ('transcripts', '0005_ocr_page_cache'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GraduationSnapshot',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='graduation_snapshot', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('transcript_updated_at', models.DateTimeField()),
+                ('requirement_updated_at', models.DateTimeField()),
+                ('total_completed', models.IntegerField(default=0)),
+                ('total_required', models.IntegerField(default=0)),
+                ('major_completed', models.IntegerField(default=0)),
+                ('major_required', models.IntegerField(default=0)),
+                ('general_completed', models.IntegerField(default=0)),
+                ('general_required', models.IntegerField(default=0)),
+                ('drbol_completed', models.IntegerField(default=0)),
+                ('drbol_required', models.IntegerField(default=0)),
+                ('sw_completed', models.IntegerField(default=0)),
+                ('sw_required', models.IntegerField(default=0)),
+                ('msc_completed', models.IntegerField(default=0)),
+                ('msc_required', models.IntegerField(default=0)),
+                ('special_general_completed', models.IntegerField(default=0)),
+                ('special_general_required', models.IntegerField(default=0)),
+                ('missing_major_courses', models.JSONField(default=dict)),
+                ('missing_drbol_areas', models.JSONField(default=list)),
+                ('drbol_areas', models.JSONField(default=list)),
+                ('graduation_status', models.CharField(max_length=20)),
+                ('message', models.TextField(blank=True)),
+                ('course_keys', models.JSONField(default=dict)),
+                ('field_stats', models.JSONField(default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('requirement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='analysis.graduationrequirement')),
+                ('transcript', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='transcripts.transcript')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0003_graduation_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='graduationsnapshot',
+            name='aggregate_version',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
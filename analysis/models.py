@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 
 class GraduationRequirement(models.Model):
@@ -63,8 +64,63 @@ class GraduationRequirement(models.Model):
         null=True, blank=True
     )
 
+    # 수정 시각 = 요건 버전 (졸업 판정 스냅샷의 requirement_updated_at 과 비교)
+    updated_at = models.DateTimeField(auto_now=True)
+
     class Meta:
-        unique_together = ('major', 'year')  # 연도는 호환 위해 유지(쿼리에서는 major만 사용 가능)
+        # 연도는 호환 위해 유지(쿼리에서는 major만 사용 가능)
+        # 이 유니크 인덱스의 첫 열이 major 이므로 filter(major=...) 조회도 이 인덱스를 쓴다 (별도 major 인덱스 불필요)
+        unique_together = ('major', 'year')
 
     def __str__(self):
         return f"{self.major} {self.year}학번 졸업 요건"
+
+
+class GraduationSnapshot(models.Model):
+    """
+    사용자별 졸업요건 분석 결과 (GraduationStatusSerializer 필드 + 드볼 영역 상세).
+    읽기는 user_id 기본키 조회 한 번 — 계산에 쓴 성적표/요건 버전이 현재와 같을 때만 그대로 사용한다.
+    과목 집계(course_keys / field_stats)를 함께 저장해 요건 변경·과목 증감 시 과목을 다시 읽지 않고 갱신한다.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='graduation_snapshot'
+    )
+    transcript = models.ForeignKey('transcripts.Transcript', on_delete=models.CASCADE, related_name='+')
+    requirement = models.ForeignKey(GraduationRequirement, on_delete=models.CASCADE, related_name='snapshots')
+    # 계산 시점의 버전 (staleness 확인용)
+    transcript_updated_at = models.DateTimeField()
+    requirement_updated_at = models.DateTimeField()
+
+    total_completed = models.IntegerField(default=0)
+    total_required = models.IntegerField(default=0)
+    major_completed = models.IntegerField(default=0)
+    major_required = models.IntegerField(default=0)
+    general_completed = models.IntegerField(default=0)
+    general_required = models.IntegerField(default=0)
+    drbol_completed = models.IntegerField(default=0)
+    drbol_required = models.IntegerField(default=0)
+    sw_completed = models.IntegerField(default=0)
+    sw_required = models.IntegerField(default=0)
+    msc_completed = models.IntegerField(default=0)
+    msc_required = models.IntegerField(default=0)
+    special_general_completed = models.IntegerField(default=0)
+    special_general_required = models.IntegerField(default=0)
+
+    missing_major_courses = models.JSONField(default=dict)   # 학기 → [{code, name}]
+    missing_drbol_areas = models.JSONField(default=list)
+    drbol_areas = models.JSONField(default=list)             # [{area, covered, courses_count, completed_credit}]
+    graduation_status = models.CharField(max_length=20)
+    message = models.TextField(blank=True)
+
+    # 과목 집계 (graduation.aggregate_courses 의 keys / fields)
+    course_keys = models.JSONField(default=dict)             # 과목 식별 문자열(code + 정규화 이름) → 이수 횟수
+    field_stats = models.JSONField(default=dict)             # 영역(major_field) → [과목 수, 학점]
+    aggregate_version = models.PositiveSmallIntegerField(default=0)  # graduation.AGGREGATE_VERSION 과 다르면 재계산
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"GraduationSnapshot(user={self.user_id}, {self.graduation_status})"
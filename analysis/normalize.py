@@ -0,0 +1,49 @@
+# analysis/normalize.py
+"""
+과목명 정규화 (analysis / semesters / transcripts 공용)
+
+정규화 규칙: NFKC → 앞뒤 공백 제거 → 소문자 → 구분 기호(·ㆍ.-_/)와 괄호 제거 → 모든 공백 제거
+- 기호/괄호 제거는 미리 만든 str.translate 표 한 번, 공백 제거는 str.split() 으로 처리 (정규식 없음).
+- 과목명 어휘는 한정적이라 결과를 LRU 로 기억한다 (NORMALIZE_CACHE_SIZE).
+- 로마 숫자(Ⅰ~Ⅸ)는 NFKC 단계에서 이미 라틴 문자로 바뀐다 (Ⅱ → "II" → "ii").
+  예전 구현의 Ⅱ→2 치환은 NFKC 이후라 적용된 적이 없으므로, 같은 결과를 유지하기 위해 치환하지 않는다.
+"""
+import unicodedata
+from functools import lru_cache
+
+NORMALIZE_CACHE_SIZE = 8192
+
+# 지울 문자: 구분 기호 + 괄호 (공백은 split 으로 제거 — 정규식 \s 와 같은 str.isspace 기준)
+_DELETE = str.maketrans("", "", "·ㆍ.-_/()[]{}")
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(name: str) -> str:
+    s = unicodedata.normalize("NFKC", name).strip().lower().translate(_DELETE)
+    return "".join(s.split())
+
+
+def normalize_course_name(name) -> str:
+    """과목명 → 비교용 정규화 문자열 (None / 빈 값은 "")"""
+    if not name:
+        return ""
+    return _normalize(name if isinstance(name, str) else str(name))
+
+
+def course_identity(code: str, norm_name: str) -> str:
+    """과목 식별 문자열 (code + 정규화 이름) — 집계/스냅샷에 저장해 매처에 다시 넣을 수 있는 형태"""
+    return f"{code}\t{norm_name}"
+
+
+def course_identity_from_dict(d: dict) -> str:
+    return course_identity((d.get("code") or "").strip(), normalize_course_name(d.get("name")))
+
+
+def course_from_identity(identity: str) -> dict:
+    """course_identity → 매처 입력용 {code, name} (정규화는 다시 적용해도 같은 결과)"""
+    code, _, name = identity.partition("\t")
+    return {"code": code, "name": name}
+
+
+def cache_info():
+    return _normalize.cache_info()
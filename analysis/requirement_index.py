@@ -0,0 +1,105 @@
+# analysis/requirement_index.py
+"""
+졸업요건 인덱스
+
+GraduationRequirement 의 JSON 필드(전공필수/교양필수/드볼 영역)를 요청마다 다시 파싱·정규화하지 않도록
+정규화 이름, 별칭, 학기 버킷, 과목 매처를 미리 계산해 둔 불변 객체.
+(요건 id, updated_at) 단위로 한 번만 만들고 프로세스 전역 LRU 에 보관하며 analysis / semesters 가 공유한다.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from django.conf import settings
+
+from .matching import CourseMatcher
+from .utils import _norm
+
+DEFAULT_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class RequiredItem:
+    code: str
+    name: str
+    semester: str | None   # 계획 학기 (없으면 None)
+    norm_name: str
+    aliases: tuple[str, ...]  # 정규화된 별칭
+
+    def as_dict(self) -> dict:
+        return {"code": self.code, "name": self.name}
+
+
+@dataclass(frozen=True)
+class RequirementIndex:
+    major_must: tuple[RequiredItem, ...]
+    general_must: tuple[RequiredItem, ...]
+    major_must_by_semester: Mapping[str, tuple[RequiredItem, ...]]  # 계획 학기(없으면 '기타') → 전공필수
+    drbol_areas: tuple[str, ...]
+    matcher: CourseMatcher                 # 성적표 과목 ↔ 필수 과목 매칭 (코드 / 이름 / 별칭 / 유사 이름)
+
+
+def _build_items(raw: list[dict] | None) -> tuple[RequiredItem, ...]:
+    items = []
+    for d in (raw or []):
+        if not d:
+            continue
+        items.append(RequiredItem(
+            code=(d.get("code") or "").strip(),
+            name=d.get("name", "") or "",
+            semester=d.get("semester") or None,
+            norm_name=_norm(d.get("name")),
+            aliases=tuple(a for a in (_norm(x) for x in (d.get("aliases") or [])) if a),
+        ))
+    return tuple(items)
+
+
+def build_requirement_index(requirement) -> RequirementIndex:
+    major_must = _build_items(requirement.major_must_courses)
+    general_must = _build_items(requirement.general_must_courses)
+    all_items = major_must + general_must
+
+    by_semester: dict[str, list[RequiredItem]] = {}
+    for it in major_must:
+        by_semester.setdefault(it.semester or "기타", []).append(it)
+
+    return RequirementIndex(
+        major_must=major_must,
+        general_must=general_must,
+        major_must_by_semester=MappingProxyType({k: tuple(v) for k, v in by_semester.items()}),
+        drbol_areas=tuple(a.strip() for a in (requirement.drbol_areas or "").split(",") if a.strip()),
+        matcher=CourseMatcher(all_items),
+    )
+
+
+# ---------------------------
+# 프로세스 전역 LRU
+# ---------------------------
+_cache: "OrderedDict[tuple, RequirementIndex]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _max_size() -> int:
+    return getattr(settings, "REQUIREMENT_INDEX_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+
+
+def get_requirement_index(requirement) -> RequirementIndex:
+    if requirement.pk is None:  # 저장 전 객체는 캐시하지 않음
+        return build_requirement_index(requirement)
+
+    key = (requirement.pk, requirement.updated_at)
+    with _lock:
+        index = _cache.get(key)
+        if index is not None:
+            _cache.move_to_end(key)
+            return index
+
+    index = build_requirement_index(requirement)
+    with _lock:
+        _cache[key] = index
+        _cache.move_to_end(key)
+        while len(_cache) > _max_size():
+            _cache.popitem(last=False)
+    return index
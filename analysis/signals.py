@@ -0,0 +1,19 @@
+# analysis/signals.py
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import GraduationRequirement
+
+
+@receiver(post_save, sender=GraduationRequirement)
+def warm_after_requirement_change(sender, instance, raw=False, **kwargs):
+    # 요건이 바뀌면 전공 학생 스냅샷을 백그라운드에서 미리 재판정
+    if raw or not getattr(settings, "ANALYSIS_WARM_ON_REQUIREMENT_CHANGE", True):
+        return
+    from .tasks import warm_requirement_analysis
+
+    version = instance.updated_at.isoformat()
+    # 커밋 후 예약 (브로커 오류가 요건 저장을 실패시키지 않도록 robust)
+    transaction.on_commit(lambda: warm_requirement_analysis.delay(instance.pk, version), robust=True)
@@ -0,0 +1,228 @@
+# analysis/snapshots.py
+"""
+GraduationSnapshot 읽기/갱신
+
+- read(user_id): 기본키 조회 1회. 같은 쿼리에서 현재 최신 성적표 / 적용 요건의 버전을 함께 읽어 비교한다.
+  (결과는 analysis.cache 통계에 fresh / rederived / rebuilt 로 기록)
+  - 둘 다 같으면 저장된 결과를 그대로 반환
+  - 요건만 바뀌었으면 저장된 과목 집계로 다시 판정 (과목 재조회 없음)
+  - 성적표가 바뀌었거나 스냅샷이 없거나 집계 형식(AGGREGATE_VERSION)이 다르면 전체 재계산 후 저장
+- apply_requirement(requirement, ...): 요건 변경 시 그 전공 스냅샷 전체를 집계로 재판정 (묶음 / 스레드 / 진행률)
+- on_transcript_processed(transcript, previous): 성적표 처리 완료 시 갱신
+  (같은 성적표 재처리면 이전/새 과목 목록의 증감분만 집계에 반영)
+"""
+import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, OuterRef, Subquery
+
+from . import cache as analysis_cache
+from .context import AnalysisContext, latest_transcript_value
+from .graduation import (
+    AGGREGATE_VERSION, CREDIT_FIELDS, aggregate_courses, aggregate_transcript, combine_aggregates, derive_graduation,
+    drbol_breakdown, load_analysis_inputs,
+)
+from .models import GraduationRequirement, GraduationSnapshot
+from .serializers import GraduationStatusSerializer
+from .utils import get_valid_courses
+
+DATA_FIELDS = tuple(GraduationStatusSerializer().fields)
+UPDATE_BATCH = 500
+
+
+def _data(snapshot: GraduationSnapshot) -> dict:
+    return {f: getattr(snapshot, f) for f in DATA_FIELDS}
+
+
+def _aggregates(snapshot: GraduationSnapshot) -> dict:
+    return {
+        "credits": {k: getattr(snapshot, f"{k}_completed") for k in CREDIT_FIELDS},
+        "keys": snapshot.course_keys,
+        "fields": snapshot.field_stats,
+    }
+
+
+def _fill(snapshot: GraduationSnapshot, requirement: GraduationRequirement, agg: dict) -> dict:
+    """집계 + 요건으로 판정해 snapshot 필드를 채우고 결과 dict 반환 (저장은 호출자)"""
+    data = derive_graduation(requirement, agg)
+    for f in DATA_FIELDS:
+        setattr(snapshot, f, data[f])
+    snapshot.drbol_areas = drbol_breakdown(requirement, agg)
+    snapshot.course_keys = agg["keys"]
+    snapshot.field_stats = agg["fields"]
+    snapshot.aggregate_version = AGGREGATE_VERSION
+    snapshot.requirement = requirement
+    snapshot.requirement_updated_at = requirement.updated_at
+    return data
+
+
+def _write(user_id: int, transcript, requirement: GraduationRequirement, agg: dict) -> dict:
+    snapshot = GraduationSnapshot(
+        user_id=user_id, transcript_id=transcript.pk, transcript_updated_at=transcript.updated_at,
+    )
+    data = _fill(snapshot, requirement, agg)
+    try:
+        # 기본키(user_id) 지정 → 있으면 UPDATE, 없으면 INSERT (실패해도 바깥 트랜잭션은 유지)
+        with transaction.atomic():
+            snapshot.save()
+    except IntegrityError:
+        # 같은 사용자의 스냅샷을 다른 요청/태스크가 먼저 INSERT → 그 행을 덮어씀
+        snapshot.save(force_update=True)
+    return data
+
+
+def refresh(
+    user_id: int,
+    inputs: dict | None = None,
+    courses: list[dict] | None = None,
+    ctx: AnalysisContext | None = None,
+) -> dict:
+    """전체 재계산 후 저장. 반환: {"data", "status"} 또는 {"error", "status"}"""
+    inputs = inputs or load_analysis_inputs(user_id, ctx)
+    if "error" in inputs:
+        return inputs
+    transcript = inputs["transcript"]
+    agg = aggregate_courses(courses) if courses is not None else aggregate_transcript(transcript)
+    return {"data": _write(user_id, transcript, inputs["requirement"], agg), "status": 200}
+
+
+def read(user_id: int, ctx: AnalysisContext | None = None) -> dict:
+    """
+    스냅샷 우선 조회 (staleness 확인 포함). 반환 형태는 refresh 와 같음
+    ctx 를 넘기면 졸업요건을 같은 쿼리로 읽어 ctx 에 채우고, 재계산이 필요하면 ctx 의 입력을 사용한다.
+    """
+    active = GraduationRequirement.objects.filter(major=OuterRef("user__major")).order_by("pk").values("pk")[:1]
+    qs = GraduationSnapshot.objects.select_related("requirement") if ctx else GraduationSnapshot.objects
+    snapshot = (
+        qs
+        .annotate(
+            latest_transcript_id=latest_transcript_value("id", user="user"),
+            current_transcript_updated_at=F("transcript__updated_at"),
+            active_requirement_id=Subquery(active),
+            current_requirement_updated_at=F("requirement__updated_at"),
+        )
+        .filter(pk=user_id)
+        .first()
+    )
+    if snapshot is None:
+        analysis_cache.record_snapshot("rebuilt")
+        return refresh(user_id, ctx=ctx)
+
+    transcript_fresh = (
+        snapshot.aggregate_version == AGGREGATE_VERSION
+        and snapshot.latest_transcript_id == snapshot.transcript_id
+        and snapshot.current_transcript_updated_at == snapshot.transcript_updated_at
+    )
+    if not transcript_fresh or snapshot.active_requirement_id is None:
+        analysis_cache.record_snapshot("rebuilt")
+        return refresh(user_id, ctx=ctx)
+
+    requirement_fresh = (
+        snapshot.active_requirement_id == snapshot.requirement_id
+        and snapshot.current_requirement_updated_at == snapshot.requirement_updated_at
+    )
+    if requirement_fresh:
+        analysis_cache.record_snapshot("fresh")
+        if ctx:
+            ctx.seed(requirement=snapshot.requirement)
+        return {"data": _data(snapshot), "status": 200}
+
+    # 요건만 바뀜 → 저장된 집계로 재판정
+    analysis_cache.record_snapshot("rederived")
+    requirement = GraduationRequirement.objects.get(pk=snapshot.active_requirement_id)
+    if ctx:
+        ctx.seed(requirement=requirement)
+    data = _fill(snapshot, requirement, _aggregates(snapshot))
+    snapshot.save()
+    return {"data": data, "status": 200}
+
+
+def _apply_chunk(requirement: GraduationRequirement, ids: list[int]) -> int:
+    """스냅샷 묶음을 저장된 집계로 재판정 → bulk_update. 갱신한 수 반환"""
+    fields = [*DATA_FIELDS, "drbol_areas", "requirement", "requirement_updated_at", "updated_at"]
+    batch = list(GraduationSnapshot.objects.filter(pk__in=ids))
+    for snapshot in batch:
+        _fill(snapshot, requirement, _aggregates(snapshot))
+    return GraduationSnapshot.objects.bulk_update(batch, fields)
+
+
+def apply_requirement(
+    requirement: GraduationRequirement,
+    chunk_size: int | None = None,
+    workers: int = 1,
+    progress=None,
+) -> int:
+    """
+    요건 전공 학생들의 스냅샷을 저장된 집계로 chunk_size 개씩 재판정. 갱신한 수 반환
+    (집계 형식이 예전 버전인 스냅샷은 건너뜀 → 다음 read 에서 전체 재계산)
+    workers > 1 이면 묶음을 스레드로 병렬 처리 (스레드별 DB 연결은 끝나면 닫는다)
+    progress: progress(처리한 스냅샷 수, 전체 스냅샷 수) — 묶음이 끝날 때마다 호출
+    """
+    ids = list(
+        GraduationSnapshot.objects
+        .filter(user__major=requirement.major, aggregate_version=AGGREGATE_VERSION)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    size = max(1, chunk_size or UPDATE_BATCH)
+    chunks = [ids[i:i + size] for i in range(0, len(ids), size)]
+    done = count = 0
+
+    def run(chunk):
+        try:
+            return len(chunk), _apply_chunk(requirement, chunk)
+        finally:
+            if workers > 1:
+                connection.close()
+
+    if workers <= 1:
+        finished = map(run, chunks)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        finished = (f.result() for f in as_completed([pool.submit(run, c) for c in chunks]))
+    try:
+        for n, updated in finished:
+            done += n
+            count += updated
+            if progress is not None:
+                progress(done, len(ids))
+    finally:
+        if workers > 1:
+            pool.shutdown(wait=True)
+    return count
+
+
+def _course_delta(before: list[dict], after: list[dict]) -> tuple[list[dict], list[dict]]:
+    """(추가된 과목, 빠진 과목) — 같은 내용의 과목은 개수 단위로 비교"""
+    def counter(courses):
+        return Counter(json.dumps(c, sort_keys=True, ensure_ascii=False) for c in courses if c)
+
+    old, new = counter(before), counter(after)
+    added = [json.loads(k) for k, n in (new - old).items() for _ in range(n)]
+    removed = [json.loads(k) for k, n in (old - new).items() for _ in range(n)]
+    return added, removed
+
+
+def on_transcript_processed(transcript, previous: tuple[list[dict], object] | None = None) -> dict:
+    """
+    성적표 처리 완료 후 스냅샷 갱신.
+    previous: 재처리 전 (유효 과목, updated_at). 스냅샷이 바로 그 버전으로 계산돼 있으면 증감분만 반영한다.
+    """
+    snapshot = GraduationSnapshot.objects.filter(pk=transcript.user_id).first()
+    if (
+        previous is None or snapshot is None
+        or snapshot.aggregate_version != AGGREGATE_VERSION
+        or snapshot.transcript_id != transcript.pk
+        or snapshot.transcript_updated_at != previous[1]
+    ):
+        return refresh(transcript.user_id)
+
+    inputs = load_analysis_inputs(transcript.user_id)
+    if "error" in inputs or inputs["transcript"].pk != transcript.pk:
+        return refresh(transcript.user_id, inputs=inputs)
+
+    added, removed = _course_delta(previous[0], get_valid_courses(inputs["transcript"]))
+    agg = combine_aggregates(_aggregates(snapshot), aggregate_courses(added), aggregate_courses(removed))
+    return {"data": _write(transcript.user_id, inputs["transcript"], inputs["requirement"], agg), "status": 200}
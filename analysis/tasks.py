@@ -0,0 +1,21 @@
+# analysis/tasks.py
+
+from celery import shared_task
+
+from .models import GraduationRequirement
+from .warm import is_active, warm_requirement
+
+
+@shared_task
+def warm_requirement_analysis(requirement_id: int, version: str | None = None):
+    """요건 저장 후 전공 학생 스냅샷을 미리 재판정 (version: 예약 시점의 updated_at)"""
+    requirement = GraduationRequirement.objects.filter(pk=requirement_id).first()
+    if requirement is None or not is_active(requirement):
+        return None
+    # 그 사이 다시 수정됐으면 최신 저장이 예약한 태스크가 처리
+    if version is not None and requirement.updated_at.isoformat() != version:
+        return None
+
+    result = warm_requirement(requirement)
+    print(f"[분석 워밍] {requirement.major}: 스냅샷 {result['updated']}/{result['snapshots']}개 ({result['elapsed']}s)")
+    return result
@@ -1,3 +1,256 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from transcripts.courses import sync_transcript_courses
+from transcripts.models import Transcript
+from transcripts.tasks import mark_latest_transcript
+from users.models import User
+from . import snapshots
+from .graduation import compute_graduation
+from .models import GraduationRequirement, GraduationSnapshot
+from .normalize import normalize_course_name
+from .requirement_index import build_requirement_index
+from .views import build_required_missing, build_required_roadmap
+from .warm import warm_requirement
+
+
+def make_requirement(**fields) -> GraduationRequirement:
+    defaults = dict(
+        major="컴퓨터공학과", year=2021,
+        total_required=0, major_required=0, general_required=0, drbol_required=0,
+        sw_required=0, msc_required=0, special_general_required=0,
+        major_must_courses=[], general_must_courses=[], drbol_areas="",
+    )
+    return GraduationRequirement(**{**defaults, **fields})
+
+
+def course(code: str, name: str, **fields) -> dict:
+    return {
+        "code": code, "name": name, "credit": 3, "grade": "A0", "type": "전공",
+        "major_field": "", "semester": "1-1", "retake": False, **fields,
+    }
+
+
+class NormalizeCourseNameTests(TestCase):
+    def test_roman_numerals_and_spacing(self):
+        # Ⅱ 는 NFKC 에서 II 가 된다 → 같은 키, 아라비아 숫자 2 와는 구분
+        self.assertEqual(normalize_course_name("캡스톤 디자인 Ⅱ"), "캡스톤디자인ii")
+        self.assertEqual(normalize_course_name("캡스톤디자인II"), "캡스톤디자인ii")
+        self.assertNotEqual(normalize_course_name("캡스톤디자인2"), normalize_course_name("캡스톤디자인Ⅱ"))
+
+    def test_separators_brackets_and_whitespace(self):
+        self.assertEqual(normalize_course_name(" 자료 구조(실습) "), "자료구조실습")
+        self.assertEqual(normalize_course_name("운영체제·실습"), normalize_course_name("운영체제 실습"))
+        self.assertEqual(normalize_course_name("C++\t프로그래밍\n"), "c++프로그래밍")
+
+    def test_empty(self):
+        self.assertEqual(normalize_course_name(None), "")
+        self.assertEqual(normalize_course_name(""), "")
+
+
+class CourseMatcherTests(TestCase):
+    def setUp(self):
+        self.index = build_requirement_index(make_requirement(major_must_courses=[
+            {"code": "A1", "name": "컴퓨터구조", "aliases": ["컴구"]},
+            {"code": "A2", "name": "운영체제및실습"},
+            {"code": "A3", "name": "영어회화1"},
+        ]))
+        self.arch, self.os, self.english = self.index.major_must
+
+    def match(self, *courses, fuzzy=True):
+        return self.index.matcher.match(list(courses), fuzzy=fuzzy)
+
+    def test_code_before_name(self):
+        m = self.match(course("X9", "컴퓨터구조"), course("A1", "다른 과목"))
+        self.assertEqual(m[self.arch].method, "code")
+        self.assertEqual(m[self.arch].course["code"], "A1")
+
+    def test_name_before_alias(self):
+        m = self.match(course("X1", "컴구"), course("X2", "컴퓨터 구조"))
+        self.assertEqual(m[self.arch].method, "name")
+        self.assertEqual(m[self.arch].course["code"], "X2")
+
+    def test_alias(self):
+        m = self.match(course("X1", "컴구"))
+        self.assertEqual((m[self.arch].method, m[self.arch].confidence), ("alias", 1.0))
+
+    def test_fuzzy_within_threshold(self):
+        m = self.match(course("X1", "운영채제및실습"))  # 한 글자 오인식: 1 - 1/7
+        self.assertEqual(m[self.os].method, "fuzzy")
+        self.assertAlmostEqual(m[self.os].confidence, 0.857)
+
+    def test_fuzzy_only_on_request(self):
+        self.assertNotIn(self.os, self.match(course("X1", "운영채제및실습"), fuzzy=False))
+
+    def test_fuzzy_below_threshold(self):
+        self.assertNotIn(self.os, self.match(course("X1", "운영채재및실숩")))  # 세 글자
+
+    @override_settings(COURSE_MATCH_MIN_CONFIDENCE=0.9)
+    def test_fuzzy_threshold_setting(self):
+        self.assertNotIn(self.os, self.match(course("X1", "운영채제및실습")))
+
+    def test_fuzzy_keeps_course_numbers_apart(self):
+        self.assertNotIn(self.english, self.match(course("X1", "영어회화2")))
+
+    def test_duplicates_and_order_do_not_change_result(self):
+        courses = [course("X1", "운영채제및실습"), course("X2", "컴구"), course("X1", "운영채제및실습")]
+        self.assertEqual(set(self.match(*courses)), set(self.match(*reversed(courses))))
+
+
+class FuzzyVerdictTests(TestCase):
+    """유사 이름은 이수 판정에 쓰지 않고 확인용으로만 보여준다 — 컴퓨터구조론(0.833)은 컴퓨터구조가 아니다"""
+
+    def setUp(self):
+        self.requirement = make_requirement(major_must_courses=[{"code": "A1", "name": "컴퓨터구조", "semester": "2-1"}])
+        self.courses = [course("B7", "컴퓨터구조론", semester="2-1")]
+
+    def test_similar_course_is_a_candidate_only(self):
+        index = build_requirement_index(self.requirement)
+        m = index.matcher.match(self.courses, fuzzy=True)[index.major_must[0]]
+        self.assertEqual((m.method, m.confidence), ("fuzzy", 0.833))
+        self.assertEqual(index.matcher.match(self.courses), {})
+
+    def test_graduation_status_keeps_it_missing(self):
+        data = compute_graduation(self.courses, self.requirement)
+        self.assertEqual(data["missing_major_courses"], {"2-1": [{"code": "A1", "name": "컴퓨터구조"}]})
+
+    def test_required_missing_lists_inferred_match(self):
+        data = build_required_missing(self.courses, self.requirement)
+        self.assertEqual(data["major_required_missing"], [{"code": "A1", "name": "컴퓨터구조", "semester": "2-1"}])
+        self.assertEqual(
+            [(i["code"], i["matched_name"], i["match"]) for i in data["inferred_matches"]],
+            [("A1", "컴퓨터구조론", "fuzzy")],
+        )
+        roadmap = build_required_roadmap(self.courses, self.requirement)["major_required_roadmap"][0]
+        self.assertEqual((roadmap["completed"], roadmap["match"], roadmap["taken_semester"]), (False, "fuzzy", None))
+
+
+class GraduationSnapshotTests(TestCase):
+    def setUp(self):
+        self.requirement = make_requirement(major_must_courses=[
+            {"code": "A1", "name": "컴퓨터구조", "aliases": ["컴구"], "semester": "2-1"},
+        ])
+        self.requirement.save()
+        self.user = User.objects.create(student_id="C000001", username="C000001", full_name="홍길동", major="컴퓨터공학과")
+        self.transcript = Transcript.objects.create(
+            user=self.user, file="transcripts/x.png", status=Transcript.STATUS.done,
+            parsed_data={"courses": [course("B9", "컴구", semester="2-1")]},
+        )
+        mark_latest_transcript(self.transcript)
+
+    def missing(self) -> dict:
+        return snapshots.read(self.user.id)["data"]["missing_major_courses"]
+
+    def test_alias_counts_as_completed(self):
+        self.assertEqual(self.missing(), {})
+        self.assertEqual(GraduationSnapshot.objects.get(pk=self.user.id).missing_major_courses, {})
+
+    def test_requirement_update_recomputes(self):
+        self.missing()
+        self.requirement.major_must_courses = [*self.requirement.major_must_courses, {"code": "A2", "name": "운영체제"}]
+        self.requirement.save()
+        self.assertEqual(self.missing(), {"기타": [{"code": "A2", "name": "운영체제"}]})
+
+    def test_transcript_update_recomputes(self):
+        self.missing()
+        self.transcript.parsed_data = {"courses": [course("B8", "자료구조")]}
+        self.transcript.save()
+        self.assertEqual(self.missing(), {"2-1": [{"code": "A1", "name": "컴퓨터구조"}]})
+
+    def test_old_aggregate_version_recomputes(self):
+        self.missing()
+        GraduationSnapshot.objects.filter(pk=self.user.id).update(aggregate_version=0, missing_major_courses={"x": []})
+        self.assertEqual(self.missing(), {})
+
+    def test_warm_requirement_rederives_in_chunks(self):
+        other = User.objects.create(student_id="C000002", username="C000002", full_name="김철수", major="컴퓨터공학과")
+        mark_latest_transcript(Transcript.objects.create(
+            user=other, file="transcripts/y.png", status=Transcript.STATUS.done,
+            parsed_data={"courses": [course("A1", "컴퓨터구조", semester="2-1")]},
+        ))
+        self.missing()
+        snapshots.read(other.id)
+
+        self.requirement.major_must_courses = [*self.requirement.major_must_courses, {"code": "A2", "name": "운영체제"}]
+        self.requirement.save()
+        seen = []
+        result = warm_requirement(self.requirement, chunk_size=1, progress=lambda done, total: seen.append((done, total)))
+
+        self.assertEqual(seen, [(1, 2), (2, 2)])
+        self.assertEqual((result["snapshots"], result["updated"]), (2, 2))
+        for snapshot in GraduationSnapshot.objects.all():
+            self.assertEqual(snapshot.requirement_updated_at, self.requirement.updated_at)
+            self.assertEqual(snapshot.missing_major_courses, {"기타": [{"code": "A2", "name": "운영체제"}]})
+
+    def test_reads_are_counted_in_cache_stats(self):
+        cache.clear()
+        self.missing()
+        self.missing()
+        self.requirement.drbol_required = 18
+        self.requirement.save()
+        self.missing()
+
+        admin = User.objects.create(student_id="A000001", username="A000001", full_name="관리자", is_staff=True)
+        client = APIClient()
+        client.force_authenticate(admin)
+        stats = client.get("/api/analysis/cache/stats/").data
+        self.assertEqual(stats["snapshot"], {"fresh": 1, "rederived": 1, "rebuilt": 1})
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+
+class DashboardParityTests(TestCase):
+    """대시보드 섹션 == 개별 엔드포인트 (같은 스냅샷 / 같은 섹션 빌더)"""
+
+    SECTIONS = {
+        "total": "credit/total", "major": "credit/major", "general": "credit/general",
+        "statistics": "credit/statistics", "status": "credit/status", "required_missing": "required/missing",
+        "dvbol_missing": "dvbol/missing", "required_roadmap": "required/roadmap",
+    }
+
+    def setUp(self):
+        make_requirement(
+            total_required=130, major_required=60, general_required=30, drbol_required=6,
+            major_must_courses=[
+                {"code": "A1", "name": "컴퓨터구조", "aliases": ["컴구"], "semester": "2-1"},
+                {"code": "A2", "name": "운영체제", "semester": "3-1"},
+            ],
+            general_must_courses=[{"code": "G1", "name": "글쓰기"}],
+            drbol_areas="사회와문화,예술과체육",
+        ).save()
+        self.user = User.objects.create(student_id="C000001", username="C000001", full_name="홍길동", major="컴퓨터공학과")
+        self.transcript = Transcript.objects.create(
+            user=self.user, file="transcripts/x.png", status=Transcript.STATUS.done,
+            parsed_data={"courses": [
+                course("B9", "컴구", semester="2-1"),
+                course("X1", "자료구조", credit=3, grade="F"),
+                course("G1", "글쓰기", type="교양", major_field="교양필수", credit=2),
+                course("D1", "경제학의 이해", type="드볼", major_field="사회와문화", grade="P"),
+                course("X2", "알고리즘", retake=True, grade="B+"),
+                course("L1", "물리실험", type="MSC", credit=1.5),
+            ]},
+        )
+        mark_latest_transcript(self.transcript)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assert_parity(self):
+        uid = self.user.id
+        dashboard = self.client.get(f"/api/analysis/dashboard/{uid}/").data
+        for section, path in self.SECTIONS.items():
+            with self.subTest(section=section):
+                self.assertEqual(dashboard[section], self.client.get(f"/api/analysis/{path}/{uid}/").data)
+
+    def test_parsed_data(self):
+        self.assert_parity()
+
+    def test_synced_courses(self):
+        sync_transcript_courses(self.transcript)
+        self.assert_parity()
+
+    def test_after_requirement_change(self):
+        self.assert_parity()
+        GraduationRequirement.objects.filter(major="컴퓨터공학과").update(major_required=10)
+        requirement = GraduationRequirement.objects.get(major="컴퓨터공학과")
+        requirement.save()
+        self.assert_parity()
@@ -11,6 +11,9 @@ from .views import (
     RequiredMissingView,
     DrbolMissingView,
     RequiredRoadmapView,
+    AnalysisCacheStatsView,
+    CohortAuditView,
+    DashboardView,
 )
 
 urlpatterns = [
@@ -31,4 +34,12 @@ urlpatterns = [
     path('required/missing/<int:user_id>/',  RequiredMissingView.as_view()),
     path('dvbol/missing/<int:user_id>/',     DrbolMissingView.as_view()),
     path('required/roadmap/<int:user_id>/',  RequiredRoadmapView.as_view()),
+
+    # ✅ 대시보드: 위 섹션들을 한 번에 (?sections=total,major,...)
+    path('dashboard/<int:user_id>/',         DashboardView.as_view()),
+
+    # 운영: 분석 캐시 적중률
+    path('cache/stats/',                     AnalysisCacheStatsView.as_view()),
+    # 운영: 전공 단위 일괄 감사 (?major=)
+    path('audit/',                           CohortAuditView.as_view()),
 ]
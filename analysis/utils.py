@@ -0,0 +1,40 @@
+# analysis/utils.py
+"""과목명 정규화 / parsed_data 추출 등 analysis·semesters 공용 헬퍼"""
+from .normalize import normalize_course_name
+
+# 기존 호출부 호환용 별칭
+_norm = normalize_course_name
+
+def get_courses_from_parsed_data(parsed) -> list[dict]:
+    """
+    parsed_data 형태 안전하게 추출:
+    - 권장: {"courses":[{...}], "raw_rows": [...], "parser_version": ...} (transcripts.parser)
+    - 과거: [{...}]
+    - 파서 도입 전 OCR 행([[...]])은 과목이 아니므로 건너뜀 (reparse_transcripts 로 변환)
+    """
+    if not parsed:
+        return []
+    if isinstance(parsed, dict):
+        return parsed.get("courses", []) or []
+    if isinstance(parsed, list):
+        return [c for c in parsed if isinstance(c, dict)]
+    return []
+
+def get_valid_courses(transcript) -> list[dict]:
+    """F 성적 및 재수강 제외"""
+    all_courses = get_courses_from_parsed_data(transcript.parsed_data)
+    return [
+        c for c in all_courses
+        if c and (c.get("grade") != "F") and (not c.get("retake", False))
+    ]
+
+def distribute(total: int, n: int) -> list[int]:
+    """총합을 n개로 최대한 고르게 분배 (드볼 영역 요구학점 추정용)"""
+    if n <= 0:
+        return []
+    base = total // n
+    rem = total % n
+    arr = [base] * n
+    for i in range(rem):
+        arr[i] += 1
+    return arr
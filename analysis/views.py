@@ -1,234 +1,187 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from transcripts.models import Transcript
-from users.models import User
+from transcripts.models import Transcript, TranscriptCourse
 from .models import GraduationRequirement
 from .serializers import GraduationStatusSerializer
-
-import re
-import unicodedata
+from . import cache as analysis_cache
+from . import snapshots
+from .aggregation import general_credit_rules
+from .context import AnalysisContext, for_request
+from .bulk import audit_major
+from .graduation import load_analysis_inputs
+from .requirement_index import get_requirement_index
+from .utils import get_courses_from_parsed_data, get_valid_courses
 
 
 # ---------------------------
-# 유틸/공통
+# 핵심 분석 함수
 # ---------------------------
-ROMAN = {"Ⅰ": "1", "Ⅱ": "2", "Ⅲ": "3", "Ⅳ": "4", "Ⅴ": "5",
-         "Ⅵ": "6", "Ⅶ": "7", "Ⅷ": "8", "Ⅸ": "9"}
-
-def _norm(s: str | None) -> str:
-    if not s:
-        return ""
-    s = unicodedata.normalize("NFKC", str(s)).strip().lower()
-    for k, v in ROMAN.items():
-        s = s.replace(k, v)
-    s = re.sub(r"[·ㆍ\.\-_/]", "", s)
-    s = re.sub(r"[\(\)\[\]\{\}\s]+", "", s)
-    return s
-
-def course_key_from_dict(d: dict) -> str:
-    """비교 키: code 우선, 없으면 정규화된 name"""
-    code = (d.get("code") or "").strip()
-    if code:
-        return code
-    return _norm(d.get("name", ""))
-
-def get_courses_from_parsed_data(parsed) -> list[dict]:
+def analyze_graduation(user_id: int, ctx: AnalysisContext | None = None):
     """
-    parsed_data 형태 안전하게 추출:
-    - 권장: {"courses":[{...}]}
-    - 과거: [{...}]
+    졸업 판정 결과 — GraduationSnapshot 에서 읽는다 (기본키 조회 1회, 오래됐으면 갱신)
+    개별 분석 뷰와 대시보드가 모두 이 경로를 쓰므로 같은 사용자에 대해 항상 같은 값을 낸다.
+    ctx: 요청 단위 입력 (analysis.context.for_request) — 뷰에서 User / 졸업요건을 다시 조회하지 않도록 공유
     """
-    if not parsed:
-        return []
-    if isinstance(parsed, dict):
-        return parsed.get("courses", []) or []
-    if isinstance(parsed, list):
-        return parsed
-    return []
-
-def get_valid_courses(transcript: Transcript) -> list[dict]:
-    """F 성적 및 재수강 제외"""
-    all_courses = get_courses_from_parsed_data(transcript.parsed_data)
-    return [
-        c for c in all_courses
-        if c and (c.get("grade") != "F") and (not c.get("retake", False))
-    ]
-
-def distribute(total: int, n: int) -> list[int]:
-    """총합을 n개로 최대한 고르게 분배 (드볼 영역 요구학점 추정용)"""
-    if n <= 0:
-        return []
-    base = total // n
-    rem = total % n
-    arr = [base] * n
-    for i in range(rem):
-        arr[i] += 1
-    return arr
+    return snapshots.read(user_id, ctx)
 
 
 # ---------------------------
-# 핵심 분석 함수
+# 섹션 빌더 (개별 View / 대시보드 공용, DB 접근 없음)
 # ---------------------------
-def analyze_graduation(user_id: int):
-    # 1) 유저
-    user = User.objects.filter(id=user_id).first()
-    if not user:
-        return {"error": "사용자를 찾을 수 없습니다.", "status": 404}
-
-    # 2) 성적표
-    transcript = Transcript.objects.filter(user_id=user_id).order_by("-created_at").first()
-    if not transcript or not transcript.parsed_data:
-        return {"error": "성적표 데이터가 없습니다.", "status": 404}
-
-    courses = get_valid_courses(transcript)
-
-    # 3) 졸업요건 (입학년도 미사용: 전공으로만 매칭)
-    requirement = GraduationRequirement.objects.filter(major=user.major).first()
-    if not requirement:
-        return {"error": "졸업 요건 데이터가 없습니다.", "status": 500}
-
-    # 학점 합산
-    total_credit = sum(c.get("credit", 0) for c in courses)
-    major_credit = sum(c.get("credit", 0) for c in courses if "전공" in (c.get("type") or ""))
-    general_credit = sum(c.get("credit", 0) for c in courses if "교양" in (c.get("type") or ""))
-    drbol_credit = sum(c.get("credit", 0) for c in courses if "드볼" in (c.get("type") or ""))
-    sw_credit = sum(c.get("credit", 0) for c in courses if ("sw" in (c.get("type") or "").lower() or "데이터활용" in (c.get("type") or "")))
-    msc_credit = sum(c.get("credit", 0) for c in courses if "msc" in (c.get("type") or "").lower())
-    special_general_credit = sum(c.get("credit", 0) for c in courses if "특성화교양" in (c.get("major_field") or ""))
-
-    # 전공필수 미이수 (학기별 dict)
-    must_list: list[dict] = requirement.major_must_courses or []
-    completed_keys = {course_key_from_dict(c) for c in courses if c}
-    missing_by_semester: dict[str, list[dict]] = {}
-    for item in must_list:
-        key = course_key_from_dict(item)
-        if key in completed_keys:
-            continue
-        sem = item.get("semester") or "기타"
-        missing_by_semester.setdefault(sem, []).append({
-            "code": item.get("code", "") or "",
-            "name": item.get("name", "") or ""
-        })
-    # ---------- 드볼: 7개 영역 중 서로 다른 6개 영역 + 총 18학점(예외: 17학점 + 2학점 영역 1개) ----------
-    drbol_areas = [a.strip() for a in (requirement.drbol_areas or "").split(",") if a.strip()]
-    required_areas_count = min(6, len(drbol_areas))  # 규칙: 7개 중 6개
-
-    # 영역별 수강 과목 수/학점
-    area_course_count = {a: 0 for a in drbol_areas}
-    area_credits = {a: 0 for a in drbol_areas}
-    total_dvbol_credit = 0
+def build_statistics(data: dict) -> dict:
+    general_rate = data["general_completed"] / data["general_required"] if data["general_required"] else 0
+    major_rate = data["major_completed"] / data["major_required"] if data["major_required"] else 0
+    return {"general_rate": general_rate, "major_rate": major_rate}
+
+
+def build_general_credit(transcript: Transcript, requirement: GraduationRequirement | None) -> dict:
+    """교양 학점: 타입(교양/드볼/특성화교양) 또는 영역(교양필수/교양선택/드볼 영역명) 기준"""
+    # 졸업요건에서 드볼 영역명 리스트 가져오기
+    drbol_areas = get_requirement_index(requirement).drbol_areas if requirement else ()
+    rules = general_credit_rules(drbol_areas)
+
+    # 0 이하 학점은 더하지 않음
+    if transcript.courses_synced:  # 적재분: (type, major_field) 별 SQL 합계에 규칙 적용
+        groups = TranscriptCourse.objects.filter(transcript=transcript, credit__gt=0).credit_totals("type", "major_field")
+        return rules.totals(groups, credit=lambda g: g["total_credit"])
+    courses = get_courses_from_parsed_data(transcript.parsed_data)
+    return rules.totals(courses, credit=lambda c: max(0, int(c.get("credit") or 0)))
+
+
+def build_required_missing(courses: list[dict], requirement: GraduationRequirement) -> dict:
+    index = get_requirement_index(requirement)
+    # 코드 → 정규화 이름 → 별칭 순으로 이수 판정, 유사 이름(OCR 오인식 후보)은 확인용
+    matches = index.matcher.match(courses, fuzzy=True)
+    completed = {i for i, m in matches.items() if m.method != "fuzzy"}
+
+    major_missing = [
+        {**i.as_dict(), "semester": i.semester or "기타"}
+        for i in index.major_must
+        if i not in completed
+    ]
 
-    for c in courses:
-        mf = (c.get("major_field") or "").strip()
-        if mf in area_course_count:
-            area_course_count[mf] += 1
-            area_credits[mf] += int(c.get("credit") or 0)
-            total_dvbol_credit += int(c.get("credit") or 0)
+    general_missing = [
+        i.as_dict()
+        for i in index.general_must
+        if i not in completed
+    ]
+
+    # 유사 이름으로만 이어진 항목 (미이수로 두고 신뢰도와 함께 확인용으로 표시)
+    inferred = [
+        {**i.as_dict(), **matches[i].as_dict()}
+        for i in index.major_must + index.general_must
+        if i in matches and i not in completed
+    ]
+
+    return {
+        "major_required_missing": major_missing,
+        "general_required_missing": general_missing,
+        "inferred_matches": inferred,
+    }
 
-    # 커버한/미커버 영역
-    covered_areas = [a for a, cnt in area_course_count.items() if cnt >= 1]
-    covered_count = len(covered_areas)
-    missing_drbol_areas = [a for a in drbol_areas if area_course_count.get(a, 0) == 0]
 
-    # 17학점 예외: "총 17학점" 이고 "커버 영역 중 적어도 한 영역의 합계가 2학점"이면 OK
-    has_two_credit_area = any(area_credits.get(a, 0) == 2 for a in covered_areas)
+def build_drbol_missing(courses: list[dict], requirement: GraduationRequirement) -> dict:
+    # 기준들
+    areas = get_requirement_index(requirement).drbol_areas
+    required_credit_total = requirement.drbol_required  # 18
 
-    coverage_ok = covered_count >= required_areas_count
-    credit_ok = (total_dvbol_credit >= 18) or (total_dvbol_credit == 17 and has_two_credit_area)
+    # 수강 현황 집계
+    area_course_count = {a: 0 for a in areas}
+    area_credit_sum   = {a: 0 for a in areas}
+    for c in courses:
+        credit = c.get("credit", 0) or 0
+        mf = c.get("major_field") or ""
+        if mf in area_course_count:
+            area_course_count[mf] += 1
+            area_credit_sum[mf]   += credit
 
-    # 응답용 보조 값들
-    areas_remaining = max(required_areas_count - covered_count, 0)
-    credit_required = 18 if total_dvbol_credit < 18 else 18  # 표시는 18으로 고정
-    credit_remaining = max(0, 18 - total_dvbol_credit) if not (total_dvbol_credit == 17 and has_two_credit_area) else 0
+    covered_areas = [a for a in areas if area_course_count[a] >= 1]
+    missing_areas = [a for a in areas if area_course_count[a] == 0]
 
-    # 영역별 상세(프런트 시각화용)
-    areas_detail = [
+    # 영역별 상세 rows (프론트 시각화 용)
+    rows = [
         {
             "area": a,
             "covered": area_course_count[a] >= 1,
             "courses_count": area_course_count[a],
-            "completed_credit": area_credits[a],
+            "completed_credit": int(area_credit_sum[a]),
         }
-        for a in drbol_areas
+        for a in areas
     ]
 
-    dvbol_result = {
-        "areas": areas_detail,
+    # 총 드볼 학점은 '드볼' 타입 문자열에 의존하지 말고, 영역합으로 계산(더 안전)
+    drbol_credit_total = int(sum(area_credit_sum.values()))
+
+    # 커버리지/학점 충족 판단
+    required_areas_count = min(6, len(areas))  # 7개 정의돼도 규칙은 6개 커버
+    coverage_ok = len(covered_areas) >= required_areas_count
+
+    # 17학점 예외: 총 17학점이고, '커버된 영역' 중 적어도 하나의 합계가 2학점인 경우
+    has_two_credit_area = any(area_credit_sum[a] == 2 for a in covered_areas)
+    credit_ok = (drbol_credit_total >= required_credit_total) or (
+        drbol_credit_total == 17 and has_two_credit_area
+    )
+
+    # 남은 커버 수/학점(예외 충족 시 학점 잔여 0으로 표기)
+    areas_remaining = max(0, required_areas_count - len(covered_areas))
+    credit_remaining = 0 if (drbol_credit_total == 17 and has_two_credit_area) \
+        else max(0, required_credit_total - drbol_credit_total)
+
+    return {
+        "areas": rows,
         "areas_required": required_areas_count,
-        "areas_covered": covered_count,
+        "areas_covered": len(covered_areas),
         "areas_remaining": areas_remaining,
-        "missing_areas": missing_drbol_areas,
-        "total_credit_completed": total_dvbol_credit,
-        "total_credit_required": 18,
+        "missing_areas": missing_areas,
+
+        "total_credit_completed": drbol_credit_total,
+        "total_credit_required": required_credit_total,   # 보통 18
         "credit_remaining": credit_remaining,
+
+        # 판단 플래그 + 최종 판정도 같이 내려주면 Postman에서 보기 편함
         "coverage_ok": coverage_ok,
         "credit_ok": credit_ok,
-        "status": coverage_ok and credit_ok,  # 최종 판정
+        "status": (coverage_ok and credit_ok)
     }
 
-    # ---------- 상태 판정 ----------
-    status_flag = "complete"
-    messages = []
-    if total_credit < requirement.total_required:
-        status_flag = "pending"; messages.append(f"총 학점 {requirement.total_required - total_credit}학점 부족")
-    if major_credit < requirement.major_required:
-        status_flag = "pending"; messages.append(f"전공 {requirement.major_required - major_credit}학점 부족")
-    if general_credit < requirement.general_required:
-        status_flag = "pending"; messages.append(f"교양필수 {requirement.general_required - general_credit}학점 부족")
-
-    # ✅ 드볼: 총 학점(≥ 요구치) + 커버리지(서로 다른 영역 6개)
-    if drbol_credit < requirement.drbol_required or covered_count < required_areas_count:
-        status_flag = "pending"
-        msg_parts = []
-        if drbol_credit < requirement.drbol_required:
-            msg_parts.append(f"드볼 학점 {requirement.drbol_required - drbol_credit}학점 부족")
-        if covered_count < required_areas_count:
-            msg_parts.append(f"드볼 영역 {covered_count}/{required_areas_count}")
-        messages.append(" / ".join(msg_parts))
-
-    if sw_credit < requirement.sw_required:
-        status_flag = "pending"; messages.append(f"SW/데이터활용 {requirement.sw_required - sw_credit}학점 부족")
-    if msc_credit < requirement.msc_required:
-        status_flag = "pending"; messages.append(f"MSC {requirement.msc_required - msc_credit}학점 부족")
-    if special_general_credit < requirement.special_general_required:
-        status_flag = "pending"; messages.append(f"특성화교양 {requirement.special_general_required - special_general_credit}학점 부족")
-    if any(missing_by_semester.values()):
-        status_flag = "pending"; messages.append("전공 필수 미이수 존재")
-
-    message = " / ".join(messages) if messages else "졸업 요건 충족"
-
-    data = {
-        "total_completed": total_credit,
-        "total_required": requirement.total_required,
-
-        "major_completed": major_credit,
-        "major_required": requirement.major_required,
-
-        "general_completed": general_credit,
-        "general_required": requirement.general_required,
-
-        "drbol_completed": drbol_credit,
-        "drbol_required": requirement.drbol_required,
-
-        "sw_completed": sw_credit,
-        "sw_required": requirement.sw_required,
-
-        "msc_completed": msc_credit,
-        "msc_required": requirement.msc_required,
-
-        "special_general_completed": special_general_credit,
-        "special_general_required": requirement.special_general_required,
-
-        # ✅ Serializer가 기대하는 형태 유지
-        "missing_major_courses": missing_by_semester,
-        "missing_drbol_areas": missing_drbol_areas,  # 이제 '모든 영역'이 아니라 '아직 0과목인 영역' 목록
-
-        "graduation_status": status_flag,
-        "message": message,
+
+def build_required_roadmap(courses: list[dict], requirement: GraduationRequirement) -> dict:
+    index = get_requirement_index(requirement)
+    matches = index.matcher.match(courses, fuzzy=True)
+
+    def build(items) -> list[dict]:
+        rows = []
+        for it in items:
+            m = matches.get(it)
+            completed = m is not None and m.method != "fuzzy"  # 유사 이름은 후보로만 표시
+            rows.append({
+                **it.as_dict(),
+                "planned_semester": it.semester,
+                "completed": completed,
+                "taken_semester": (m.course.get("semester") or None) if completed else None,
+                "match": m.method if m else None,
+                "confidence": m.confidence if m else 0.0,
+            })
+        return rows
+
+    return {
+        "major_required_roadmap": build(index.major_must),
+        "general_required_roadmap": build(index.general_must)
     }
-    return {"data": data, "status": 200}
 
 
+# 대시보드 섹션: 이름 → ctx(data, courses, user, transcript, requirement) 를 받아 응답 조각 생성
+DASHBOARD_SECTIONS = {
+    "total":            lambda ctx: {"total_credit": ctx["data"]["total_completed"]},
+    "major":            lambda ctx: {"major_credit": ctx["data"]["major_completed"]},
+    "general":          lambda ctx: build_general_credit(ctx["transcript"], ctx["requirement"]),
+    "statistics":       lambda ctx: build_statistics(ctx["data"]),
+    "status":           lambda ctx: ctx["data"],
+    "required_missing": lambda ctx: build_required_missing(ctx["courses"], ctx["requirement"]),
+    "dvbol_missing":    lambda ctx: build_drbol_missing(ctx["courses"], ctx["requirement"]),
+    "required_roadmap": lambda ctx: build_required_roadmap(ctx["courses"], ctx["requirement"]),
+}
+
 
 # ---------------------------
 # View 클래스들 (기존 1~7 유지)
@@ -237,14 +190,14 @@ class GeneralCoursesView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        result = analyze_graduation(user_id)
+        ctx = for_request(request, user_id)
+        result = analyze_graduation(user_id, ctx=ctx)
         if "error" in result:
             return Response({"error": result["error"]}, status=result["status"])
 
         # 실제 필수 교양 목록은 DB에서 code/name으로 꺼내는 게 맞지만,
-        # 현재 모델상 general_must_courses에 저장되어 있으면 해당 값 사용
-        user = User.objects.filter(id=user_id).first()
-        req = GraduationRequirement.objects.filter(major=user.major).first() if user else None
+        # 현재 모델상 general_must_courses에 저장되어 있으면 해당 값 사용 (분석 때 읽은 요건 재사용)
+        req = ctx.requirement
         general_must = [{"code": i.get("code",""), "name": i.get("name","")} for i in (req.general_must_courses or [])] if req else []
 
         data = result["data"]
@@ -258,7 +211,7 @@ class MajorCoursesView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        result = analyze_graduation(user_id)
+        result = analyze_graduation(user_id, ctx=for_request(request, user_id))
         if "error" in result:
             return Response({"error": result["error"]}, status=result["status"])
 
@@ -280,7 +233,7 @@ class TotalCreditView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        result = analyze_graduation(user_id)
+        result = analyze_graduation(user_id, ctx=for_request(request, user_id))
         if "error" in result:
             return Response({"error": result["error"]}, status=result["status"])
         return Response({"total_credit": result["data"]["total_completed"]})
@@ -290,42 +243,22 @@ class GeneralCreditView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        user = User.objects.filter(id=user_id).first()
-        if not user:
+        ctx = for_request(request, user_id)
+        if not ctx.user:
             return Response({"error": "사용자를 찾을 수 없습니다."}, status=404)
 
-        transcript = Transcript.objects.filter(user_id=user_id).order_by("-created_at").first()
+        transcript = ctx.transcript
         if not transcript or not transcript.parsed_data:
             return Response({"general_credit": 0}, status=200)
 
-        # 졸업요건에서 드볼 영역명 리스트 가져오기
-        req = GraduationRequirement.objects.filter(major=user.major).first()
-        drbol_areas = []
-        if req and req.drbol_areas:
-            drbol_areas = [a.strip() for a in req.drbol_areas.split(",") if a.strip()]
-
-        courses = transcript.parsed_data.get("courses", [])
-        general_credit = 0
-
-        for c in courses:
-            ctype  = (c.get("type") or "").strip()                # 예: 교양 / 드볼 / 특성화교양 / 전공
-            mfield = (c.get("major_field") or "").strip()         # 예: 교양필수 / 교양선택 / 드볼 영역명 등
-            credit = int(c.get("credit") or 0)
-
-            is_general_type  = ctype in {"교양", "드볼", "특성화교양"}
-            is_general_field = mfield in {"교양필수", "교양선택", "특성화교양"} or mfield in drbol_areas
-
-            if credit > 0 and (is_general_type or is_general_field):
-                general_credit += credit
-
-        return Response({"general_credit": general_credit}, status=200)
+        return Response(build_general_credit(transcript, ctx.requirement), status=200)
 
 
 class MajorCreditView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        result = analyze_graduation(user_id)
+        result = analyze_graduation(user_id, ctx=for_request(request, user_id))
         if "error" in result:
             return Response({"error": result["error"]}, status=result["status"])
         return Response({"major_credit": result["data"]["major_completed"]})
@@ -335,13 +268,10 @@ class StatisticsCreditView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        result = analyze_graduation(user_id)
+        result = analyze_graduation(user_id, ctx=for_request(request, user_id))
         if "error" in result:
             return Response({"error": result["error"]}, status=result["status"])
-        d = result["data"]
-        general_rate = d["general_completed"] / d["general_required"] if d["general_required"] else 0
-        major_rate = d["major_completed"] / d["major_required"] if d["major_required"] else 0
-        return Response({"general_rate": general_rate, "major_rate": major_rate})
+        return Response(build_statistics(result["data"]))
 
 
 class StatusCreditView(generics.RetrieveAPIView):
@@ -349,12 +279,38 @@ class StatusCreditView(generics.RetrieveAPIView):
     serializer_class = GraduationStatusSerializer
 
     def get(self, request, user_id):
-        result = analyze_graduation(user_id)
+        result = analyze_graduation(user_id, ctx=for_request(request, user_id))
         if "error" in result:
             return Response({"error": result["error"]}, status=result["status"])
         return Response(result["data"], status=status.HTTP_200_OK)
 
 
+# ---------------------------
+# 분석 캐시 적중률 (운영 모니터링용)
+# ---------------------------
+class AnalysisCacheStatsView(generics.RetrieveAPIView):
+    """분석 결과 적중률 — 분석 뷰(대시보드 포함)의 스냅샷 읽기 fresh / rederived / rebuilt"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(analysis_cache.get_stats(), status=status.HTTP_200_OK)
+
+
+class CohortAuditView(generics.RetrieveAPIView):
+    """전공 학생 전체 일괄 감사 (?major=학과명)"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        major = request.query_params.get("major")
+        if not major:
+            return Response({"error": "major 파라미터가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = audit_major(major)
+        if "error" in result:
+            return Response({"error": result["error"]}, status=result["status"])
+        return Response({**result, "count": len(result["results"])}, status=status.HTTP_200_OK)
+
+
 # ---------------------------
 # ✅ 추가 8) 전체 필수 미이수 (major/general)
 # ---------------------------
@@ -362,43 +318,11 @@ class RequiredMissingView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        # 공통
-        user = User.objects.filter(id=user_id).first()
-        if not user:
-            return Response({"error": "사용자를 찾을 수 없습니다."}, status=404)
-        transcript = Transcript.objects.filter(user_id=user_id).order_by("-created_at").first()
-        if not transcript or not transcript.parsed_data:
-            return Response({"error": "성적표 데이터가 없습니다."}, status=404)
-        requirement = GraduationRequirement.objects.filter(major=user.major).first()
-        if not requirement:
-            return Response({"error": "졸업 요건 데이터가 없습니다."}, status=500)
-
-        courses = get_valid_courses(transcript)
-        completed_by_code = { (c.get("code") or "").strip() for c in courses if (c.get("code") or "").strip() }
-        completed_by_name = { _norm(c.get("name")) for c in courses if c.get("name") }
-
-        def is_completed(item: dict) -> bool:
-            code = (item.get("code") or "").strip()
-            if code:
-                return code in completed_by_code
-            return _norm(item.get("name")) in completed_by_name
-
-        major_missing = [
-            {"code": i.get("code","") or "", "name": i.get("name","") or "", "semester": (i.get("semester") or "기타")}
-            for i in (requirement.major_must_courses or [])
-            if not is_completed(i)
-        ]
-
-        general_missing = [
-            {"code": i.get("code","") or "", "name": i.get("name","") or ""}
-            for i in (requirement.general_must_courses or [])
-            if not is_completed(i)
-        ]
-
-        return Response({
-            "major_required_missing": major_missing,
-            "general_required_missing": general_missing
-        }, status=status.HTTP_200_OK)
+        inputs = load_analysis_inputs(user_id, for_request(request, user_id))
+        if "error" in inputs:
+            return Response({"error": inputs["error"]}, status=inputs["status"])
+        courses = get_valid_courses(inputs["transcript"])
+        return Response(build_required_missing(courses, inputs["requirement"]), status=status.HTTP_200_OK)
 
 
 # ---------------------------
@@ -408,84 +332,11 @@ class DrbolMissingView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        user = User.objects.filter(id=user_id).first()
-        if not user:
-            return Response({"error": "사용자를 찾을 수 없습니다."}, status=404)
-        transcript = Transcript.objects.filter(user_id=user_id).order_by("-created_at").first()
-        if not transcript or not transcript.parsed_data:
-            return Response({"error": "성적표 데이터가 없습니다."}, status=404)
-        requirement = GraduationRequirement.objects.filter(major=user.major).first()
-        if not requirement:
-            return Response({"error": "졸업 요건 데이터가 없습니다."}, status=500)
-
-        # 기준들
-        areas = [a.strip() for a in (requirement.drbol_areas or "").split(",") if a.strip()]
-        required_areas_count = 6                  # 규칙: 7개 중 6개 영역 커버
-        required_credit_total = requirement.drbol_required  # 18
-
-        # 수강 현황 집계
-        courses = get_valid_courses(transcript)
-        area_course_count = {a: 0 for a in areas}
-        area_credit_sum   = {a: 0 for a in areas}
-        drbol_credit_total = 0
-        for c in courses:
-            credit = c.get("credit", 0) or 0
-            if "드볼" in (c.get("type") or ""):
-                drbol_credit_total += credit
-            mf = c.get("major_field") or ""
-            if mf in area_course_count:
-                area_course_count[mf] += 1
-                area_credit_sum[mf]   += credit
-
-        covered_areas = [a for a in areas if area_course_count[a] >= 1]
-        missing_areas = [a for a in areas if area_course_count[a] == 0]
-
-        # 영역별 상세 rows (프론트 시각화 용)
-        rows = [
-            {
-                "area": a,
-                "covered": area_course_count[a] >= 1,
-                "courses_count": area_course_count[a],
-                "completed_credit": int(area_credit_sum[a]),
-            }
-            for a in areas
-        ]
-
-        # 총 드볼 학점은 '드볼' 타입 문자열에 의존하지 말고, 영역합으로 계산(더 안전)
-        drbol_credit_total = int(sum(area_credit_sum.values()))
-
-        # 커버리지/학점 충족 판단
-        required_areas_count = min(6, len(areas))  # 7개 정의돼도 규칙은 6개 커버
-        coverage_ok = len(covered_areas) >= required_areas_count
-
-        # 17학점 예외: 총 17학점이고, '커버된 영역' 중 적어도 하나의 합계가 2학점인 경우
-        has_two_credit_area = any(area_credit_sum[a] == 2 for a in covered_areas)
-        credit_ok = (drbol_credit_total >= required_credit_total) or (
-            drbol_credit_total == 17 and has_two_credit_area
-        )
-
-        # 남은 커버 수/학점(예외 충족 시 학점 잔여 0으로 표기)
-        areas_remaining = max(0, required_areas_count - len(covered_areas))
-        credit_remaining = 0 if (drbol_credit_total == 17 and has_two_credit_area) \
-            else max(0, required_credit_total - drbol_credit_total)
-
-        return Response({
-            "areas": rows,
-            "areas_required": required_areas_count,
-            "areas_covered": len(covered_areas),
-            "areas_remaining": areas_remaining,
-            "missing_areas": missing_areas,
-
-            "total_credit_completed": drbol_credit_total,
-            "total_credit_required": required_credit_total,   # 보통 18
-            "credit_remaining": credit_remaining,
-
-            # 판단 플래그 + 최종 판정도 같이 내려주면 Postman에서 보기 편함
-            "coverage_ok": coverage_ok,
-            "credit_ok": credit_ok,
-            "status": (coverage_ok and credit_ok)
-        }, status=status.HTTP_200_OK)
-
+        inputs = load_analysis_inputs(user_id, for_request(request, user_id))
+        if "error" in inputs:
+            return Response({"error": inputs["error"]}, status=inputs["status"])
+        courses = get_valid_courses(inputs["transcript"])
+        return Response(build_drbol_missing(courses, inputs["requirement"]), status=status.HTTP_200_OK)
 
 
 # ---------------------------
@@ -495,42 +346,39 @@ class RequiredRoadmapView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
-        user = User.objects.filter(id=user_id).first()
-        if not user:
-            return Response({"error": "사용자를 찾을 수 없습니다."}, status=404)
-        transcript = Transcript.objects.filter(user_id=user_id).order_by("-created_at").first()
-        if not transcript or not transcript.parsed_data:
-            return Response({"error": "성적표 데이터가 없습니다."}, status=404)
-        requirement = GraduationRequirement.objects.filter(major=user.major).first()
-        if not requirement:
-            return Response({"error": "졸업 요건 데이터가 없습니다."}, status=500)
-
-        courses = get_valid_courses(transcript)
-        # 완료 맵: code/name -> taken_semester
-        complete_map: dict[str, str] = {}
-        for c in courses:
-            key = course_key_from_dict(c)
-            if key and key not in complete_map:
-                complete_map[key] = c.get("semester") or None
-
-        def build(items: list[dict]) -> list[dict]:
-            rows = []
-            for it in (items or []):
-                key = course_key_from_dict(it)
-                taken = complete_map.get(key)
-                rows.append({
-                    "code": it.get("code","") or "",
-                    "name": it.get("name","") or "",
-                    "planned_semester": it.get("semester") or None,
-                    "completed": taken is not None,
-                    "taken_semester": taken
-                })
-            return rows
-
-        major_roadmap = build(requirement.major_must_courses)
-        general_roadmap = build(requirement.general_must_courses)
+        inputs = load_analysis_inputs(user_id, for_request(request, user_id))
+        if "error" in inputs:
+            return Response({"error": inputs["error"]}, status=inputs["status"])
+        courses = get_valid_courses(inputs["transcript"])
+        return Response(build_required_roadmap(courses, inputs["requirement"]), status=status.HTTP_200_OK)
 
-        return Response({
-            "major_required_roadmap": major_roadmap,
-            "general_required_roadmap": general_roadmap
-        }, status=status.HTTP_200_OK)
+
+# ---------------------------
+# ✅ 대시보드: 위 분석 뷰들을 한 번에 (?sections=total,status,...)
+# ---------------------------
+class DashboardView(generics.RetrieveAPIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, user_id):
+        param = request.query_params.get("sections")
+        names = [n.strip() for n in param.split(",") if n.strip()] if param else list(DASHBOARD_SECTIONS)
+        unknown = [n for n in names if n not in DASHBOARD_SECTIONS]
+        if unknown:
+            return Response({
+                "error": f"알 수 없는 섹션: {', '.join(unknown)}",
+                "available_sections": list(DASHBOARD_SECTIONS),
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        request_ctx = for_request(request, user_id)
+        inputs = load_analysis_inputs(user_id, request_ctx)
+        if "error" in inputs:
+            return Response({"error": inputs["error"]}, status=inputs["status"])
+
+        # 판정 결과는 개별 분석 뷰와 같은 스냅샷, 과목 순회 1회는 과목 기반 섹션이 공유
+        result = analyze_graduation(user_id, ctx=request_ctx)
+        if "error" in result:
+            return Response({"error": result["error"]}, status=result["status"])
+        courses = get_valid_courses(inputs["transcript"])
+        ctx = {"data": result["data"], "courses": courses, **inputs}
+
+        return Response({n: DASHBOARD_SECTIONS[n](ctx) for n in names}, status=status.HTTP_200_OK)
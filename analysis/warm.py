@@ -0,0 +1,57 @@
+# analysis/warm.py
+"""
+졸업요건 변경 후 스냅샷 미리 재판정
+
+졸업요건이 수정되면 그 전공 학생들의 GraduationSnapshot 은 요건 버전이 달라져 다음 요청마다 각자 재판정된다.
+분석 뷰(대시보드 포함)는 모두 스냅샷을 읽으므로, 변경 직후 저장된 과목 집계로 chunk_size 명씩 미리 재판정해 둔다
+(snapshots.apply_requirement). 스냅샷이 없는 학생은 처음 조회할 때 만든다.
+"""
+import time
+
+from django.conf import settings
+
+from . import snapshots
+from .models import GraduationRequirement
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _chunk_size() -> int:
+    return getattr(settings, "ANALYSIS_WARM_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+
+def is_active(requirement: GraduationRequirement) -> bool:
+    """분석에 실제로 쓰이는 요건인지 (load_analysis_inputs 와 같은 조회: 전공별 첫 번째 요건)"""
+    active = GraduationRequirement.objects.filter(major=requirement.major).values_list("pk", flat=True).first()
+    return active == requirement.pk
+
+
+def warm_requirement(
+    requirement: GraduationRequirement,
+    chunk_size: int | None = None,
+    workers: int = 1,
+    progress=None,
+) -> dict:
+    """
+    요건 전공 학생들의 스냅샷을 재판정.
+    workers > 1 이면 묶음을 스레드로 병렬 처리, progress(처리한 수, 전체 수) 는 묶음이 끝날 때마다 호출
+    """
+    start = time.perf_counter()
+    total = 0
+
+    def report(done, count):
+        nonlocal total
+        total = count
+        if progress is not None:
+            progress(done, count)
+
+    updated = snapshots.apply_requirement(
+        requirement, chunk_size=chunk_size or _chunk_size(), workers=workers, progress=report,
+    )
+    return {
+        "requirement_id": requirement.pk,
+        "major": requirement.major,
+        "snapshots": total,
+        "updated": updated,
+        "elapsed": round(time.perf_counter() - start, 3),
+    }
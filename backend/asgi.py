@@ -2,4 +2,5 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# 진행 상태 SSE(/api/transcripts/events/)는 async 뷰 — ASGI 서버(uvicorn/daphne 등)로 띄우면 연결당 스레드를 점유하지 않는다
 application = get_asgi_application()
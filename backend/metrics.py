@@ -0,0 +1,169 @@
+# backend/metrics.py
+"""
+요청 단위 성능 지표 (RequestMetricsMiddleware 가 기록)
+
+- DB: 모든 DB 연결에 execute_wrapper(record_query)를 달아 두고, 요청마다 ContextVar 로 수집기를 지정한다.
+  ContextVar 는 sync_to_async 스레드로도 전달되므로 ASGI 에서 동기 뷰가 실행돼도 같은 요청으로 집계된다.
+- 집계: 엔드포인트(메서드 + URL 패턴)별 요청 수 / 쿼리 수 / 중복 쿼리 / DB 시간 / Python 시간 / 응답 크기.
+  같은 SQL 이 한 요청에서 여러 번 실행되면(N+1 의심) 그 SQL 을 엔드포인트별로 누적해 상위 항목을 보여준다.
+- 집계는 프로세스 메모리에 보관 → 지표 API 는 그 요청을 처리한 프로세스(pid)의 값이다.
+"""
+import os
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+
+HOT_STATEMENTS = 5        # 엔드포인트별로 보여줄 반복 SQL 수
+HOT_STATEMENT_LIMIT = 50  # 엔드포인트별로 보관할 반복 SQL 수 (넘으면 적게 반복된 것부터 정리)
+SQL_PREVIEW = 300
+
+
+class QueryCollector:
+    """한 요청 동안 실행된 쿼리"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()   # SQL → 실행 횟수
+        self.exact: Counter = Counter()        # (SQL, 파라미터) → 실행 횟수
+
+    def add(self, sql: str, params, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[sql] += 1
+        self.exact[(sql, repr(params))] += 1
+
+    @property
+    def duplicates(self) -> int:
+        """SQL 과 파라미터까지 같은 쿼리의 추가 실행 수"""
+        return sum(n - 1 for n in self.exact.values())
+
+    @property
+    def repeated(self) -> dict[str, int]:
+        """같은 SQL(파라미터 무관)이 두 번 이상 실행된 것 → 추가 실행 수"""
+        return {sql: n - 1 for sql, n in self.statements.items() if n > 1}
+
+
+_current: ContextVar[QueryCollector | None] = ContextVar("request_metrics_collector", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    collector = _current.get()
+    if collector is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        collector.add(sql, params, time.perf_counter() - start)
+
+
+def install(connection) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def install_all() -> None:
+    """현재 스레드의 DB 연결 전체에 기록기 설치"""
+    for connection in connections.all():
+        install(connection)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    install(connection)
+
+
+connection_created.connect(_on_connection_created, dispatch_uid="backend.metrics.install")
+
+
+def start() -> tuple[QueryCollector, object]:
+    collector = QueryCollector()
+    return collector, _current.set(collector)
+
+
+def stop(token) -> None:
+    _current.reset(token)
+
+
+class MetricsRegistry:
+    """엔드포인트별 누적 지표 (프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, dict] = {}
+        self._since = time.time()
+
+    def record(self, endpoint: str, collector: QueryCollector, total: float, size: int | None) -> None:
+        db = collector.seconds
+        with self._lock:
+            row = self._endpoints.get(endpoint)
+            if row is None:
+                row = self._endpoints[endpoint] = {
+                    "requests": 0, "queries": 0, "queries_max": 0, "duplicates": 0,
+                    "db_seconds": 0.0, "python_seconds": 0.0, "total_max_seconds": 0.0,
+                    "bytes": 0, "hot": Counter(),
+                }
+            row["requests"] += 1
+            row["queries"] += collector.count
+            row["queries_max"] = max(row["queries_max"], collector.count)
+            row["duplicates"] += collector.duplicates
+            row["db_seconds"] += db
+            row["python_seconds"] += max(0.0, total - db)
+            row["total_max_seconds"] = max(row["total_max_seconds"], total)
+            row["bytes"] += size or 0
+            hot = row["hot"]
+            hot.update(collector.repeated)
+            if len(hot) > HOT_STATEMENT_LIMIT:
+                row["hot"] = Counter(dict(hot.most_common(HOT_STATEMENT_LIMIT)))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            rows = {k: {**v, "hot": v["hot"].most_common(HOT_STATEMENTS)} for k, v in self._endpoints.items()}
+            since = self._since
+
+        endpoints = []
+        for endpoint, row in rows.items():
+            n = row["requests"]
+            endpoints.append({
+                "endpoint": endpoint,
+                "requests": n,
+                "queries_avg": round(row["queries"] / n, 2),
+                "queries_max": row["queries_max"],
+                "duplicate_queries_avg": round(row["duplicates"] / n, 2),
+                "db_ms_avg": round(row["db_seconds"] * 1000 / n, 3),
+                "python_ms_avg": round(row["python_seconds"] * 1000 / n, 3),
+                "total_ms_max": round(row["total_max_seconds"] * 1000, 3),
+                "response_bytes_avg": round(row["bytes"] / n),
+                "repeated_statements": [
+                    {"sql": sql[:SQL_PREVIEW], "extra_executions": extra} for sql, extra in row["hot"]
+                ],
+            })
+        # 요청당 쿼리가 많은 순 → N+1 / 중복 조회 후보가 위로
+        endpoints.sort(key=lambda r: (r["queries_avg"], r["requests"]), reverse=True)
+        return {"pid": os.getpid(), "since": since, "endpoints": endpoints}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._since = time.time()
+
+
+registry = MetricsRegistry()
+
+
+class RequestMetricsView(generics.RetrieveAPIView):
+    """엔드포인트별 누적 지표 조회(GET) / 초기화(DELETE)"""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(registry.snapshot(), status=status.HTTP_200_OK)
+
+    def delete(self, request):
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
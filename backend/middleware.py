@@ -0,0 +1,74 @@
+# backend/middleware.py
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from . import metrics
+
+
+def _endpoint(request) -> str:
+    """메서드 + URL 패턴 (예: GET api/analysis/credit/total/<int:user_id>/) — 매칭 실패 시 <unmatched>"""
+    match = getattr(request, "resolver_match", None)
+    return f"{request.method} {match.route if match else '<unmatched>'}"
+
+
+def _response_size(response) -> int | None:
+    if getattr(response, "streaming", False):
+        return None
+    return len(response.content)
+
+
+class RequestMetricsMiddleware:
+    """
+    요청별 DB 쿼리 수 / DB 시간 / Python 시간 / 응답 크기를 기록해
+    Server-Timing 헤더로 내려주고 엔드포인트별로 누적한다 (backend.metrics)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "REQUEST_METRICS_ENABLED", True)
+        self.server_timing = getattr(settings, "REQUEST_METRICS_SERVER_TIMING", True)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        metrics.install_all()
+        collector, token = metrics.start()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.stop(token)
+        return self._finish(request, response, collector, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+
+        collector, token = metrics.start()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.stop(token)
+        return self._finish(request, response, collector, time.perf_counter() - start)
+
+    def _finish(self, request, response, collector, total: float):
+        metrics.registry.record(_endpoint(request), collector, total, _response_size(response))
+        if self.server_timing:
+            db_ms = collector.seconds * 1000
+            response["Server-Timing"] = ", ".join([
+                f'db;dur={db_ms:.1f};desc="{collector.count} queries"',
+                f"app;dur={max(0.0, total * 1000 - db_ms):.1f}",
+                f"total;dur={total * 1000:.1f}",
+            ])
+        return response
@@ -29,6 +29,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'backend.middleware.RequestMetricsMiddleware',   # 요청별 쿼리 수/DB·Python 시간 (Server-Timing, /api/metrics/)
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',     # ← CORS는 위쪽
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -59,13 +60,47 @@ TEMPLATES = [
 WSGI_APPLICATION = 'backend.wsgi.application'
 ASGI_APPLICATION = 'backend.asgi.application'
 
-# DB (sqlite)
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# DB — DB_ENGINE 으로 서버 DB(postgresql / mysql) 선택, 미지정 시 SQLite
+#  - DB_CONN_MAX_AGE: 연결 유지 시간(초, 0 이면 요청마다 새 연결) / DB_POOL=1: psycopg 3 연결 풀(PostgreSQL, CONN_MAX_AGE 대신 사용)
+#  - SQLite 는 단일 노드용: WAL 모드로 웹 읽기와 Celery 쓰기가 서로 막지 않게 한다 (SQLITE_WAL=1 로 켬, 기본은 꺼서 저장소의 db.sqlite3 를 건드리지 않음)
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite3')
+if DB_ENGINE in ('postgresql', 'mysql'):
+    DATABASES = {
+        'default': {
+            'ENGINE': f'django.db.backends.{DB_ENGINE}',
+            'NAME': os.environ.get('DB_NAME', 'backend'),
+            'USER': os.environ.get('DB_USER', ''),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', ''),
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {},
+        }
     }
-}
+    if DB_ENGINE == 'postgresql' and os.environ.get('DB_POOL') == '1':
+        DATABASES['default']['CONN_MAX_AGE'] = 0  # 풀 사용 시 persistent 연결과 함께 쓸 수 없음
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                'timeout': int(os.environ.get('SQLITE_TIMEOUT', 20)),  # 잠금 대기(초)
+            },
+        }
+    }
+    if os.environ.get('SQLITE_WAL', '0') == '1':
+        DATABASES['default']['OPTIONS'].update({
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+            # 쓰기 트랜잭션은 시작할 때 잠금 → 읽기→쓰기 승격 중 database is locked 방지
+            'transaction_mode': 'IMMEDIATE',
+        })
 
 # Auth
 AUTH_PASSWORD_VALIDATORS = [
@@ -88,6 +123,19 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# 업로드 — 파일은 메모리에 두지 않고 임시 파일로 스트리밍.
+# 임시 디렉터리를 MEDIA_ROOT 와 같은 파일시스템에 두어 저장 시 복사 대신 rename 으로 옮긴다
+TRANSCRIPT_UPLOAD_TEMP_DIR = os.environ.get('TRANSCRIPT_UPLOAD_TEMP_DIR', str(MEDIA_ROOT / '.upload_tmp'))
+TRANSCRIPT_UPLOAD_MAX_FILE_SIZE = int(os.environ.get('TRANSCRIPT_UPLOAD_MAX_FILE_SIZE', 10 * 1024 * 1024))
+TRANSCRIPT_UPLOAD_MAX_REQUEST_SIZE = int(os.environ.get('TRANSCRIPT_UPLOAD_MAX_REQUEST_SIZE', 50 * 1024 * 1024))
+
+# 성적표 진행 상태 long-poll 최대 대기(초)
+TRANSCRIPT_STATUS_MAX_WAIT = 25
+# 성적표 진행 상태 SSE — 연결 최대 유지 시간 / keep-alive 주기 / 연결용 토큰 유효 시간(초)
+TRANSCRIPT_EVENTS_MAX_DURATION = 300
+TRANSCRIPT_EVENTS_HEARTBEAT = 15
+TRANSCRIPT_EVENTS_TOKEN_MAX_AGE = 60
+
 # DRF + JWT(auth class만 등록)
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -101,6 +149,34 @@ AUTH_USER_MODEL = 'users.User'
 # CORS (개발 편의)
 CORS_ALLOW_ALL_ORIGINS = True
 
+# Cache — REDIS_CACHE_URL 지정 시 Redis(프로세스 간 공유), 없으면 로컬 메모리
+if os.environ.get('REDIS_CACHE_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_CACHE_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 졸업요건 인덱스 LRU 크기(프로세스당, 요건 버전 단위)
+REQUIREMENT_INDEX_CACHE_SIZE = 128
+# 필수 과목 유사 이름 매칭(analysis.matching) — 최소 유사도 / 최대 편집 수
+COURSE_MATCH_MIN_CONFIDENCE = float(os.environ.get('COURSE_MATCH_MIN_CONFIDENCE', 0.8))
+COURSE_MATCH_MAX_EDITS = int(os.environ.get('COURSE_MATCH_MAX_EDITS', 2))
+# 요건 저장 시 전공 학생 졸업 판정 스냅샷 미리 재판정(Celery) / 한 번에 재판정할 스냅샷 수
+ANALYSIS_WARM_ON_REQUIREMENT_CHANGE = True
+ANALYSIS_WARM_CHUNK_SIZE = 500
+
+# 요청 지표(backend.middleware) — 엔드포인트별 누적 / 응답에 Server-Timing 헤더 포함 여부
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', '1') == '1'
+REQUEST_METRICS_SERVER_TIMING = os.environ.get('REQUEST_METRICS_SERVER_TIMING', '1') == '1'
+
 # Celery — Redis 브로커/결과 백엔드 사용(권장)
 CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/1')
@@ -108,3 +184,19 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Seoul'
+
+# OCR 워커 풀 — 워커 프로세스마다 PaddleOCR 모델을 한 번만 로드해 재사용 (0 이면 풀 없이 직접 실행)
+# 모델은 OCR 풀 하나가 소유하므로 Celery 워커는 자식 프로세스를 둘 수 있는 풀로 실행한다:
+#   celery -A backend worker --pool=threads --concurrency=4   (상주 모델 = OCR_POOL_PROCESSES 개)
+# prefork 로 실행하면 자식 프로세스마다 풀 없이 모델을 직접 로드한다 (상주 모델 = --concurrency 개, 이 값은 무시)
+OCR_POOL_PROCESSES = int(os.environ.get('OCR_POOL_PROCESSES', 2))
+OCR_POOL_START_METHOD = os.environ.get('OCR_POOL_START_METHOD', 'spawn')
+# 성적표 한 건이 동시에 OCR 풀에 올릴 수 있는 작업(페이지 묶음) 수
+OCR_MAX_PAGES_IN_FLIGHT = int(os.environ.get('OCR_MAX_PAGES_IN_FLIGHT', 4))
+# 워커 한 번의 배치 추론으로 처리할 페이지 수 (글자 인식을 페이지 경계를 넘어 묶음 / 1 이면 페이지별)
+OCR_BATCH_SIZE = int(os.environ.get('OCR_BATCH_SIZE', 2))
+# OCR 전처리 — 축소/그레이스케일/표 영역 크롭/(선택) 기울기 보정
+OCR_PREPROCESS = True
+OCR_PREPROCESS_MAX_WIDTH = 1600
+OCR_PREPROCESS_CROP_TABLE = True
+OCR_PREPROCESS_DESKEW = False
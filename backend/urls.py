@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from .metrics import RequestMetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
 
@@ -9,4 +11,7 @@ urlpatterns = [
     path('api/transcripts/', include('transcripts.urls')),
     path('api/analysis/', include('analysis.urls')),
     path('api/semesters/', include('semesters.urls')),
+
+    # 운영: 엔드포인트별 요청 지표 (GET 조회 / DELETE 초기화)
+    path('api/metrics/', RequestMetricsView.as_view()),
 ]
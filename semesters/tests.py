@@ -1,3 +1,66 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from analysis.models import GraduationRequirement
+from transcripts.courses import sync_transcript_courses
+from transcripts.models import Transcript
+from transcripts.tasks import mark_latest_transcript
+from users.models import User
+
+
+class MissingRequiredViewTests(TestCase):
+    """전공필수 미이수 판정이 analysis 와 같은 매처(별칭 인정, 유사 이름 불인정)를 쓰는지 — JSON / 적재 경로 모두"""
+
+    @classmethod
+    def setUpTestData(cls):
+        GraduationRequirement.objects.create(
+            major="컴퓨터공학과", year=2021,
+            major_must_courses=[
+                {"code": "A1", "name": "컴퓨터구조", "aliases": ["컴구"], "semester": "2-1"},
+                {"code": "A2", "name": "운영체제및실습", "semester": "3-1"},
+                {"code": "A3", "name": "컴파일러", "semester": "3-1"},
+            ],
+            general_must_courses=[], drbol_areas="",
+        )
+        cls.user = User.objects.create(student_id="C000001", username="C000001", full_name="홍길동", major="컴퓨터공학과")
+        cls.transcript = Transcript.objects.create(
+            user=cls.user, file="transcripts/x.png", status=Transcript.STATUS.done,
+            parsed_data={"courses": [
+                {"code": "B9", "name": "컴구", "credit": 3, "grade": "A0", "type": "전공", "semester": "2-1"},
+                {"code": "B8", "name": "운영채제및실습", "credit": 3, "grade": "B+", "type": "전공", "semester": "3-1"},
+                {"code": "A3", "name": "컴파일러", "credit": 3, "grade": "F", "type": "전공", "semester": "3-1"},
+            ]},
+        )
+        mark_latest_transcript(cls.transcript)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assert_alias_completed_only(self):
+        """별칭(컴구)만 이수, 유사 이름(운영채제및실습)과 F 학점(컴파일러)은 미이수"""
+        uid = self.user.id
+        r = self.client.get(f"/api/semesters/courses/missing-required/all/{uid}/")
+        self.assertEqual(r.data["missing_required_courses"], [
+            {"code": "A2", "name": "운영체제및실습", "semester": "3-1"},
+            {"code": "A3", "name": "컴파일러", "semester": "3-1"},
+        ])
+
+        r = self.client.get(f"/api/semesters/courses/missing-required/by-semester/{uid}/")
+        self.assertEqual(r.data, {"3-1": [{"code": "A2", "name": "운영체제및실습"}, {"code": "A3", "name": "컴파일러"}]})
+
+        r = self.client.get(f"/api/semesters/2-1/courses/missing-required/{uid}/")
+        self.assertEqual(r.data["missing_required_courses"], [])
+
+        r = self.client.get(f"/api/analysis/credit/status/{uid}/")
+        self.assertEqual(
+            r.data["missing_major_courses"],
+            {"3-1": [{"code": "A2", "name": "운영체제및실습"}, {"code": "A3", "name": "컴파일러"}]},
+        )
+
+    def test_parsed_data(self):
+        self.assert_alias_completed_only()
+
+    def test_synced_courses(self):
+        sync_transcript_courses(self.transcript)
+        self.assert_alias_completed_only()
@@ -1,46 +1,72 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from transcripts.models import Transcript
-from analysis.models import GraduationRequirement
-from users.models import User
-
-import re
-import unicodedata
-
-
-# ---------------------------
-# 유틸
-# ---------------------------
-ROMAN = {"Ⅰ":"1","Ⅱ":"2","Ⅲ":"3","Ⅳ":"4","Ⅴ":"5","Ⅵ":"6","Ⅶ":"7","Ⅷ":"8","Ⅸ":"9"}
-
-def normalize_course_name(name: str) -> str:
-    if not name:
-        return ""
-    s = unicodedata.normalize("NFKC", str(name)).lower()
-    for k, v in ROMAN.items():
-        s = s.replace(k, v)
-    s = re.sub(r"[·ㆍ\.\-_/]", "", s)
-    s = re.sub(r"[\(\)\[\]\{\}\s]+", "", s)
-    return s
-
-def course_key_from_dict(d: dict) -> str:
-    code = (d.get("code") or "").strip()
-    if code:
-        return code
-    return normalize_course_name(d.get("name", ""))
+from django.db.models import Q
+from transcripts.models import TranscriptCourse
+from analysis.context import AnalysisContext, for_request
+from analysis.requirement_index import get_requirement_index
+from analysis.utils import get_courses_from_parsed_data
 
 
 # ---------------------------
 # 공통 헬퍼
 # ---------------------------
-def get_valid_courses(transcript):
+def get_latest_transcript(ctx: AnalysisContext):
+    """
+    최신 성적표 (요청 단위 ctx 에서 한 번만 조회). TranscriptCourse 로 적재된 성적표는 parsed_data(JSON)를 읽지 않는다
+    (뷰는 for_request(..., with_data=False) 로 parsed_data 를 미뤄 둔다).
+    데이터가 없으면 None
+    """
+    transcript = ctx.transcript
+    if not transcript:
+        return None
+    if transcript.courses_synced or transcript.parsed_data:
+        return transcript
+    return None
+
+def get_valid_courses(transcript, q: Q | None = None):
     """
     F 성적 및 재수강 과목 제외한 유효 과목 리스트 반환
+    - 적재된 성적표: 인덱스 조회 (q 조건은 SQL WHERE 로)
+    - 레거시: parsed_data 순회 (q 는 무시 → 호출 측에서 파이썬 필터)
     """
-    courses = transcript.parsed_data.get("courses", [])
+    if transcript.courses_synced:
+        qs = TranscriptCourse.objects.filter(transcript=transcript).valid()
+        if q is not None:
+            qs = qs.filter(q)
+        return [c.as_dict() for c in qs]
+    courses = get_courses_from_parsed_data(transcript.parsed_data)
     return [c for c in courses if c.get("grade") != "F" and not c.get("retake", False)]
 
+def get_completed_required(transcript, requirement, semester: str | None = None) -> dict:
+    """
+    이수한 필수 과목 {RequiredItem: CourseMatch} (semester 지정 시 해당 학기 과목만)
+    analysis 의 졸업요건 판정과 같은 요건 인덱스 매처(코드 / 이름 / 별칭)를 사용한다.
+    """
+    if transcript.courses_synced:
+        qs = TranscriptCourse.objects.filter(transcript=transcript).valid()
+        if semester is not None:
+            qs = qs.filter(semester=semester)
+        courses = [
+            {"code": code, "name": name}
+            for code, name in qs.values_list("code", "normalized_name")
+        ]
+    else:
+        courses = [
+            c for c in get_valid_courses(transcript)
+            if semester is None or c.get("semester") == semester
+        ]
+    return get_requirement_index(requirement).matcher.match(courses)
+
+def group_by_semester(courses: list[dict]) -> dict:
+    semester_data = {}
+    for course in courses:
+        sem = course.get("semester") or "기타"
+        semester_data.setdefault(sem, []).append(course)
+
+    sorted_semesters = sorted(semester_data.keys(), key=semester_sort_key)
+    return {sem: semester_data[sem] for sem in sorted_semesters}
+
 def semester_sort_key(sem):
     try:
         year, term = map(int, sem.split('-'))
@@ -52,31 +78,26 @@ def semester_sort_key(sem):
 # ---------- 1) 학기별 전체 이수 현황 ----------
 class SemesterCourseListView(APIView):
     def get(self, request, user_id):
-        transcript = Transcript.objects.filter(user_id=user_id).last()
-        if not transcript or not transcript.parsed_data:
+        ctx = for_request(request, user_id, with_data=False)
+        transcript = get_latest_transcript(ctx)
+        if not transcript:
             return Response({"error": "성적표 데이터가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
         courses = get_valid_courses(transcript)
-
-        semester_data = {}
-        for course in courses:
-            sem = course.get("semester", "기타")
-            semester_data.setdefault(sem, []).append(course)
-
-        sorted_semesters = sorted(semester_data.keys(), key=semester_sort_key)
-        data = {sem: semester_data[sem] for sem in sorted_semesters}
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(group_by_semester(courses), status=status.HTTP_200_OK)
 
 
 # ---------- 2) 특정 학기 과목 조회 ----------
 class SemesterDetailView(APIView):
     def get(self, request, semester, user_id):
-        transcript = Transcript.objects.filter(user_id=user_id).last()
-        if not transcript or not transcript.parsed_data:
+        ctx = for_request(request, user_id, with_data=False)
+        transcript = get_latest_transcript(ctx)
+        if not transcript:
             return Response({"error": "성적표 데이터가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
+        # 적재분은 SQL 로 걸러지고, 아래 조건은 레거시(JSON) 경로에만 실질적으로 적용
         courses = [
-            c for c in get_valid_courses(transcript)
+            c for c in get_valid_courses(transcript, Q(semester=semester))
             if c.get("semester") == semester
         ]
         return Response({"semester": semester, "courses": courses}, status=status.HTTP_200_OK)
@@ -85,30 +106,27 @@ class SemesterDetailView(APIView):
 # ---------- 3) 특정 학기의 전공필수 미이수 과목 ----------
 class SemesterMissingRequiredView(APIView):
     def get(self, request, semester, user_id):
-        transcript = Transcript.objects.filter(user_id=user_id).last()
-        if not transcript or not transcript.parsed_data:
+        ctx = for_request(request, user_id, with_data=False)
+        transcript = get_latest_transcript(ctx)
+        if not transcript:
             return Response({"error": "성적표 데이터가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        user = User.objects.filter(id=user_id).first()
-        if not user:
+        if not ctx.user:
             return Response({"error": "사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        requirement = GraduationRequirement.objects.filter(major=user.major).first()
+        requirement = ctx.requirement
         if not requirement:
             return Response({"error": "졸업 요건 데이터가 없습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        # 완료 과목 키(해당 학기만)
-        completed_keys = {
-            course_key_from_dict(c)
-            for c in get_valid_courses(transcript)
-            if c.get("semester") == semester
-        }
+        # 이수한 필수 과목(해당 학기 과목만)
+        completed = get_completed_required(transcript, requirement, semester)
 
-        # 해당 학기에 계획된 전공필수 중 미이수 (code 기준)
+        # 해당 학기에 계획된 전공필수 중 미이수
+        index = get_requirement_index(requirement)
         missing = [
-            {"code": (d.get("code") or ""), "name": d.get("name", "")}
-            for d in (requirement.major_must_courses or [])
-            if (d.get("semester") == semester) and (course_key_from_dict(d) not in completed_keys)
+            d.as_dict()
+            for d in index.major_must_by_semester.get(semester, ())
+            if d not in completed
         ]
 
         return Response({"semester": semester, "missing_required_courses": missing}, status=status.HTTP_200_OK)
@@ -117,15 +135,22 @@ class SemesterMissingRequiredView(APIView):
 # ---------- 4) 전체 보기 + 필터 ----------
 class SemesterFilteredView(APIView):
     def get(self, request, user_id):
-        transcript = Transcript.objects.filter(user_id=user_id).last()
-        if not transcript or not transcript.parsed_data:
+        ctx = for_request(request, user_id, with_data=False)
+        transcript = get_latest_transcript(ctx)
+        if not transcript:
             return Response({"error": "성적표 데이터가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
         filter_param = request.GET.get("filter")  # 예: ?filter=전공,교양필수
-        courses = get_valid_courses(transcript)
+        filter_list = [f.strip() for f in (filter_param or "").split(",") if f.strip()]
 
-        if filter_param:
-            filter_list = [f.strip() for f in filter_param.split(",") if f.strip()]
+        q = None
+        for f in filter_list:
+            cond = Q(type__contains=f) | Q(major_field__contains=f)
+            q = cond if q is None else (q | cond)
+        courses = get_valid_courses(transcript, q)
+
+        # 레거시(JSON) 경로 필터 + SQL LIKE 의 대소문자 무시 보정
+        if filter_list:
             courses = [
                 c for c in courses
                 if any(
@@ -134,14 +159,7 @@ class SemesterFilteredView(APIView):
                 )
             ]
 
-        semester_data = {}
-        for course in courses:
-            sem = course.get("semester", "기타")
-            semester_data.setdefault(sem, []).append(course)
-
-        sorted_semesters = sorted(semester_data.keys(), key=semester_sort_key)
-        data = {sem: semester_data[sem] for sem in sorted_semesters}
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(group_by_semester(courses), status=status.HTTP_200_OK)
 
 
 # ---------- 5) 전체 전공필수 미이수 과목 (플랫) ----------
@@ -151,28 +169,25 @@ class MissingAllRequiredCoursesView(APIView):
     응답 아이템: {code, name, semester}
     """
     def get(self, request, user_id):
-        transcript = Transcript.objects.filter(user_id=user_id).last()
-        if not transcript or not transcript.parsed_data:
+        ctx = for_request(request, user_id, with_data=False)
+        transcript = get_latest_transcript(ctx)
+        if not transcript:
             return Response({"error": "성적표 데이터가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        user = User.objects.filter(id=user_id).first()
-        if not user:
+        if not ctx.user:
             return Response({"error": "사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        requirement = GraduationRequirement.objects.filter(major=user.major).first()
+        requirement = ctx.requirement
         if not requirement:
             return Response({"error": "졸업 요건 데이터가 없습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        completed_keys = {course_key_from_dict(c) for c in get_valid_courses(transcript)}
+        completed = get_completed_required(transcript, requirement)
 
+        index = get_requirement_index(requirement)
         missing = [
-            {
-                "code": (d.get("code") or ""),
-                "name": d.get("name", ""),
-                "semester": d.get("semester") or "기타",
-            }
-            for d in (requirement.major_must_courses or [])
-            if course_key_from_dict(d) not in completed_keys
+            {**d.as_dict(), "semester": d.semester or "기타"}
+            for d in index.major_must
+            if d not in completed
         ]
 
         return Response({"missing_required_courses": missing}, status=status.HTTP_200_OK)
@@ -185,29 +200,25 @@ class MissingRequiredBySemesterView(APIView):
     응답: {"1-1":[{code,name}], ... , "기타":[...]}
     """
     def get(self, request, user_id):
-        transcript = Transcript.objects.filter(user_id=user_id).last()
-        if not transcript or not transcript.parsed_data:
+        ctx = for_request(request, user_id, with_data=False)
+        transcript = get_latest_transcript(ctx)
+        if not transcript:
             return Response({"error": "성적표 데이터가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        user = User.objects.filter(id=user_id).first()
-        if not user:
+        if not ctx.user:
             return Response({"error": "사용자를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-        requirement = GraduationRequirement.objects.filter(major=user.major).first()
+        requirement = ctx.requirement
         if not requirement:
             return Response({"error": "졸업 요건 데이터가 없습니다."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        completed_keys = {course_key_from_dict(c) for c in get_valid_courses(transcript)}
+        completed = get_completed_required(transcript, requirement)
 
         bucket = {}
-        for d in (requirement.major_must_courses or []):
-            if course_key_from_dict(d) in completed_keys:
-                continue
-            sem = d.get("semester") or "기타"
-            bucket.setdefault(sem, []).append({
-                "code": (d.get("code") or ""),
-                "name": d.get("name", "")
-            })
+        for sem, items in get_requirement_index(requirement).major_must_by_semester.items():
+            missing = [d.as_dict() for d in items if d not in completed]
+            if missing:
+                bucket[sem] = missing
 
         # 정렬된 학기 순서로 재구성
         sorted_sems = sorted(bucket.keys(), key=semester_sort_key)
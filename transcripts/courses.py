@@ -0,0 +1,42 @@
+# transcripts/courses.py
+"""parsed_data(JSON) → TranscriptCourse(정규화 테이블) 적재"""
+from django.db import transaction
+
+from analysis.utils import _norm, get_courses_from_parsed_data
+from .models import Transcript, TranscriptCourse
+
+
+def _to_int(v) -> int:
+    try:
+        return int(float(v or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _columns(c: dict) -> dict:
+    return {
+        "semester": str(c.get("semester") or "")[:20],
+        "code": str(c.get("code") or "").strip()[:20],
+        "name": str(c.get("name") or "")[:200],
+        "normalized_name": _norm(c.get("name"))[:200],
+        "type": str(c.get("type") or "")[:50],
+        "major_field": str(c.get("major_field") or "").strip()[:50],
+        "credit": _to_int(c.get("credit")),
+        "grade": str(c.get("grade") or "")[:5],
+        "retake": bool(c.get("retake", False)),
+    }
+
+
+def sync_transcript_courses(transcript: Transcript) -> int:
+    """성적표의 과목 행을 지우고 parsed_data 기준으로 다시 적재. 적재된 행 수 반환"""
+    records = [c for c in get_courses_from_parsed_data(transcript.parsed_data) if isinstance(c, dict)]
+    rows = [
+        TranscriptCourse(transcript=transcript, position=i, **_columns(c))
+        for i, c in enumerate(records)
+    ]
+    with transaction.atomic():
+        TranscriptCourse.objects.filter(transcript=transcript).delete()
+        TranscriptCourse.objects.bulk_create(rows)
+        transcript.courses_synced = bool(transcript.parsed_data)
+        transcript.save(update_fields=["courses_synced"])
+    return len(rows)
@@ -1,43 +1,78 @@
+import threading
+
 import cv2
+import numpy as np
 from paddleocr import PaddleOCR
 
 
 class MyPaddleOCR:
+    """
+    PaddleOCR 래퍼.
+    결과는 호출마다 반환하고 인스턴스에 저장하지 않는다 (Paddle predictor 는 스레드 안전하지 않아 추론만 lock 으로 직렬화).
+    """
+
     def __init__(self, lang: str = "korean", **kwargs):
         self.lang = lang
         self._ocr = PaddleOCR(lang="korean")
-        self.img_path = None
-        self.ocr_result = {}
-
-    def get_ocr_result(self):
-        return self.ocr_result
-
-    def get_img_path(self):
-        return self.img_path
-
-    def run_ocr(self, img_path: str, debug: bool = False):
-        self.img_path = img_path
-        ocr_text = []
-        result = self._ocr.ocr(img_path, cls=False)
-        self.ocr_result = result[0]
-
-        if self.ocr_result:
-            for r in result[0]:
-                ocr_text.append(r[1][0])
-        else:
-            ocr_text = "No text detected."
-
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _decode(image) -> np.ndarray:
+        """경로 / 흑백 배열 / BGR 배열 → BGR 배열"""
+        if isinstance(image, str):
+            img = cv2.imread(image, cv2.IMREAD_COLOR)
+            if img is None:
+                raise ValueError(f"이미지를 읽을 수 없습니다: {image}")
+            return img
+        if image.ndim == 2:
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        return image
+
+    def ocr_batch(self, images: list) -> list[list]:
+        """
+        여러 이미지(경로 또는 배열)를 한 번에 OCR.
+        검출은 이미지별로 하고, 잘라낸 글자 영역은 모든 이미지를 모아 한 번에 인식기로 보낸다
+        (페이지 경계를 넘어 rec_batch_num 배치를 채움).
+        반환: 이미지별 PaddleOCR 형식 결과 [[box(4점), (text, score)], ...]
+        """
+        imgs = [self._decode(i) for i in images]
+        engine = self._ocr
+
+        if not hasattr(engine, "text_detector"):   # 내부 구조가 다른 PaddleOCR 버전: 한 장씩 처리
+            with self._lock:
+                return [(engine.ocr(img, cls=False)[0] or []) for img in imgs]
+
+        from tools.infer.predict_system import sorted_boxes   # paddleocr import 후 사용 가능
+        from tools.infer.utility import get_rotate_crop_image
+
+        crops, owners = [], []
+        with self._lock:
+            for idx, img in enumerate(imgs):
+                dt_boxes, _ = engine.text_detector(img)
+                if dt_boxes is None or len(dt_boxes) == 0:
+                    continue
+                for box in sorted_boxes(dt_boxes):
+                    crops.append(get_rotate_crop_image(img, np.array(box, dtype=np.float32)))
+                    owners.append((idx, box))
+            rec_res = engine.text_recognizer(crops)[0] if crops else []
+
+        results: list[list] = [[] for _ in imgs]
+        for (idx, box), (text, score) in zip(owners, rec_res):
+            if score >= engine.drop_score:
+                results[idx].append([np.asarray(box).tolist(), (text, float(score))])
+        return results
+
+    def run_ocr(self, image, debug: bool = False) -> list[str]:
+        result = self.ocr_batch([image])[0]
         if debug:
-            self.show_img_with_ocr()
+            self.show_img_with_ocr(image, result)
+        return [r[1][0] for r in result]
 
-        return ocr_text
+    @classmethod
+    def show_img_with_ocr(cls, image, ocr_result):
+        roi_img = cls._decode(image).copy()
 
-    def show_img_with_ocr(self):
-        img = cv2.imread(self.img_path)
-        roi_img = img.copy()
-
-        for text_result in self.ocr_result:
-            text = text_result[1][0]
+        for text_result in ocr_result:
             tlX = int(text_result[0][0][0])
             tlY = int(text_result[0][0][1])
             trX = int(text_result[0][1][0])
@@ -59,20 +94,19 @@ class MyPaddleOCR:
             cv2.line(roi_img, bottomRight, bottomLeft, (0, 255, 0), 2)
             cv2.line(roi_img, bottomLeft, topLeft, (0, 255, 0), 2)
 
-            # print(text)
-
+        return roi_img
 
-import re
 
-ocr = MyPaddleOCR()
+_ocr: MyPaddleOCR | None = None
 
 
-def ocr_to_cells(image_path: str, cols: int = 6) -> list[list[str]]:
+def get_ocr() -> MyPaddleOCR:
     """
-    Run MyPaddleOCR on the given image, join results by double-space,
-    split into cells by two-or-more spaces, and group into rows of `cols` columns.
+    프로세스 전역 MyPaddleOCR (처음 사용할 때 모델 로드).
+    OCR 워커는 initializer 에서 호출해 모델을 메모리에 유지한다.
     """
-    texts = ocr.run_ocr(image_path, debug=False)
-    big_str = "  ".join(texts)
-    cells = re.split(r'\s{2,}', big_str)
-    return [cells[i:i + cols] for i in range(0, len(cells), cols)]
\ No newline at end of file
+    global _ocr
+    if _ocr is None:
+        _ocr = MyPaddleOCR()
+    return _ocr
+
@@ -0,0 +1,91 @@
+# transcripts/layout.py
+"""
+OCR 글자 상자 → 표(셀 격자)
+
+PaddleOCR 결과 [[box(4점), (text, score)], ...] 의 좌표로 행/열을 나눈다 (상자 n개에 O(n log n)).
+1) 행: 세로 중심으로 정렬해 한 번 훑으며, 현재 행의 평균 중심과 상자 높이 중앙값의 절반 이상 떨어지면 새 행
+2) 열: 셀이 많은 행(셀 수가 중앙값 이상)의 가로 구간을 x 순으로 합쳐 열 구간을 만든다
+   → 여러 열에 걸친 학기 머리글 같은 상자가 열을 합쳐 버리지 않음
+3) 배치: 상자마다 가장 많이 겹치는 열(없으면 가장 가까운 열)에 넣고, 같은 칸의 글자는 x 순으로 공백 연결
+빈 칸은 ""로 남기므로 셀 하나가 빠지거나 합쳐져도 그 행의 나머지 열은 제자리에 있다.
+"""
+from bisect import bisect_right
+from statistics import median
+
+ROW_TOLERANCE = 0.5  # 상자 높이 중앙값 대비 같은 행으로 볼 세로 중심 거리
+
+
+def _boxes(result) -> list[tuple[float, float, float, float, str]]:
+    """[(x0, x1, y0, y1, text)] — 빈 글자는 제외"""
+    boxes = []
+    for box, (text, _score) in result:
+        text = str(text).strip()
+        if not text:
+            continue
+        xs = [p[0] for p in box]
+        ys = [p[1] for p in box]
+        boxes.append((min(xs), max(xs), min(ys), max(ys), text))
+    return boxes
+
+
+def _rows(boxes: list, tolerance: float) -> list[list]:
+    rows: list[list] = []
+    center = 0.0
+    for b in sorted(boxes, key=lambda b: (b[2] + b[3]) / 2):
+        cy = (b[2] + b[3]) / 2
+        if rows and abs(cy - center) <= tolerance:
+            row = rows[-1]
+            row.append(b)
+            center += (cy - center) / len(row)
+        else:
+            rows.append([b])
+            center = cy
+    return rows
+
+
+def _columns(rows: list[list]) -> list[tuple[float, float]]:
+    """열 구간 [(x0, x1)] (x 순)"""
+    typical = median(len(r) for r in rows)
+    spans = sorted((b[0], b[1]) for r in rows if len(r) >= typical for b in r)
+    bands: list[list[float]] = []
+    for x0, x1 in spans:
+        if bands and x0 <= bands[-1][1]:
+            bands[-1][1] = max(bands[-1][1], x1)
+        else:
+            bands.append([x0, x1])
+    return [(a, b) for a, b in bands]
+
+
+def _column_of(box, bands: list[tuple[float, float]], starts: list[float]) -> int:
+    x0, x1 = box[0], box[1]
+    best, best_overlap = None, 0.0
+    # x1 보다 왼쪽에서 시작하는 열만 겹칠 수 있다 (오른쪽부터 x0 이전에 끝나는 열까지)
+    i = bisect_right(starts, x1) - 1
+    while i >= 0 and bands[i][1] >= x0:
+        overlap = min(x1, bands[i][1]) - max(x0, bands[i][0])
+        if overlap > best_overlap:
+            best, best_overlap = i, overlap
+        i -= 1
+    if best is not None:
+        return best
+    cx = (x0 + x1) / 2
+    return min(range(len(bands)), key=lambda j: abs((bands[j][0] + bands[j][1]) / 2 - cx))
+
+
+def build_table(result) -> list[list[str]]:
+    """PaddleOCR 한 장 결과 → 행 목록 (모든 행의 열 수가 같음, 빈 칸은 "")"""
+    boxes = _boxes(result or [])
+    if not boxes:
+        return []
+    height = median(b[3] - b[2] for b in boxes) or 1.0
+    rows = _rows(boxes, height * ROW_TOLERANCE)
+    bands = _columns(rows)
+    starts = [a for a, _ in bands]
+
+    table = []
+    for row in rows:
+        cells: list[list] = [[] for _ in bands]
+        for b in row:
+            cells[_column_of(b, bands, starts)].append(b)
+        table.append([" ".join(b[4] for b in sorted(cell)) for cell in cells])
+    return table
@@ -0,0 +1,66 @@
+import json
+import statistics
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from transcripts import ocr_pool
+from transcripts.preprocess import DEFAULT_OPTIONS, load_image, preprocess_page
+
+
+def _median_ms(fn, repeat: int) -> tuple[float, object]:
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+class Command(BaseCommand):
+    help = "전처리 전/후 페이지당 OCR 시간을 비교합니다. (기본: media/transcripts/pages 의 샘플 이미지)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="*", help="측정할 이미지 경로 (생략 시 media/transcripts/pages/*)")
+        parser.add_argument("--repeat", type=int, default=3, help="경로별 반복 횟수 (중앙값 사용)")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON 한 줄씩 출력")
+
+    def handle(self, *args, **options):
+        from transcripts.custom_paddle_ocr_script import get_ocr
+
+        paths = options["paths"] or sorted(
+            str(p) for p in (Path(settings.MEDIA_ROOT) / "transcripts" / "pages").iterdir() if p.is_file()
+        )
+        repeat = max(1, options["repeat"])
+        preprocess = ocr_pool.preprocess_options() or DEFAULT_OPTIONS
+
+        ocr = get_ocr()  # 모델 로드 시간은 측정에서 제외
+        for path in paths:
+            ocr.run_ocr(path)  # 워밍업
+            before = load_image(path)
+
+            raw_ms, _ = _median_ms(lambda: ocr.run_ocr(path), repeat)
+            pre_ms, img = _median_ms(lambda: preprocess_page(path, preprocess), repeat)
+            ocr_ms, _ = _median_ms(lambda: ocr.run_ocr(img), repeat)
+
+            row = {
+                "path": path,
+                "pixels_before": int(before.shape[0] * before.shape[1]),
+                "pixels_after": int(img.shape[0] * img.shape[1]),
+                "raw_ocr_ms": round(raw_ms, 1),
+                "preprocess_ms": round(pre_ms, 1),
+                "preprocessed_ocr_ms": round(ocr_ms, 1),
+                "total_after_ms": round(pre_ms + ocr_ms, 1),
+                "speedup": round(raw_ms / (pre_ms + ocr_ms), 2) if (pre_ms + ocr_ms) else None,
+                "options": preprocess,
+            }
+            if options["json"]:
+                self.stdout.write(json.dumps(row, ensure_ascii=False))
+            else:
+                self.stdout.write(
+                    f"{Path(path).name}: {row['pixels_before']}px → {row['pixels_after']}px | "
+                    f"원본 OCR {row['raw_ocr_ms']}ms → 전처리 {row['preprocess_ms']}ms + OCR {row['preprocessed_ocr_ms']}ms "
+                    f"(x{row['speedup']})"
+                )
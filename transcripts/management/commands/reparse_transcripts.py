@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand
+
+from analysis import snapshots
+from analysis.utils import get_valid_courses
+from transcripts.courses import sync_transcript_courses
+from transcripts.ocr_cache import get_cached_rows, rows_from_raw
+from transcripts.models import Transcript
+from transcripts.parser import PARSER_VERSION, build_parsed_data, needs_reparse, raw_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "저장된 OCR 원본 행(raw_rows)으로 과목 레코드를 다시 파싱합니다 (OCR 재실행 없음). "
+        f"기본은 파서 버전이 {PARSER_VERSION} 이 아닌 성적표만 처리합니다. "
+        "--from-ocr 이면 페이지별로 저장된 OCR 원본 결과에서 셀 행부터 다시 만듭니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="현재 파서 버전으로 파싱된 성적표도 다시 파싱")
+        parser.add_argument("--ids", help="처리할 성적표 id (콤마 구분)")
+        parser.add_argument("--from-ocr", action="store_true", help="저장된 OCR 원본 결과로 셀 행을 다시 만든 뒤 파싱")
+        parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 파싱 결과 과목 수만 출력")
+
+    def handle(self, *args, **options):
+        qs = Transcript.objects.filter(status=Transcript.STATUS.done).exclude(parsed_data=None).order_by("id")
+        if options["ids"]:
+            qs = qs.filter(id__in=[int(i) for i in options["ids"].split(",") if i.strip()])
+
+        count = skipped = 0
+        for t in qs.iterator(chunk_size=200):
+            rows = raw_rows(t.parsed_data)
+            changed = False
+            if options["from_ocr"]:  # OCR 결과가 없는 성적표는 저장된 행 그대로
+                rebuilt = self._rows_from_ocr(t)
+                if rebuilt is not None:
+                    changed, rows = rebuilt != rows, rebuilt
+            if rows is None or not (options["all"] or changed or needs_reparse(t.parsed_data)):
+                skipped += 1
+                continue
+
+            parsed = build_parsed_data(rows)
+            count += 1
+            self.stdout.write(f"transcript={t.id} courses={len(parsed['courses'])}")
+            if options["dry_run"]:
+                continue
+
+            # 이전 과목 목록 기준으로 졸업 스냅샷에 증감분만 반영
+            previous = (get_valid_courses(t), t.updated_at)
+            t.parsed_data = parsed
+            t.save(update_fields=["parsed_data", "updated_at"])
+            sync_transcript_courses(t)
+            snapshots.on_transcript_processed(t, previous)
+
+        self.stdout.write(self.style.SUCCESS(f"{count}개 성적표 재파싱 완료 (건너뜀 {skipped}개)"))
+
+    @staticmethod
+    def _rows_from_ocr(t: Transcript) -> list[list[str]] | None:
+        """페이지 순서대로 이어 붙인 셀 행 (OCR 결과가 없는 페이지가 있으면 None)"""
+        pages = list(t.pages.order_by("page_number").values_list("content_hash", flat=True))
+        if not pages or not all(pages):
+            return None
+        found = get_cached_rows(pages)
+        found.update(rows_from_raw(d for d in pages if d not in found))
+        if any(d not in found for d in pages):
+            return None
+        return [row for d in pages for row in found[d]]
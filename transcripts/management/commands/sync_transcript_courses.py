@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from transcripts.courses import sync_transcript_courses
+from transcripts.models import Transcript
+
+
+class Command(BaseCommand):
+    help = "parsed_data 의 과목을 TranscriptCourse 테이블로 (재)적재합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="이미 적재된 성적표도 다시 적재")
+
+    def handle(self, *args, **options):
+        qs = Transcript.objects.filter(status=Transcript.STATUS.done)
+        if not options["all"]:
+            qs = qs.filter(courses_synced=False)
+
+        count = 0
+        for transcript in qs.iterator():
+            rows = sync_transcript_courses(transcript)
+            count += 1
+            self.stdout.write(f"transcript={transcript.id} courses={rows}")
+        self.stdout.write(self.style.SUCCESS(f"{count}개 성적표 적재 완료"))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcripts', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcript',
+            name='courses_synced',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='TranscriptCourse',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('semester', models.CharField(blank=True, max_length=20)),
+                ('code', models.CharField(blank=True, max_length=20)),
+                ('name', models.CharField(blank=True, max_length=200)),
+                ('normalized_name', models.CharField(blank=True, max_length=200)),
+                ('type', models.CharField(blank=True, max_length=50)),
+                ('major_field', models.CharField(blank=True, max_length=50)),
+                ('credit', models.IntegerField(default=0)),
+                ('grade', models.CharField(blank=True, max_length=5)),
+                ('retake', models.BooleanField(default=False)),
+                ('transcript', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='courses', to='transcripts.transcript')),
+            ],
+            options={
+                'ordering': ['transcript', 'position'],
+                'indexes': [models.Index(fields=['transcript', 'semester'], name='transcripts_transcr_ed7547_idx'), models.Index(fields=['transcript', 'code'], name='transcripts_transcr_e7a898_idx'), models.Index(fields=['transcript', 'normalized_name'], name='transcripts_transcr_2f9266_idx'), models.Index(fields=['transcript', 'type'], name='transcripts_transcr_4b8c0b_idx'), models.Index(fields=['transcript', 'major_field'], name='transcripts_transcr_ba64ff_idx'), models.Index(fields=['transcript', 'retake', 'grade'], name='transcripts_transcr_981b7f_idx')],
+            },
+        ),
+    ]
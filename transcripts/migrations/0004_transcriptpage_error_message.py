@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcripts', '0003_transcriptcourse'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcriptpage',
+            name='error_message',
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcripts', '0005_ocr_page_cache'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transcript',
+            index=models.Index(fields=['user', '-created_at'], name='transcript_user_created_idx'),
+        ),
+    ]
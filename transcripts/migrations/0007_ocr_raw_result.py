@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcripts', '0006_transcript_transcript_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OcrRawResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64)),
+                ('ocr_version', models.CharField(max_length=50)),
+                ('data', models.BinaryField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('content_hash', 'ocr_version')},
+            },
+        ),
+    ]
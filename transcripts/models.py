@@ -24,11 +24,19 @@ class Transcript(models.Model):
         choices=STATUS.choices,
         default=STATUS.pending
     )
-    parsed_data = models.JSONField(null=True, blank=True)  # 파싱 결과 저장
+    parsed_data = models.JSONField(null=True, blank=True)  # 파싱 결과 저장 {"courses", "raw_rows", "parser_version"} (transcripts.parser)
+    # parsed_data 의 과목이 TranscriptCourse 로 적재되었는지 (semesters 조회 시 DB 경로 사용)
+    courses_synced = models.BooleanField(default=False)
     error_message = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 사용자별 최신 성적표 조회 (filter(user_id=...).order_by("-created_at"))
+            models.Index(fields=['user', '-created_at'], name='transcript_user_created_idx'),
+        ]
+
     def __str__(self):
         return f"Transcript(user={self.user}, status={self.status})"
 
@@ -41,6 +49,102 @@ class TranscriptPage(models.Model):
     )
     file = models.FileField(upload_to='transcripts/pages/')
     page_number = models.PositiveIntegerField()
+    error_message = models.TextField(null=True, blank=True)  # 이 페이지 OCR 실패 사유
+    # 업로드 원본 SHA-256 — 같은 이미지 재업로드 시 저장 파일/OCR 결과 재사용
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
 
     def __str__(self):
         return f"Page {self.page_number} of Transcript({self.transcript_id})"
+
+
+class OcrPageCache(models.Model):
+    """(페이지 내용 해시, OCR 엔진 버전) → OCR 결과 행. 동일 이미지는 PaddleOCR 를 다시 돌리지 않는다."""
+    content_hash = models.CharField(max_length=64)
+    engine_version = models.CharField(max_length=50)
+    rows = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('content_hash', 'engine_version')
+
+    def __str__(self):
+        return f"OcrPageCache({self.content_hash[:12]}, {self.engine_version})"
+
+
+class OcrRawResult(models.Model):
+    """
+    (페이지 내용 해시, OCR 버전) → PaddleOCR 원본 결과 (상자 / 글자 / 신뢰도, transcripts.ocr_raw 압축 형식).
+    셀 격자 구성이나 파서가 바뀌어도 추론 없이 이 결과에서 다시 만든다.
+    """
+    content_hash = models.CharField(max_length=64)
+    ocr_version = models.CharField(max_length=50)  # 모델 + 전처리 (셀 격자 버전은 포함하지 않음)
+    data = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('content_hash', 'ocr_version')
+
+    def __str__(self):
+        return f"OcrRawResult({self.content_hash[:12]}, {self.ocr_version})"
+
+
+class TranscriptCourseQuerySet(models.QuerySet):
+    def valid(self):
+        """F 성적 및 재수강 제외"""
+        return self.exclude(grade="F").filter(retake=False)
+
+    def credit_totals(self, *fields):
+        """fields 별 학점 합계 / 과목 수 (SUM, COUNT ... GROUP BY) → [{*fields, total_credit, course_count}]"""
+        return (
+            self.values(*fields)
+            .annotate(total_credit=models.Sum("credit"), course_count=models.Count("id"))
+            .order_by(*fields)
+        )
+
+
+class TranscriptCourse(models.Model):
+    """parsed_data 의 과목 레코드를 정규화해 저장 (학기/구분별 조회·집계를 인덱스로 처리)"""
+    transcript = models.ForeignKey(
+        Transcript,
+        on_delete=models.CASCADE,
+        related_name='courses'
+    )
+    position = models.PositiveIntegerField()                       # parsed_data 내 순서 (응답 순서 유지)
+    semester = models.CharField(max_length=20, blank=True)         # 예: 3-1
+    code = models.CharField(max_length=20, blank=True)             # 학수번호
+    name = models.CharField(max_length=200, blank=True)
+    normalized_name = models.CharField(max_length=200, blank=True)  # analysis.utils._norm
+    type = models.CharField(max_length=50, blank=True)             # 예: 전공 / 교양 / 드볼 / MSC
+    major_field = models.CharField(max_length=50, blank=True)      # 예: 전공필수 / 교양선택 / 드볼 영역명
+    credit = models.IntegerField(default=0)
+    grade = models.CharField(max_length=5, blank=True)
+    retake = models.BooleanField(default=False)
+
+    objects = TranscriptCourseQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['transcript', 'position']
+        indexes = [
+            models.Index(fields=['transcript', 'semester']),
+            models.Index(fields=['transcript', 'code']),
+            models.Index(fields=['transcript', 'normalized_name']),
+            models.Index(fields=['transcript', 'type']),
+            models.Index(fields=['transcript', 'major_field']),
+            models.Index(fields=['transcript', 'retake', 'grade']),
+        ]
+
+    def __str__(self):
+        return f"{self.semester} {self.code} {self.name}"
+
+    def as_dict(self) -> dict:
+        """parsed_data 과목 레코드와 같은 형태"""
+        return {
+            "code": self.code,
+            "name": self.name,
+            "credit": self.credit,
+            "grade": self.grade,
+            "type": self.type,
+            "major_field": self.major_field,
+            "semester": self.semester,
+            "retake": self.retake,
+        }
@@ -0,0 +1,82 @@
+# transcripts/ocr_cache.py
+"""
+페이지 내용 해시 기반 중복 제거
+- 업로드: 같은 해시의 페이지가 이미 저장돼 있으면 파일을 다시 쓰지 않고 그 경로를 공유
+- OCR: (해시, 엔진 버전) 으로 결과 행을 캐시해 같은 이미지는 PaddleOCR 를 건너뜀
+- 원본: (해시, OCR 버전) 으로 PaddleOCR 원본 결과를 압축 저장 → 셀 격자 버전이 바뀌어도 추론 없이 행을 다시 만든다
+"""
+import hashlib
+
+from .layout import build_table
+from .models import OcrPageCache, OcrRawResult, TranscriptPage
+from .ocr_pool import engine_version, ocr_version
+from .ocr_raw import unpack
+
+
+def content_hash(f) -> str:
+    h = hashlib.sha256()
+    for chunk in f.chunks():
+        h.update(chunk)
+    f.seek(0)
+    return h.hexdigest()
+
+
+def find_stored_file(digest: str) -> str | None:
+    """같은 내용으로 이미 저장된 페이지 파일 이름 (스토리지에 실제로 남아 있는 것만)"""
+    page = (
+        TranscriptPage.objects
+        .filter(content_hash=digest)
+        .exclude(file="")
+        .order_by("id")
+        .first()
+    )
+    if page and page.file.storage.exists(page.file.name):
+        return page.file.name
+    return None
+
+
+def get_cached_rows(digests) -> dict[str, list[list[str]]]:
+    digests = {d for d in digests if d}
+    if not digests:
+        return {}
+    return dict(
+        OcrPageCache.objects
+        .filter(content_hash__in=digests, engine_version=engine_version())
+        .values_list("content_hash", "rows")
+    )
+
+
+def store_rows(results: dict[str, list[list[str]]]) -> None:
+    version = engine_version()
+    OcrPageCache.objects.bulk_create(
+        [OcrPageCache(content_hash=d, engine_version=version, rows=rows) for d, rows in results.items() if d],
+        ignore_conflicts=True,
+    )
+
+
+def get_raw_results(digests) -> dict[str, bytes]:
+    """해시 → OCR 원본 결과 (transcripts.ocr_raw 형식)"""
+    digests = {d for d in digests if d}
+    if not digests:
+        return {}
+    return {
+        d: bytes(data)
+        for d, data in OcrRawResult.objects
+        .filter(content_hash__in=digests, ocr_version=ocr_version())
+        .values_list("content_hash", "data")
+    }
+
+
+def rows_from_raw(digests) -> dict[str, list[list[str]]]:
+    """저장된 원본 결과로 셀 행 다시 만들기 (추론 없음). 만든 행은 행 캐시에도 저장"""
+    rows = {d: build_table(unpack(data)) for d, data in get_raw_results(digests).items()}
+    store_rows(rows)
+    return rows
+
+
+def store_raw_results(results: dict[str, bytes]) -> None:
+    version = ocr_version()
+    OcrRawResult.objects.bulk_create(
+        [OcrRawResult(content_hash=d, ocr_version=version, data=data) for d, data in results.items() if d and data],
+        ignore_conflicts=True,
+    )
@@ -0,0 +1,223 @@
+# transcripts/ocr_pool.py
+"""
+OCR 워커 풀
+
+- PaddleOCR 모델은 워커 프로세스마다 initializer 에서 한 번만 로드하고 계속 재사용한다.
+  (웹 프로세스는 이 모듈을 import 해도 모델을 로드하지 않음)
+- 프로세스 수: settings.OCR_POOL_PROCESSES (0 이면 풀 없이 현재 프로세스에서 실행)
+- 모델 소유자는 한 곳: 자식 프로세스를 둘 수 있는 워커 프로세스(Celery --pool=threads / solo)의 풀 하나.
+  Celery prefork 자식처럼 데몬 프로세스거나 use_in_process() 를 부른 프로세스는 풀을 만들지 않고
+  그 프로세스에 모델을 직접 로드한다 (중첩 풀 없음 — 권장 워커 명령은 settings.OCR_POOL_PROCESSES 참고).
+- 시작 방식: settings.OCR_POOL_START_METHOD (기본 spawn — DB 연결/스레드 상태를 fork 하지 않음)
+- 여러 페이지는 동시에 풀로 보내되(성적표당 동시 처리 상한 적용) 결과는 입력 순서대로 돌려준다.
+  진행률 콜백은 끝나는 순서대로 부른다 (앞 페이지가 느려도 뒤 페이지 완료가 바로 보고됨).
+- 페이지는 settings.OCR_BATCH_SIZE 장씩 묶어 한 작업으로 보내고, 워커는 묶음 전체를 한 번의 배치 추론으로 처리한다.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+# OCR 모델/언어가 바뀌면 올린다 (원본 결과 OcrRawResult 의 키)
+OCR_MODEL_VERSION = "paddleocr-korean"
+# 셀 격자 구성(transcripts.layout)이 바뀌면 올린다 — 원본 결과가 있으면 추론 없이 다시 만든다
+LAYOUT_VERSION = "grid-v1"
+# 셀 행 캐시 OcrPageCache 의 키 (모델 + 셀 격자)
+ENGINE_VERSION = f"{OCR_MODEL_VERSION}/{LAYOUT_VERSION}"
+# 전처리(축소/크롭/기울기 보정) 방식이 바뀌면 올린다
+PREPROCESS_VERSION = "pre-v1"
+
+_executor: ProcessPoolExecutor | None = None
+_lock = threading.Lock()
+_in_process = False
+
+
+# ---------------------------
+# 워커 프로세스에서 실행되는 함수들
+# ---------------------------
+def _init_worker():
+    from .custom_paddle_ocr_script import get_ocr
+    get_ocr()
+
+
+def _ping() -> bool:
+    return True
+
+
+def _page_result(result) -> tuple[list[list[str]], None, bytes]:
+    from .layout import build_table
+    from .ocr_raw import pack
+    return build_table(result), None, pack(result)
+
+
+def _ocr_batch(paths: list[str], preprocess: dict | None = None) -> list[tuple]:
+    """
+    묶음 단위 OCR. 반환: 입력 순서의 [(rows, None, 원본 결과) | (None, 에러 메시지, None)]
+    원본 결과는 transcripts.ocr_raw 압축 형식 (상자 / 글자 / 신뢰도)
+    읽기/전처리에 실패한 페이지만 에러로 남기고, 배치 추론이 실패하면 한 장씩 다시 시도한다.
+    """
+    from .custom_paddle_ocr_script import get_ocr
+    from .preprocess import load_image, preprocess_page
+
+    results: list = [None] * len(paths)
+    images, slots = [], []
+    for i, path in enumerate(paths):
+        try:
+            images.append(load_image(path) if preprocess is None else preprocess_page(path, preprocess))
+            slots.append(i)
+        except Exception as e:
+            results[i] = (None, str(e), None)
+
+    try:
+        for i, result in zip(slots, get_ocr().ocr_batch(images)):
+            results[i] = _page_result(result)
+    except Exception:
+        for i, image in zip(slots, images):
+            try:
+                results[i] = _page_result(get_ocr().ocr_batch([image])[0])
+            except Exception as e:
+                results[i] = (None, str(e), None)
+    return results
+
+
+# ---------------------------
+# 풀 관리
+# ---------------------------
+def use_in_process() -> None:
+    """이 프로세스에서는 풀을 만들지 않고 모델을 직접 로드해 실행"""
+    global _in_process
+    _in_process = True
+
+
+def _processes() -> int:
+    # 데몬 프로세스는 자식 프로세스를 만들 수 없다
+    if _in_process or multiprocessing.current_process().daemon:
+        return 0
+    return getattr(settings, "OCR_POOL_PROCESSES", 0)
+
+
+def _batch_size() -> int:
+    return max(1, getattr(settings, "OCR_BATCH_SIZE", 1))
+
+
+def preprocess_options() -> dict | None:
+    """워커로 넘길 전처리 옵션 (비활성화 시 None → 원본 그대로 OCR)"""
+    if not getattr(settings, "OCR_PREPROCESS", True):
+        return None
+    return {
+        "max_width": getattr(settings, "OCR_PREPROCESS_MAX_WIDTH", 1600),
+        "crop_table": getattr(settings, "OCR_PREPROCESS_CROP_TABLE", True),
+        "deskew": getattr(settings, "OCR_PREPROCESS_DESKEW", False),
+    }
+
+
+def _with_preprocess(version: str) -> str:
+    opts = preprocess_options()
+    if opts is None:
+        return version
+    flags = f"w{opts['max_width']}{'c' if opts['crop_table'] else ''}{'d' if opts['deskew'] else ''}"
+    return f"{version}/{PREPROCESS_VERSION}-{flags}"
+
+
+def engine_version() -> str:
+    """셀 행을 식별하는 버전 (모델 + 셀 격자 + 전처리 옵션)"""
+    return _with_preprocess(ENGINE_VERSION)
+
+
+def ocr_version() -> str:
+    """OCR 원본 결과를 식별하는 버전 (모델 + 전처리 옵션 — 전처리가 바뀌면 좌표도 바뀐다)"""
+    return _with_preprocess(OCR_MODEL_VERSION)
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=_processes(),
+                mp_context=multiprocessing.get_context(getattr(settings, "OCR_POOL_START_METHOD", "spawn")),
+                initializer=_init_worker,
+            )
+        return _executor
+
+
+def shutdown(wait: bool = True) -> None:
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait, cancel_futures=True)
+            _executor = None
+
+
+def warm_up(wait: bool = True) -> None:
+    """
+    워커를 모두 띄워 모델을 미리 로드.
+    wait=False 면 기동만 걸어두고 바로 반환 (풀 없이 실행하는 설정에서는 아무것도 하지 않음)
+    """
+    if _processes() <= 0:
+        if wait:
+            _init_worker()
+        return
+    pool = get_pool()
+    futures = [pool.submit(_ping) for _ in range(_processes())]
+    if wait:
+        for f in futures:
+            f.result()
+
+
+def ocr_pages(paths: list[str], max_in_flight: int | None = None, on_result=None) -> list[tuple]:
+    """
+    여러 페이지를 병렬 OCR.
+    반환: 입력 순서와 같은 [(rows, None, 원본 결과) | (None, 에러 메시지, None)] — 한 페이지 실패가 나머지를 막지 않는다.
+    max_in_flight: 이 호출(성적표 한 건)이 동시에 풀에 올릴 수 있는 작업(묶음) 수
+    on_result: 페이지 결과가 나올 때마다(끝난 순서) on_result(입력 인덱스, (rows, error, raw)) 호출 (진행률 보고용)
+    """
+    preprocess = preprocess_options()
+    size = _batch_size()
+    chunks = [(i, paths[i:i + size]) for i in range(0, len(paths), size)]  # (첫 페이지 입력 인덱스, 묶음)
+    results: list = [None] * len(paths)
+
+    def collect(start: int, chunk_results):
+        for offset, r in enumerate(chunk_results):
+            results[start + offset] = r
+            if on_result is not None:
+                on_result(start + offset, r)
+
+    if _processes() <= 0:
+        _init_worker()
+        for start, chunk in chunks:
+            collect(start, _ocr_batch(chunk, preprocess))
+        return results
+
+    pool = get_pool()
+    limit = max(1, max_in_flight or _processes())
+    queue = iter(chunks)
+    pending: dict = {}  # future → (첫 페이지 입력 인덱스, 묶음)
+    broken = False
+
+    while True:
+        # 상한까지 채워 넣고, 끝난 묶음부터 결과 반영
+        while len(pending) < limit and (item := next(queue, None)) is not None:
+            try:
+                pending[pool.submit(_ocr_batch, item[1], preprocess)] = item
+            except BrokenProcessPool as e:
+                broken = True
+                collect(item[0], [(None, str(e) or "OCR 워커 비정상 종료", None)] * len(item[1]))
+        if not pending:
+            break
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            start, chunk = pending.pop(future)
+            try:
+                collect(start, future.result())
+            except BrokenProcessPool as e:
+                broken = True
+                collect(start, [(None, str(e) or "OCR 워커 비정상 종료", None)] * len(chunk))
+            except Exception as e:
+                collect(start, [(None, str(e), None)] * len(chunk))
+    if broken:
+        shutdown(wait=False)
+    return results
@@ -0,0 +1,40 @@
+# transcripts/ocr_raw.py
+"""
+PaddleOCR 원본 결과(상자 / 글자 / 신뢰도)의 압축 저장 형식 (Django 없이 OCR 워커에서도 사용)
+
+npz(zlib) 한 덩어리에 열 단위 배열로 저장한다.
+- boxes   : float32 (n, 4, 2)  4점 좌표
+- scores  : float32 (n,)
+- text    : uint8   UTF-8 로 이어 붙인 글자
+- offsets : int32   (n + 1,)   text 안에서 i 번째 글자의 [시작, 끝)
+pickle 을 쓰지 않으므로 DB 에서 읽은 값을 그대로 np.load 해도 안전하다.
+"""
+import io
+
+import numpy as np
+
+
+def pack(result) -> bytes:
+    """PaddleOCR 형식 [[box, (text, score)], ...] → bytes"""
+    result = result or []
+    boxes = np.asarray([r[0] for r in result], dtype=np.float32).reshape(len(result), 4, 2)
+    scores = np.asarray([r[1][1] for r in result], dtype=np.float32)
+    encoded = [str(r[1][0]).encode("utf-8") for r in result]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int32)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    text = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    buf = io.BytesIO()
+    np.savez_compressed(buf, boxes=boxes, scores=scores, text=text, offsets=offsets)
+    return buf.getvalue()
+
+
+def unpack(data) -> list[list]:
+    """bytes → PaddleOCR 형식 [[box, (text, score)], ...] (transcripts.layout.build_table 입력)"""
+    with np.load(io.BytesIO(bytes(data))) as z:
+        boxes, scores, offsets = z["boxes"], z["scores"], z["offsets"]
+        text = z["text"].tobytes()
+    return [
+        [boxes[i].tolist(), (text[offsets[i]:offsets[i + 1]].decode("utf-8"), float(scores[i]))]
+        for i in range(len(scores))
+    ]
@@ -0,0 +1,143 @@
+# transcripts/parser.py
+"""
+OCR 셀 행 → 과목 레코드 (Celery 태스크에서 한 번만 실행)
+
+셀을 한 줄로 이어 읽으며 학수번호 → 과목명 → 학점 → 성적 순서로 레코드를 만든다 (빈 칸은 건너뜀).
+좌표 기반 격자(transcripts.layout)와, 글자를 6칸씩 다시 묶었던 예전 OCR 행(raw_rows) 모두 같은 방식으로 읽는다.
+- 학기 머리글: "2021학년도 1학기" → "2021-1", "3학년 1학기" → "3-1" (두 셀로 나뉘어도 인식)
+- 학수번호 앞의 셀(최대 2개): 이수구분(type) / 영역(major_field)
+- 성적 뒤에 "재수강" 표시가 오면 retake
+저장 형식: {"courses": [...], "raw_rows": OCR 행 그대로, "parser_version": PARSER_VERSION}
+→ 파싱 규칙이 바뀌면 PARSER_VERSION 을 올리고 reparse_transcripts 로 OCR 없이 다시 파싱한다.
+"""
+import re
+
+PARSER_VERSION = "rows-v1"
+
+_CODE = re.compile(r"^(?=.{5,12}$)[A-Za-z]{0,4}\d{3,8}(?:-\d{1,3})?$")
+_CREDIT = re.compile(r"^\d{1,2}(?:\.\d)?$")
+_GRADE = re.compile(r"^(?:[A-D][+0]?|F|P|NP|S|U)$")
+_SEMESTER = re.compile(r"(\d{1,4})\s*학년도?\s*(\d|여름|겨울)\s*학기")
+_YEAR = re.compile(r"^(\d{1,4})\s*학년도?$")
+_TERM = re.compile(r"^(\d|여름|겨울)\s*학기$")
+TERMS = {"여름": "S", "겨울": "W"}
+
+HEADERS = {"이수구분", "구분", "영역", "학수번호", "과목코드", "교과목명", "과목명", "학점", "성적", "등급", "비고"}
+RETAKE_MARKS = {"재수강", "재", "R"}
+TYPE_PREFIXES = ("전공", "교양", "드볼", "일반", "특성화", "MSC", "SW", "데이터")
+
+
+def _grade(token: str) -> str | None:
+    """성적 셀 → 표준 표기 (A0 의 0 을 O 로 읽은 경우 보정)"""
+    g = token.replace(" ", "").upper().replace("O", "0")
+    if g in ("A", "B", "C", "D"):
+        g += "0"
+    return g if _GRADE.match(g) else None
+
+
+def _credit(token: str) -> int:
+    try:
+        return int(float(token))
+    except ValueError:
+        return 0
+
+
+def _semester(year: str, term: str) -> str:
+    return f"{year}-{TERMS.get(term, term)}"
+
+
+def _prefix(tokens: list[str]) -> tuple[str, str]:
+    """학수번호 앞 셀 → (type, major_field)"""
+    tokens = tokens[-2:]
+    if len(tokens) == 2:
+        return tokens[0], tokens[1]
+    if tokens and tokens[0].startswith(TYPE_PREFIXES):
+        return tokens[0], ""
+    return "", tokens[0] if tokens else ""
+
+
+def _tokens(rows) -> list[str]:
+    return [str(cell).strip() for row in rows for cell in (row if isinstance(row, list) else [row]) if str(cell).strip()]
+
+
+def parse_rows(rows: list[list[str]]) -> list[dict]:
+    """OCR 셀 행 → [{code, name, credit, grade, type, major_field, semester, retake}]"""
+    courses: list[dict] = []
+    semester = ""
+    year = None          # 학년(도)만 읽고 학기를 기다리는 중
+    pending: list[str] = []  # 직전 레코드 이후 셀 (이수구분 / 영역 후보)
+    record = None        # 학수번호를 읽은 뒤 성적까지 모으는 중: [code, prefix, body]
+
+    for token in _tokens(rows):
+        m = _SEMESTER.search(token)
+        if m:
+            semester, year, pending, record = _semester(*m.groups()), None, [], None
+            continue
+        if year is not None:
+            term = _TERM.match(token)
+            if term:
+                semester, year, pending, record = _semester(year, term.group(1)), None, [], None
+                continue
+            year = None
+        m = _YEAR.match(token)
+        if m:
+            year = m.group(1)
+            continue
+        if token in HEADERS:
+            continue
+
+        if record is None:
+            if token in RETAKE_MARKS and courses and not pending:
+                courses[-1]["retake"] = True
+            elif _CODE.match(token):
+                record = [token, _prefix(pending), []]
+                pending = []
+            else:
+                pending.append(token)
+            continue
+
+        if _CODE.match(token):  # 성적 없이 다음 학수번호 → 앞 레코드는 버림
+            record = [token, _prefix(record[2]), []]
+            continue
+        grade = _grade(token)
+        code, (ctype, field), body = record
+        if grade is None or not body:
+            body.append(token)
+            continue
+        # 성적 직전의 숫자 셀이 학점, 나머지가 과목명
+        credit = 0
+        if len(body) > 1 and _CREDIT.match(body[-1]):
+            credit = _credit(body.pop())
+        courses.append({
+            "code": code,
+            "name": " ".join(body),
+            "credit": credit,
+            "grade": grade,
+            "type": ctype,
+            "major_field": field,
+            "semester": semester,
+            "retake": False,
+        })
+        record = None
+
+    return courses
+
+
+def build_parsed_data(rows: list[list[str]]) -> dict:
+    """parsed_data 저장 형식"""
+    return {"courses": parse_rows(rows), "raw_rows": rows, "parser_version": PARSER_VERSION}
+
+
+def raw_rows(parsed) -> list[list[str]] | None:
+    """저장된 parsed_data 에서 OCR 원본 행 (없으면 None — 과목 레코드만 있는 과거 데이터)"""
+    if isinstance(parsed, dict):
+        return parsed.get("raw_rows")
+    if isinstance(parsed, list) and parsed and all(isinstance(r, list) for r in parsed):
+        return parsed  # 파서 도입 전: OCR 행을 그대로 저장
+    return None
+
+
+def needs_reparse(parsed) -> bool:
+    return raw_rows(parsed) is not None and (
+        not isinstance(parsed, dict) or parsed.get("parser_version") != PARSER_VERSION
+    )
@@ -0,0 +1,92 @@
+# transcripts/preprocess.py
+"""
+OCR 전 이미지 전처리
+
+PaddleOCR 검출 시간은 픽셀 수에 비례하므로, 원본(폰 스크린샷/레티나 캡처)을 그대로 넘기지 않고
+1) EXIF 방향 반영해 읽기   2) 목표 가로 해상도로 축소   3) 그레이스케일
+4) 표 영역(괘선) 검출 후 그 바깥 여백/제목 크롭   5) (선택) 기울기 보정
+을 거친 배열을 OCR 에 넘긴다. 스크린샷에는 실제 DPI 정보가 없어 가로 픽셀 수를 해상도 기준으로 쓴다.
+"""
+import cv2
+import numpy as np
+
+DEFAULT_OPTIONS = {
+    "max_width": 1600,    # 이보다 넓으면 이 폭으로 축소 (확대는 하지 않음)
+    "crop_table": True,
+    "deskew": False,
+}
+
+
+def load_image(path: str) -> np.ndarray:
+    # IMREAD_COLOR 는 EXIF Orientation 을 반영해 회전된 상태로 읽는다
+    img = cv2.imread(path, cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError(f"이미지를 읽을 수 없습니다: {path}")
+    return img
+
+
+def resize_to_width(img: np.ndarray, max_width: int) -> np.ndarray:
+    h, w = img.shape[:2]
+    if not max_width or w <= max_width:
+        return img
+    scale = max_width / w
+    return cv2.resize(img, (max_width, max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+
+
+def to_gray(img: np.ndarray) -> np.ndarray:
+    return img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
+
+def find_table_region(gray: np.ndarray, pad: int = 4) -> tuple[int, int, int, int] | None:
+    """
+    가로/세로 괘선을 형태학 연산으로 뽑아 표 영역들의 합집합 bbox (x0, y0, x1, y1) 반환.
+    다단 배치(학기별 표가 좌우로 여러 개)여도 모든 표를 포함하도록 가장 큰 하나가 아니라 합집합을 쓴다.
+    """
+    h, w = gray.shape[:2]
+    binary = cv2.adaptiveThreshold(
+        ~gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 15, -2
+    )
+    horiz = cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (max(10, w // 30), 1)))
+    vert = cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (1, max(10, h // 60))))
+    lines = cv2.dilate(horiz | vert, np.ones((3, 3), np.uint8))
+
+    contours, _ = cv2.findContours(lines, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    min_area = (w * h) * 0.01
+    boxes = [cv2.boundingRect(c) for c in contours]
+    boxes = [(x, y, x + bw, y + bh) for x, y, bw, bh in boxes if bw * bh >= min_area]
+    if not boxes:
+        return None
+
+    x0 = max(0, min(b[0] for b in boxes) - pad)
+    y0 = max(0, min(b[1] for b in boxes) - pad)
+    x1 = min(w, max(b[2] for b in boxes) + pad)
+    y1 = min(h, max(b[3] for b in boxes) + pad)
+    return x0, y0, x1, y1
+
+
+def deskew(gray: np.ndarray, max_angle: float = 10.0) -> np.ndarray:
+    """글자 픽셀의 최소 외접 사각형 각도로 기울기 추정 후 보정 (작은/과도한 각도는 무시)"""
+    coords = np.column_stack(np.where(gray < 128))
+    if len(coords) < 100:
+        return gray
+    angle = cv2.minAreaRect(coords[:, ::-1].astype(np.float32))[-1]
+    if angle > 45:
+        angle -= 90
+    if abs(angle) < 0.3 or abs(angle) > max_angle:
+        return gray
+    h, w = gray.shape[:2]
+    m = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    return cv2.warpAffine(gray, m, (w, h), flags=cv2.INTER_LINEAR, borderValue=255)
+
+
+def preprocess_page(path: str, options: dict | None = None) -> np.ndarray:
+    opts = {**DEFAULT_OPTIONS, **(options or {})}
+    gray = to_gray(resize_to_width(load_image(path), opts["max_width"]))
+    if opts["deskew"]:
+        gray = deskew(gray)
+    if opts["crop_table"]:
+        region = find_table_region(gray)
+        if region:
+            x0, y0, x1, y1 = region
+            gray = gray[y0:y1, x0:x1]
+    return gray
@@ -0,0 +1,122 @@
+# transcripts/progress.py
+"""
+성적표 처리 진행 상태
+
+- 사용자별 최신 성적표의 진행 상태(전체 상태 + 페이지별 상태)를 캐시에 보관한다.
+  process_transcript 가 페이지 OCR 이 끝날 때마다 갱신하고, 상태 조회(ETag) / long-poll / SSE 스트림은 캐시만 읽는다.
+- 캐시에 없으면 DB 에서 한 번 만들어 짧게(TRANSCRIPT_PROGRESS_FALLBACK_TIMEOUT) 캐시 → 폴링이 몰려도 DB 조회는 주기당 1회.
+- 웹/Celery 프로세스가 같은 상태를 보려면 공유 캐시(REDIS_CACHE_URL)가 필요하다.
+  LocMem 캐시에서는 웹 프로세스가 DB 폴백만 보게 되어 페이지 단위 진행률 없이 상태만 갱신된다.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import quote_etag
+
+from .models import Transcript
+
+STATE_PREFIX = "transcripts:progress"
+DEFAULT_TIMEOUT = 60 * 60          # 태스크가 쓴 상태: 1시간
+DEFAULT_FALLBACK_TIMEOUT = 2       # DB 에서 만든 상태: 2초
+TERMINAL_STATUSES = {Transcript.STATUS.done, Transcript.STATUS.error}
+
+
+def _key(user_id: int) -> str:
+    return f"{STATE_PREFIX}:{user_id}"
+
+
+def _timeout() -> int:
+    return getattr(settings, "TRANSCRIPT_PROGRESS_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def _fallback_timeout() -> int:
+    return getattr(settings, "TRANSCRIPT_PROGRESS_FALLBACK_TIMEOUT", DEFAULT_FALLBACK_TIMEOUT)
+
+
+def make_state(transcript, pages: list[dict]) -> dict:
+    """pages: [{"page": 번호, "status": pending|done|error}, ...] (page_number 순)"""
+    return {
+        "transcript_id": transcript.id,
+        "status": transcript.status.lower(),
+        "pages_total": len(pages),
+        "pages_done": sum(1 for p in pages if p["status"] == "done"),
+        "pages_failed": sum(1 for p in pages if p["status"] == "error"),
+        "pages": pages,
+        "error_message": transcript.error_message,
+    }
+
+
+def state_from_db(user_id: int) -> dict | None:
+    transcript = (
+        Transcript.objects
+        .filter(user_id=user_id)
+        .only("id", "status", "error_message")
+        .order_by("-created_at")
+        .first()
+    )
+    if transcript is None:
+        return None
+
+    finished = transcript.status in TERMINAL_STATUSES
+    pages = [
+        {"page": number, "status": ("error" if error else "done") if finished else "pending"}
+        for number, error in transcript.pages.order_by("page_number").values_list("page_number", "error_message")
+    ]
+    return make_state(transcript, pages)
+
+
+def get_state(user_id: int) -> dict | None:
+    state = cache.get(_key(user_id))
+    if state is not None:
+        return state
+    state = state_from_db(user_id)
+    if state is not None:
+        # add: 그 사이 태스크가 쓴 최신 상태를 덮어쓰지 않는다
+        cache.add(_key(user_id), state, _fallback_timeout())
+    return state
+
+
+def publish(user_id: int, state: dict) -> None:
+    cache.set(_key(user_id), state, _timeout())
+
+
+def reset(user_id: int) -> None:
+    """새 업로드 직후 — 이전 성적표 상태를 지워 다음 조회가 새 성적표를 보도록"""
+    cache.delete(_key(user_id))
+
+
+def etag(state: dict) -> str:
+    raw = json.dumps(state, sort_keys=True, ensure_ascii=False).encode()
+    return quote_etag(hashlib.md5(raw).hexdigest()[:16])
+
+
+class ProgressTracker:
+    """process_transcript 에서 페이지 단위 진행을 기록"""
+
+    def __init__(self, transcript, pages):
+        self.transcript = transcript
+        self._pages = {page.page_number: "pending" for page in pages}
+
+    def _publish(self) -> None:
+        pages = [{"page": n, "status": s} for n, s in sorted(self._pages.items())]
+        publish(self.transcript.user_id, make_state(self.transcript, pages))
+
+    def start(self, done_pages=()) -> None:
+        """처리 시작 (캐시로 바로 끝난 페이지는 done 으로 표시)"""
+        for page in done_pages:
+            self._pages[page.page_number] = "done"
+        self._publish()
+
+    def page_finished(self, page, error: str | None = None) -> None:
+        self._pages[page.page_number] = "error" if error else "done"
+        self._publish()
+
+    def finish(self) -> None:
+        """최종 상태 반영 (transcript 의 status / error_message 는 호출 전에 저장돼 있어야 함)"""
+        if self.transcript.status not in TERMINAL_STATUSES:
+            return
+        if self.transcript.status == Transcript.STATUS.error:
+            self._pages = {n: ("done" if s == "done" else "error") for n, s in self._pages.items()}
+        self._publish()
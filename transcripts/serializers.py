@@ -1,6 +1,7 @@
 # transcripts/serializers.py
 from rest_framework import serializers
 from .models import Transcript, TranscriptPage
+from .ocr_cache import content_hash, find_stored_file
 
 
 class TranscriptUploadSerializer(serializers.ModelSerializer):
@@ -18,12 +19,14 @@ class TranscriptUploadSerializer(serializers.ModelSerializer):
         # Transcript 레코드 생성 (user만으로)
         transcript = Transcript.objects.create(user=user, **validated_data)
 
-        # 페이지별 파일 저장
+        # 페이지별 파일 저장 (같은 내용의 파일이 이미 있으면 그 파일을 공유)
         for idx, f in enumerate(files, start=1):
+            digest = content_hash(f)
             TranscriptPage.objects.create(
                 transcript=transcript,
-                file=f,
-                page_number=idx
+                file=find_stored_file(digest) or f,
+                page_number=idx,
+                content_hash=digest,
             )
         return transcript
 
@@ -1,8 +1,42 @@
 # transcripts/tasks.py
 
 from celery import shared_task
-from .utils import parse_single_table_with_paddle
-from .models import Transcript
+from celery.concurrency.prefork import TaskPool as PreforkPool
+from celery.signals import worker_process_init, worker_ready
+from django.db.models import Q
+from analysis import snapshots
+from analysis.utils import get_valid_courses
+from users.models import User
+from . import ocr_pool
+from .utils import parse_pages_with_paddle
+from .parser import build_parsed_data
+from .models import Transcript, TranscriptPage
+from .courses import sync_transcript_courses
+from .ocr_cache import get_cached_rows, rows_from_raw, store_raw_results, store_rows
+from .progress import ProgressTracker, reset as reset_progress
+
+@worker_process_init.connect
+def use_in_process_ocr(**kwargs):
+    # prefork 자식 프로세스(데몬)는 OCR 풀을 둘 수 없다 → 이 프로세스에 모델을 직접 로드
+    # (이 시그널은 짧은 타임아웃 안에 끝나야 하므로 모델 로드는 첫 작업에서)
+    ocr_pool.use_in_process()
+
+
+@worker_ready.connect
+def warm_ocr_pool(sender=None, **kwargs):
+    # threads / solo 워커: 워커 프로세스가 OCR 풀을 소유 → 기동 시 미리 띄워 첫 업로드의 콜드 스타트 제거
+    # (prefork 부모 프로세스는 작업을 실행하지 않으므로 띄우지 않음)
+    if sender is None or isinstance(getattr(sender, "pool", None), PreforkPool):
+        return
+    ocr_pool.warm_up(wait=False)
+
+
+def mark_latest_transcript(t: Transcript) -> None:
+    """User.latest_transcript 를 t 로 (이미 더 최근 성적표를 가리키고 있으면 그대로 둠 — 이전 성적표 재처리)"""
+    User.objects.filter(pk=t.user_id).filter(
+        Q(latest_transcript__isnull=True) | Q(latest_transcript__created_at__lte=t.created_at)
+    ).update(latest_transcript=t)
+
 
 @shared_task
 def process_transcript(transcript_id: int):
@@ -11,23 +45,57 @@ def process_transcript(transcript_id: int):
     except Transcript.DoesNotExist:
         return
 
+    # 재처리면 이전 결과를 기억 → 졸업 스냅샷에 증감분만 반영
+    previous = (get_valid_courses(t), t.updated_at) if t.parsed_data else None
+
     # 상태 → 처리중
     t.status = Transcript.STATUS.processing
     t.save(update_fields=["status"])
+    tracker = None
 
     try:
         all_rows: list[list[str]] = []
 
-        # 1) 페이지별로 표 파싱 → 셀 단위 문자열 수집
-        for page in t.pages.order_by("page_number"):
-            print(f"[OCR 태스크] 페이지 {page.page_number} 처리 시작: {page.file.name}")
-            rows = parse_single_table_with_paddle(page.file)
-            all_rows.extend(rows)
+        # 1) 이미 OCR 한 적 있는 이미지(내용 해시 일치)는 캐시된 행 재사용
+        #    행 캐시가 없어도(셀 격자 버전 변경) 원본 결과가 저장돼 있으면 추론 없이 행을 다시 만든다
+        pages = list(t.pages.order_by("page_number"))
+        cached = get_cached_rows(page.content_hash for page in pages)
+        cached.update(rows_from_raw(page.content_hash for page in pages if page.content_hash not in cached))
+        todo = [page for page in pages if page.content_hash not in cached]
+        print(f"[OCR 태스크] transcript={t.id} 페이지 {len(pages)}장 처리 시작 (캐시 {len(pages) - len(todo)}장)")
+        tracker = ProgressTracker(t, pages)
+        tracker.start(done_pages=[page for page in pages if page.content_hash in cached])
+
+        # 2) 나머지는 OCR 풀에 병렬로 보내고, 결과는 page_number 순서대로 이어 붙임
+        #    (페이지가 끝날 때마다 진행 상태 갱신, 모두 캐시에 있으면 OCR 워커를 깨우지 않음)
+        results = {}
+        if todo:
+            results = dict(zip((page.id for page in todo), parse_pages_with_paddle(
+                [page.file for page in todo],
+                on_result=lambda i, result: tracker.page_finished(todo[i], result[1]),
+            )))
+        ok = [page for page in todo if page.content_hash and not results[page.id][1]]
+        store_raw_results({page.content_hash: results[page.id][2] for page in ok})
+        store_rows({page.content_hash: results[page.id][0] for page in ok})
 
-        # 2) 최종적으로 flat list를 JSONField에 저장
-        t.parsed_data   = all_rows
+        failed = []
+        for page in pages:
+            rows, error = (cached[page.content_hash], None) if page.id not in results else results[page.id][:2]
+            page.error_message = error
+            if error:
+                print(f"[OCR 태스크] 페이지 {page.page_number} 실패: {error}")
+                failed.append(f"{page.page_number}페이지: {error}")
+            else:
+                all_rows.extend(rows)
+        TranscriptPage.objects.bulk_update(pages, ["error_message"])
+
+        if pages and len(failed) == len(pages):
+            raise RuntimeError("모든 페이지 OCR 실패 — " + " / ".join(failed))
+
+        # 3) OCR 행을 과목 레코드로 파싱해 원본 행과 함께 저장 (일부 페이지 실패는 기록만)
+        t.parsed_data   = build_parsed_data(all_rows)
         t.status        = Transcript.STATUS.done
-        t.error_message = None
+        t.error_message = " / ".join(failed) if failed else None
 
     except Exception as e:
         print(f"Transcript processing failed for id={transcript_id}: {e}")
@@ -35,6 +103,19 @@ def process_transcript(transcript_id: int):
         t.error_message = str(e)
 
     finally:
-        t.save(update_fields=["parsed_data", "status", "error_message"])
+        # updated_at 포함 → 졸업 판정 스냅샷의 성적표 버전이 달라져 다음 조회에서 재계산
+        t.save(update_fields=["parsed_data", "status", "error_message", "updated_at"])
+        # 진행 상태에 최종 결과 반영 (페이지 목록 전에 실패했으면 다음 조회가 DB 에서 다시 만든다)
+        if tracker is not None:
+            tracker.finish()
+        else:
+            reset_progress(t.user_id)
+
+    # 4) 사용자 최신 성적표 포인터 갱신 + 과목 레코드를 정규화 테이블로 적재 (학기/구분별 조회용)
+    #    + 졸업요건 분석 스냅샷 갱신
+    if t.status == Transcript.STATUS.done:
+        mark_latest_transcript(t)
+        sync_transcript_courses(t)
+        snapshots.on_transcript_processed(t, previous)
 
     return t.status
\ No newline at end of file
@@ -1,3 +1,185 @@
-from django.test import TestCase
+import asyncio
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.models import User
+from .layout import build_table
+from .models import Transcript
+from . import ocr_pool, progress
+from .parser import PARSER_VERSION, build_parsed_data
+
+
+def box(x0: float, x1: float, y0: float, height: float = 12) -> list:
+    return [[x0, y0], [x1, y0], [x1, y0 + height], [x0, y0 + height]]
+
+
+class BuildTableTests(SimpleTestCase):
+    COLUMNS = [(0, 50), (70, 160), (180, 195), (215, 240)]
+
+    def result(self, rows: list[list], skew: float = 0.03) -> list:
+        """행마다 오른쪽으로 갈수록 skew 만큼 내려가는(기울어진) 상자"""
+        result = []
+        for r, cells in enumerate(rows):
+            y = 100 + r * 30
+            for (x0, x1), text in zip(self.COLUMNS, cells):
+                if text:
+                    result.append([box(x0, x1, y + skew * x0), (text, 0.99)])
+        return result
+
+    def test_skewed_rows_and_missing_cell(self):
+        table = build_table(self.result([
+            ["CSE2010", "자료구조", "3", "A+"],
+            ["GEN1001", None, "2", "B0"],
+            ["CSE3001", "운영체제", "3", "A0"],
+        ]))
+        self.assertEqual(table, [
+            ["CSE2010", "자료구조", "3", "A+"],
+            ["GEN1001", "", "2", "B0"],
+            ["CSE3001", "운영체제", "3", "A0"],
+        ])
+
+    def test_wide_header_does_not_merge_columns(self):
+        result = self.result([["CSE2010", "자료구조", "3", "A+"], ["CSE3001", "운영체제", "3", "A0"]])
+        result.append([box(0, 240, 60), ("2021학년도 1학기", 0.9)])
+        table = build_table(result)
+        self.assertEqual(len(table[0]), 4)
+        self.assertEqual([c for c in table[0] if c], ["2021학년도 1학기"])
+        self.assertEqual(table[1:], [["CSE2010", "자료구조", "3", "A+"], ["CSE3001", "운영체제", "3", "A0"]])
+
+    def test_empty(self):
+        self.assertEqual(build_table([]), [])
+        self.assertEqual(build_table(None), [])
+
+
+class BuildParsedDataTests(SimpleTestCase):
+    ROWS = [
+        ["2021학년도 1학기", "", "", "", "", ""],
+        ["이수구분", "영역", "학수번호", "교과목명", "학점", "성적"],
+        ["전공", "전공필수", "CSE2010", "자료 구조", "3", "A+"],
+        ["교양", "", "GEN1001", "글쓰기", "2", "F"],
+        ["재수강", "", "", "", "", ""],
+        ["3학년", "2학기", "", "", "", ""],
+        ["드볼", "사회와문화", "DRB3001", "경제학의 이해", "3", "B0"],
+    ]
+
+    def test_courses(self):
+        parsed = build_parsed_data(self.ROWS)
+        self.assertEqual(parsed["parser_version"], PARSER_VERSION)
+        self.assertEqual(parsed["raw_rows"], self.ROWS)
+        self.assertEqual(parsed["courses"], [
+            {"code": "CSE2010", "name": "자료 구조", "credit": 3, "grade": "A+", "type": "전공",
+             "major_field": "전공필수", "semester": "2021-1", "retake": False},
+            {"code": "GEN1001", "name": "글쓰기", "credit": 2, "grade": "F", "type": "교양",
+             "major_field": "", "semester": "2021-1", "retake": True},
+            {"code": "DRB3001", "name": "경제학의 이해", "credit": 3, "grade": "B0", "type": "드볼",
+             "major_field": "사회와문화", "semester": "3-2", "retake": False},
+        ])
+
+    def test_grade_read_as_letter_o(self):
+        courses = build_parsed_data([["CSE2010", "자료구조", "3", "AO"]])["courses"]
+        self.assertEqual(courses[0]["grade"], "A0")
+
+
+class OcrPagesProgressTests(SimpleTestCase):
+    @override_settings(OCR_POOL_PROCESSES=2, OCR_BATCH_SIZE=1)
+    def test_reports_pages_as_they_finish(self):
+        first_page = threading.Event()
+
+        def ocr_batch(paths, preprocess):
+            if paths == ["p0"]:  # 첫 페이지는 두 번째 페이지가 보고된 뒤에야 끝난다
+                first_page.wait(5)
+            return [([[p]], None, b"") for p in paths]
+
+        seen = []
+
+        def on_result(i, result):
+            seen.append(i)
+            first_page.set()
+
+        with ThreadPoolExecutor(2) as pool, mock.patch.object(ocr_pool, "get_pool", return_value=pool), \
+                mock.patch.object(ocr_pool, "_ocr_batch", ocr_batch):
+            results = ocr_pool.ocr_pages(["p0", "p1"], on_result=on_result)
+
+        self.assertEqual(seen, [1, 0])
+        self.assertEqual([r[0] for r in results], [[["p0"]], [["p1"]]])
+
+
+class TranscriptEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(student_id="C000001", username="C000001", full_name="홍길동")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @override_settings(TRANSCRIPT_UPLOAD_MAX_REQUEST_SIZE=1024)
+    def test_upload_request_too_large(self):
+        page = SimpleUploadedFile("page.png", b"\x89PNG" + b"0" * 4096, content_type="image/png")
+        r = self.client.post(f"/api/transcripts/{self.user.id}/", {"files": [page]}, format="multipart")
+        self.assertEqual(r.status_code, 413)
+        self.assertFalse(Transcript.objects.exists())
+
+    def test_upload_file_too_large(self):
+        page = SimpleUploadedFile("page.png", b"\x89PNG" + b"0" * 4096, content_type="image/png")
+        with tempfile.TemporaryDirectory() as tmp, override_settings(
+            TRANSCRIPT_UPLOAD_MAX_FILE_SIZE=1024, TRANSCRIPT_UPLOAD_TEMP_DIR=tmp,
+        ):
+            r = self.client.post(f"/api/transcripts/{self.user.id}/", {"files": [page]}, format="multipart")
+        self.assertEqual(r.status_code, 413)
+        self.assertFalse(Transcript.objects.exists())
+
+    def test_status_not_modified(self):
+        Transcript.objects.create(user=self.user, file="transcripts/x.png")
+        url = f"/api/transcripts/status/{self.user.id}/"
+        r = self.client.get(url)
+        self.assertEqual((r.status_code, r.data["status"]), (200, "pending"))
+
+        r = self.client.get(url, HTTP_IF_NONE_MATCH=r["ETag"])
+        self.assertEqual(r.status_code, 304)
+        self.assertIn("ETag", r)
+
+        r = self.client.get(url, HTTP_IF_NONE_MATCH='"other"')
+        self.assertEqual(r.status_code, 200)
+
+    def test_status_without_transcript(self):
+        self.assertEqual(self.client.get(f"/api/transcripts/status/{self.user.id}/").status_code, 404)
+
+    def wait_url(self, wait: float) -> str:
+        return f"/api/transcripts/status/{self.user.id}/wait/?wait={wait}"
+
+    def auth(self) -> dict:
+        return {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+
+    async def test_long_poll_returns_change(self):
+        transcript = await Transcript.objects.acreate(user=self.user, file="transcripts/x.png")
+        pages = [{"page": 1, "status": "pending"}]
+        state = progress.make_state(transcript, pages)
+        progress.publish(self.user.id, state)
+
+        async def finish_page():
+            await asyncio.sleep(0.2)
+            progress.publish(self.user.id, progress.make_state(transcript, [{"page": 1, "status": "done"}]))
+
+        _, r = await asyncio.gather(finish_page(), self.async_client.get(
+            self.wait_url(5), headers={**self.auth(), "If-None-Match": progress.etag(state)},
+        ))
+        self.assertEqual(r.status_code, 200)
+        self.assertNotEqual(r["ETag"], progress.etag(state))
+        self.assertEqual(r.json()["pages_done"], 1)
+
+    async def test_long_poll_times_out_unchanged(self):
+        transcript = await Transcript.objects.acreate(user=self.user, file="transcripts/x.png")
+        state = progress.make_state(transcript, [])
+        progress.publish(self.user.id, state)
+        r = await self.async_client.get(self.wait_url(0.1), headers={**self.auth(), "If-None-Match": progress.etag(state)})
+        self.assertEqual((r.status_code, r["ETag"]), (304, progress.etag(state)))
+
+    async def test_long_poll_requires_auth(self):
+        self.assertEqual((await self.async_client.get(self.wait_url(0))).status_code, 401)
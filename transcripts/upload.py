@@ -0,0 +1,110 @@
+# transcripts/upload.py
+"""
+성적표 업로드 스트리밍 처리
+
+- 업로드 파일은 메모리에 모으지 않고 청크 단위로 TRANSCRIPT_UPLOAD_TEMP_DIR 의 임시 파일에 바로 쓴다.
+  임시 디렉터리는 MEDIA_ROOT 와 같은 파일시스템에 두므로, 저장 시 복사 대신 rename 으로 페이지 위치로 옮겨진다.
+- 파일당 / 요청당 용량 제한(TRANSCRIPT_UPLOAD_MAX_FILE_SIZE / TRANSCRIPT_UPLOAD_MAX_REQUEST_SIZE)을
+  받는 도중에 검사해, 넘으면 쓰던 임시 파일을 지우고 즉시 중단한다.
+"""
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.http.multipartparser import MultiPartParser as DjangoMultiPartParser
+from django.http.multipartparser import MultiPartParserError
+from rest_framework import status
+from rest_framework.exceptions import APIException, ParseError
+from rest_framework.parsers import DataAndFiles, MultiPartParser
+
+DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024      # 10MB
+DEFAULT_MAX_REQUEST_SIZE = 50 * 1024 * 1024   # 50MB
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "업로드 용량 제한을 초과했습니다."
+    default_code = "upload_too_large"
+
+
+def max_file_size() -> int:
+    return getattr(settings, "TRANSCRIPT_UPLOAD_MAX_FILE_SIZE", DEFAULT_MAX_FILE_SIZE)
+
+
+def max_request_size() -> int:
+    return getattr(settings, "TRANSCRIPT_UPLOAD_MAX_REQUEST_SIZE", DEFAULT_MAX_REQUEST_SIZE)
+
+
+def upload_temp_dir() -> str | None:
+    """업로드 임시 디렉터리 (없으면 생성). 미설정 시 FILE_UPLOAD_TEMP_DIR / 시스템 기본값"""
+    temp_dir = getattr(settings, "TRANSCRIPT_UPLOAD_TEMP_DIR", None) or settings.FILE_UPLOAD_TEMP_DIR
+    if temp_dir:
+        os.makedirs(temp_dir, exist_ok=True)
+    return temp_dir
+
+
+class _UploadTempFile(TemporaryUploadedFile):
+    """upload_temp_dir() 에 만들어지는 TemporaryUploadedFile"""
+
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        _, ext = os.path.splitext(name)
+        file = tempfile.NamedTemporaryFile(suffix=".upload" + ext, dir=upload_temp_dir())
+        UploadedFile.__init__(self, file, name, content_type, size, charset, content_type_extra)
+
+
+def check_content_length(meta) -> None:
+    """본문을 읽기 전에 Content-Length 로 요청 크기 확인 (없거나 잘못된 값이면 스트리밍 중 검사에 맡김)"""
+    try:
+        length = int(meta.get("CONTENT_LENGTH") or 0)
+    except (TypeError, ValueError):
+        return
+    if length > max_request_size():
+        raise UploadTooLarge(f"요청 크기가 제한({max_request_size()} bytes)을 초과했습니다.")
+
+
+class LimitedTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    """청크를 임시 파일에 바로 쓰면서 파일당 / 요청당 누적 크기를 제한하는 업로드 핸들러"""
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.request_bytes = 0
+        self.file_bytes = 0
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        check_content_length(META)
+
+    def new_file(self, *args, **kwargs):
+        super(TemporaryFileUploadHandler, self).new_file(*args, **kwargs)
+        self.file = _UploadTempFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+        self.file_bytes = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file_bytes += len(raw_data)
+        self.request_bytes += len(raw_data)
+        if self.file_bytes > max_file_size():
+            self.upload_interrupted()
+            raise UploadTooLarge(f"'{self.file_name}' 파일이 제한({max_file_size()} bytes)을 초과했습니다.")
+        if self.request_bytes > max_request_size():
+            self.upload_interrupted()
+            raise UploadTooLarge(f"요청 크기가 제한({max_request_size()} bytes)을 초과했습니다.")
+        return super().receive_data_chunk(raw_data, start)
+
+
+class StreamingMultiPartParser(MultiPartParser):
+    """메모리 업로드 핸들러 없이 LimitedTemporaryFileUploadHandler 만 쓰는 multipart 파서"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        request = parser_context["request"]
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        meta = request.META.copy()
+        meta["CONTENT_TYPE"] = media_type
+
+        try:
+            parser = DjangoMultiPartParser(meta, stream, [LimitedTemporaryFileUploadHandler(request)], encoding)
+            data, files = parser.parse()
+            return DataAndFiles(data, files)
+        except MultiPartParserError as exc:
+            raise ParseError("Multipart form parse error - %s" % str(exc))
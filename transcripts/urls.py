@@ -2,6 +2,9 @@ from django.urls import path
 from .views import (
     TranscriptUploadView,
     TranscriptStatusView,
+    TranscriptStatusWaitView,
+    TranscriptEventsView,
+    TranscriptEventsTokenView,
     TranscriptParsedView
 )
 
@@ -10,6 +13,12 @@ urlpatterns = [
     path('<int:user_id>/', TranscriptUploadView.as_view(), name='transcript-upload'),
     # 2) GET    /api/transcripts/status/{user_id}/ -> OCR/파싱 상태 조회
     path('status/<int:user_id>/', TranscriptStatusView.as_view(), name='transcript-status'),
+    #    GET    /api/transcripts/status/{user_id}/wait/ -> 상태가 바뀔 때까지 대기(long-poll, ?wait=초)
+    path('status/<int:user_id>/wait/', TranscriptStatusWaitView.as_view(), name='transcript-status-wait'),
+    #    GET    /api/transcripts/events/{user_id}/ -> 진행 상태 SSE 스트림
+    path('events/<int:user_id>/', TranscriptEventsView.as_view(), name='transcript-events'),
+    #    POST   /api/transcripts/events/token/{user_id}/ -> SSE 연결용 단기 토큰 (?token=)
+    path('events/token/<int:user_id>/', TranscriptEventsTokenView.as_view(), name='transcript-events-token'),
     # 3) GET    /api/transcripts/parsed/{user_id}/ -> 파싱 결과 조회
     path('parsed/<int:user_id>/', TranscriptParsedView.as_view(), name='transcript-parsed'),
 ]
\ No newline at end of file
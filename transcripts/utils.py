@@ -1,15 +1,27 @@
 # utils.py
-from .custom_paddle_ocr_script import ocr_single_table_term_code_grade_retake
-import tempfile
+from django.conf import settings
 
-def parse_single_table_with_paddle(image_input) -> list[list[str]]:
+from . import ocr_pool
+
+
+def _to_path(image_input) -> str:
+    """
+    OCR 워커에 넘길 로컬 파일 경로.
+    업로드 파일은 저장소에 스트리밍 저장된 뒤 그 경로를 그대로 읽으므로 임시 복사본을 만들지 않는다.
+    """
     if isinstance(image_input, str):
-        path = image_input
-    elif hasattr(image_input, "path"):             # FileField/TemporaryUploadedFile
-        path = image_input.path
-    else:                                          # InMemoryUploadedFile 등
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
-            image_input.seek(0)
-            tmp.write(image_input.read())
-            path = tmp.name
-    return ocr_single_table_term_code_grade_retake(path)
\ No newline at end of file
+        return image_input
+    if hasattr(image_input, "path"):               # FieldFile
+        return image_input.path
+    if hasattr(image_input, "temporary_file_path"):  # TemporaryUploadedFile
+        return image_input.temporary_file_path()
+    raise ValueError("로컬 파일 경로가 없는 입력은 OCR 할 수 없습니다.")
+
+
+def parse_pages_with_paddle(image_inputs, on_result=None) -> list[tuple]:
+    """여러 페이지 병렬 OCR. 입력 순서대로 (rows, error, 원본 결과) 반환 (on_result: 페이지별 완료 콜백)"""
+    return ocr_pool.ocr_pages(
+        [_to_path(i) for i in image_inputs],
+        max_in_flight=getattr(settings, "OCR_MAX_PAGES_IN_FLIGHT", None),
+        on_result=on_result,
+    )
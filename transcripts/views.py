@@ -1,11 +1,27 @@
 # transcripts/views.py
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.http import parse_etags
+from django.views import View
 from rest_framework.views import APIView
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.parsers import FormParser
 from rest_framework.response import Response
 from rest_framework import status, permissions
 from django.shortcuts import get_object_or_404
 
 from .models import Transcript
+from .parser import build_parsed_data, needs_reparse, raw_rows
+from .tasks import process_transcript  # OCR 모델은 워커 풀에서만 로드되므로 웹 프로세스 import 는 가볍다
+from .upload import StreamingMultiPartParser, UploadTooLarge, check_content_length
+from . import progress
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
 from .serializers import (
     TranscriptUploadSerializer,
     TranscriptStatusSerializer,
@@ -20,19 +36,20 @@ def _rows_to_tsv(rows: list[list[str]]) -> str:
 
 class TranscriptUploadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [StreamingMultiPartParser, FormParser]  # 파일은 청크 단위로 디스크에 바로 기록
 
     def post(self, request, user_id):
         if request.user.id != user_id:
             return Response(status=status.HTTP_401_UNAUTHORIZED)
 
-        # ✅ 여기서만 import (지연 임포트)
+        # 본문을 읽기 전에 크기 제한 확인, 스트리밍 중 초과도 같은 413 응답
         try:
-            from .tasks import process_transcript
-        except Exception as e:
-            return Response({"error": f"OCR 모듈 로드 실패: {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            check_content_length(request.META)
+            has_files = 'files' in request.data
+        except UploadTooLarge as e:
+            return Response({"error": str(e.detail)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
 
-        if 'files' not in request.data:
+        if not has_files:
             return Response({"error": "파일이 전송되지 않았습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         serializer = TranscriptUploadSerializer(
@@ -41,13 +58,70 @@ class TranscriptUploadView(APIView):
         )
         if serializer.is_valid():
             transcript = serializer.save()
+            progress.reset(user_id)
             # Celery 비동기 실행
             process_transcript.delay(transcript.id)
             return Response({"message": "업로드 완료", "status": "processing"}, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+# ---------------------------
+# 진행 상태: 조회(ETag) / long-poll / SSE
+# ---------------------------
+POLL_INTERVAL = 0.5  # 초 — 캐시만 읽으므로 짧게
+EVENTS_TOKEN_SALT = "transcripts.events"  # SSE 전용 토큰 (JWT 로는 쓸 수 없고, JWT 도 이 용도로 받지 않음)
+
+
+def _matches(state: dict, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    tags = parse_etags(if_none_match)
+    return "*" in tags or progress.etag(state) in tags
+
+
+def _status_body(state: dict) -> dict:
+    """상태 (소문자) + 페이지 진행률"""
+    return {
+        "status": state["status"],
+        "pages_total": state["pages_total"],
+        "pages_done": state["pages_done"],
+        "pages_failed": state["pages_failed"],
+    }
+
+
+async def _authenticate(request) -> int | None:
+    """
+    비동기 뷰(long-poll / SSE) 인증 — 인증된 사용자 id (실패 시 None).
+    Authorization 헤더(JWT) 또는 ?token= 으로 TranscriptEventsTokenView 가 발급한 단기 전용 토큰.
+    """
+    auth = JWTAuthentication()
+    header = auth.get_header(request)
+    if header is None:
+        try:
+            payload = signing.loads(
+                request.GET.get("token", ""),
+                salt=EVENTS_TOKEN_SALT,
+                max_age=getattr(settings, "TRANSCRIPT_EVENTS_TOKEN_MAX_AGE", 60),
+            )
+        except signing.BadSignature:  # 만료(SignatureExpired) 포함
+            return None
+        return payload.get("user_id")
+
+    raw = auth.get_raw_token(header)
+    if raw is None:
+        return None
+    try:
+        user = await sync_to_async(auth.get_user)(auth.get_validated_token(raw))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+    return user.id
+
+
 class TranscriptStatusView(APIView):
+    """
+    최신 성적표 처리 상태.
+    If-None-Match 가 현재 ETag 와 같으면 304 (바로 응답 — 동기 워커를 붙잡지 않도록 대기는 TranscriptStatusWaitView / SSE 에서).
+    """
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, user_id):
@@ -58,23 +132,117 @@ class TranscriptStatusView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        # 2) 최신 업로드 한 건만 조회
-        transcript = (
-            Transcript.objects
-            .filter(user_id=user_id)
-            .order_by('-created_at')
-            .first()
-        )
-        if not transcript:
+        if_none_match = request.headers.get("If-None-Match")
+
+        # 2) 최신 업로드 한 건의 진행 상태 (캐시 우선)
+        state = progress.get_state(user_id)
+
+        if not state:
             return Response(
                 {"error": "해당 성적표가 존재하지 않습니다."},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # 3) 상태 반환 (소문자)
+        headers = {"ETag": progress.etag(state), "Cache-Control": "no-cache"}
+        if _matches(state, if_none_match):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # 3) 상태 반환 (소문자) + 페이지 진행률
+        return Response(_status_body(state), status=status.HTTP_200_OK, headers=headers)
+
+
+class TranscriptStatusWaitView(View):
+    """
+    처리 상태 long-poll (SSE 를 쓸 수 없는 클라이언트용 — ASGI 에서 이벤트 루프로 대기하므로 워커를 붙잡지 않음).
+    If-None-Match 가 현재 ETag 와 같으면 상태가 바뀔 때까지 ?wait=초(기본·최대 TRANSCRIPT_STATUS_MAX_WAIT) 기다린다.
+    바뀌면 200 + 새 ETag, 끝까지 그대로면 304. 인증은 SSE 와 같다 (Authorization 헤더 JWT 또는 ?token=).
+    """
+
+    async def get(self, request, user_id):
+        if await _authenticate(request) != user_id:
+            return JsonResponse({"error": "인증이 필요합니다."}, status=401)
+
+        max_wait = getattr(settings, "TRANSCRIPT_STATUS_MAX_WAIT", 25)
+        try:
+            wait = max(0.0, min(float(request.GET.get("wait", max_wait)), max_wait))
+        except ValueError:
+            wait = max_wait
+        if_none_match = request.headers.get("If-None-Match")
+
+        deadline = time.monotonic() + wait
+        state = await sync_to_async(progress.get_state)(user_id)
+        while state is not None and _matches(state, if_none_match) and time.monotonic() < deadline:
+            await asyncio.sleep(POLL_INTERVAL)
+            state = await sync_to_async(progress.get_state)(user_id)
+
+        if state is None:
+            return JsonResponse({"error": "해당 성적표가 존재하지 않습니다."}, status=404)
+
+        if _matches(state, if_none_match):
+            response = HttpResponse(status=304)
+        else:
+            response = JsonResponse(_status_body(state), json_dumps_params={"ensure_ascii": False})
+        response["ETag"] = progress.etag(state)
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
+class TranscriptEventsView(View):
+    """
+    진행 상태 Server-Sent Events 스트림 (ASGI 로 서빙할 때 이벤트 루프 하나로 연결 다수 처리).
+    상태가 바뀔 때마다 `event: progress` 를 보내고, done / error 에 도달하면 `event: end` 후 종료.
+    EventSource 는 헤더를 못 붙이므로 Authorization 헤더(JWT) 또는
+    ?token= 으로 TranscriptEventsTokenView 가 발급한 단기 전용 토큰을 받는다 (JWT 를 URL 에 싣지 않음).
+    토큰이 만료된 뒤의 재연결은 401 → 클라이언트가 토큰을 새로 받아 다시 연결한다.
+    """
+
+    async def get(self, request, user_id):
+        if await _authenticate(request) != user_id:
+            return JsonResponse({"error": "인증이 필요합니다."}, status=401)
+
+        response = StreamingHttpResponse(self._stream(user_id), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # nginx 버퍼링 해제
+        return response
+
+    @staticmethod
+    async def _stream(user_id):
+        deadline = time.monotonic() + getattr(settings, "TRANSCRIPT_EVENTS_MAX_DURATION", 300)
+        heartbeat = getattr(settings, "TRANSCRIPT_EVENTS_HEARTBEAT", 15)
+        last_tag, last_sent = None, time.monotonic()
+        yield "retry: 3000\n\n"
+
+        while time.monotonic() < deadline:
+            state = await sync_to_async(progress.get_state)(user_id)
+            if state is None:
+                yield "event: end\ndata: {}\n\n"
+                return
+
+            tag = progress.etag(state)
+            if tag != last_tag:
+                last_tag, last_sent = tag, time.monotonic()
+                yield f"event: progress\nid: {tag}\ndata: {json.dumps(state, ensure_ascii=False)}\n\n"
+                if state["status"] in progress.TERMINAL_STATUSES:
+                    yield "event: end\ndata: {}\n\n"
+                    return
+            elif time.monotonic() - last_sent >= heartbeat:
+                last_sent = time.monotonic()
+                yield ": keep-alive\n\n"
+
+            await asyncio.sleep(POLL_INTERVAL)
+
+
+class TranscriptEventsTokenView(APIView):
+    """SSE 연결용 단기 토큰 발급 (TRANSCRIPT_EVENTS_TOKEN_MAX_AGE 초 안에 연결해야 함)"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, user_id):
+        if request.user.id != user_id:
+            return Response({"error": "인증이 필요합니다."}, status=status.HTTP_401_UNAUTHORIZED)
+        token = signing.dumps({"user_id": user_id}, salt=EVENTS_TOKEN_SALT)
         return Response(
-            {"status": transcript.status.lower()},
-            status=status.HTTP_200_OK
+            {"token": token, "expires_in": getattr(settings, "TRANSCRIPT_EVENTS_TOKEN_MAX_AGE", 60)},
+            status=status.HTTP_200_OK,
         )
 
 
@@ -103,19 +271,15 @@ class TranscriptParsedView(APIView):
                 status=status.HTTP_404_NOT_FOUND  # 명세에 따라 404 유지
             )
 
-        # 파싱된 JSON 데이터를 그대로 반환
-        # 파싱된 JSON 데이터를 그대로 반환  ← 이 부분을 전부 교체
         data = transcript.parsed_data
 
-        # 새 파이프라인: 2차원 rows로 저장된 경우 → 학기별 블록 텍스트로 반환
-        if isinstance(data, list) and data and isinstance(data[0], list):
-            return HttpResponse(rows_to_text(data, group_by_term=True),
-                                content_type="text/plain; charset=utf-8")
+        # 파서 도입 전 성적표: OCR 행만 저장돼 있으면 응답용으로만 파싱 (저장은 reparse_transcripts)
+        if needs_reparse(data):
+            data = build_parsed_data(raw_rows(data))
 
-        # 이미 문자열이면 그대로 반환
-        if isinstance(data, str):
-            return HttpResponse(data, content_type="text/plain; charset=utf-8")
+        # ?raw=1 → OCR 원본 행을 탭 구분 텍스트로 (?format 은 DRF 가 렌더러 선택에 사용)
+        if request.query_params.get("raw") == "1":
+            return HttpResponse(_rows_to_tsv(raw_rows(data) or []), content_type="text/plain; charset=utf-8")
 
-        # 그 외(예: 과거 포맷 등)는 JSON 그대로 반환
+        # 과목 레코드 + 파서 버전 (과거 포맷은 그대로)
         return Response(data, status=status.HTTP_200_OK)
-        # ----- 교체 끝 -----
\ No newline at end of file
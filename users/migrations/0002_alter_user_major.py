@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='major',
+            field=models.CharField(blank=True, db_index=True, max_length=100),
+        ),
+    ]
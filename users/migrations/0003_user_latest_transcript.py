@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_latest_transcript(apps, schema_editor):
+    """기존 사용자: 처리 완료(done)된 가장 최근 성적표로 포인터 채우기"""
+    User = apps.get_model('users', 'User')
+    Transcript = apps.get_model('transcripts', 'Transcript')
+    latest = (
+        Transcript.objects
+        .filter(user_id=OuterRef('pk'), status='done')
+        .order_by('-created_at')
+        .values('pk')[:1]
+    )
+    User.objects.update(latest_transcript_id=Subquery(latest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcripts', '0006_transcript_transcript_user_created_idx'),
+        ('users', '0002_alter_user_major'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='latest_transcript',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='transcripts.transcript'),
+        ),
+        migrations.RunPython(backfill_latest_transcript, migrations.RunPython.noop),
+    ]
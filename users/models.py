@@ -26,7 +26,14 @@ class User(AbstractUser):
         ]
     )
     current_year  = models.PositiveSmallIntegerField(null=True, blank=True)
-    major = models.CharField(max_length=100, blank=True)
+    major = models.CharField(max_length=100, blank=True, db_index=True)  # 전공별 일괄 감사 / 요건 변경 시 대상 조회
+    # 처리가 끝난(done) 가장 최근 성적표 — process_transcript 가 갱신. 분석/학기 조회는 이 포인터로 바로 찾는다
+    latest_transcript = models.ForeignKey(
+        'transcripts.Transcript',
+        on_delete=models.SET_NULL,
+        null=True, blank=True,
+        related_name='+',
+    )
 
     USERNAME_FIELD = 'student_id'
     REQUIRED_FIELDS = ['full_name']